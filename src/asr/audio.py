@@ -0,0 +1,111 @@
+"""
+Audio Loading
+Decode audio once to 16 kHz mono float32, probe durations, render previews
+"""
+import os
+import logging
+import threading
+from pathlib import Path
+
+import numpy as np
+
+from utils.lazy import lazy_import
+
+# Heavy decoders are imported on first use (see utils.lazy)
+ffmpeg = lazy_import("ffmpeg")
+sf = lazy_import("soundfile")
+whisper = lazy_import("whisper")
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Whisper operates on 16 kHz mono audio
+SAMPLE_RATE = 16000
+
+
+def load_audio(audio_path: str) -> np.ndarray:
+    """
+    Decode an audio file to 16 kHz mono float32 samples
+
+    This is the only place audio is decoded for transcription: the array
+    is passed straight to model.transcribe and reused for the duration
+    and any other processing, instead of each step decoding the file.
+
+    Args:
+        audio_path: Path to audio file (any format ffmpeg reads)
+
+    Returns:
+        Samples in [-1, 1]
+    """
+    return whisper.load_audio(audio_path, sr=SAMPLE_RATE)
+
+
+def audio_duration(audio: np.ndarray) -> float:
+    """Duration in seconds of decoded 16 kHz samples"""
+    return len(audio) / SAMPLE_RATE
+
+
+def probe_duration(audio_path: str) -> float:
+    """
+    Duration in seconds read from the file header, without decoding
+
+    WAV/FLAC/OGG headers are read with soundfile; other containers
+    (m4a, mp3, ...) are probed with ffprobe. Only if both fail is the
+    file decoded.
+
+    Args:
+        audio_path: Path to audio file
+
+    Returns:
+        Duration in seconds
+    """
+    try:
+        return sf.info(audio_path).duration
+    except Exception:
+        pass
+
+    try:
+        return float(ffmpeg.probe(audio_path)["format"]["duration"])
+    except Exception as e:
+        logger.warning(f"Could not probe duration of {audio_path} ({e}), decoding instead")
+
+    return audio_duration(load_audio(audio_path))
+
+
+def render_preview(audio_path: str, preview_path: str, bitrate: str = "48k") -> str:
+    """
+    Encode a small mono MP3 copy of an audio file for playback
+
+    Lecture WAVs are hundreds of MB; a 48 kbps mono preview is a few MB
+    per hour, so seeking in the annotation UI transfers little data. The
+    preview is written atomically and reused while newer than its source.
+
+    Args:
+        audio_path: Source audio file
+        preview_path: Where to write the preview
+        bitrate: MP3 bitrate
+
+    Returns:
+        preview_path
+    """
+    preview = Path(preview_path)
+    if preview.exists() and preview.stat().st_mtime_ns >= os.stat(audio_path).st_mtime_ns:
+        return str(preview)
+
+    preview.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = preview.with_name(f".{preview.name}.{os.getpid()}.{threading.get_ident()}.tmp.mp3")
+    try:
+        (
+            ffmpeg
+            .input(str(audio_path))
+            .output(str(tmp_path), ac=1, ar=22050, audio_bitrate=bitrate)
+            .overwrite_output()
+            .run(quiet=True)
+        )
+        os.replace(tmp_path, preview)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+    logger.info(f"Rendered preview {preview.name}")
+    return str(preview)
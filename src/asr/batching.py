@@ -0,0 +1,119 @@
+"""
+Batched Decoding Helpers
+Pack 30 s windows from several recordings into shared Whisper decoding batches
+"""
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from .vad import SpeechTimeline
+
+# Whisper timestamp tokens are 20 ms apart
+TIMESTAMP_SECONDS = 0.02
+
+
+@dataclass
+class BatchFile:
+    """A recording whose windows are spread over one or more batches"""
+    index: int
+    audio_path: str
+    duration: float = 0.0
+    windows: List["BatchWindow"] = field(default_factory=list)
+    timeline: Optional[SpeechTimeline] = None
+    cache_key: Optional[str] = None
+    cached: Optional[Dict] = None
+    error: Optional[Exception] = None
+    remaining: int = 0
+
+
+@dataclass
+class BatchWindow:
+    """One <= 30 s window of a recording, with its log-mel spectrogram"""
+    file: BatchFile
+    offset: float
+    seconds: float
+    frames: int
+    mel: Any
+    result: Any = None
+    segments: List[Dict] = field(default_factory=list)
+
+
+def segments_from_tokens(
+    tokens: Sequence[int],
+    timestamp_begin: int,
+    window_seconds: float,
+    decode: Callable[[List[int]], str]
+) -> List[Dict]:
+    """
+    Split one window's decoded tokens into segments
+
+    Whisper brackets each segment with timestamp tokens, e.g.
+    <|0.00|> text <|2.40|><|2.40|> more text <|5.00|>. Text after the last
+    timestamp (a segment cut off by the end of the window) runs to the
+    window end; a window decoded without timestamps is one segment.
+
+    Args:
+        tokens: Decoded tokens, without start/end-of-transcript tokens
+        timestamp_begin: Token id of <|0.00|>
+        window_seconds: Length of the window's audio
+        decode: Tokenizer decode for text tokens
+
+    Returns:
+        [{"start", "end", "text", "tokens"}] with window-relative times
+    """
+    segments = []
+    start = 0.0
+    text_tokens: List[int] = []
+
+    def close(end: float):
+        segments.append({
+            "seek": 0,
+            "start": start,
+            "end": max(start, min(end, window_seconds)),
+            "text": decode(text_tokens),
+            "tokens": list(text_tokens)
+        })
+
+    for token in tokens:
+        if token >= timestamp_begin:
+            time = (token - timestamp_begin) * TIMESTAMP_SECONDS
+            if text_tokens:
+                close(time)
+                text_tokens = []
+            start = min(time, window_seconds)
+        else:
+            text_tokens.append(token)
+
+    if text_tokens:
+        close(window_seconds)
+
+    return [segment for segment in segments if segment["text"].strip()]
+
+
+def needs_fallback(
+    result: Any,
+    compression_ratio_threshold: Optional[float] = 2.4,
+    logprob_threshold: Optional[float] = -1.0,
+    no_speech_threshold: Optional[float] = 0.6
+) -> bool:
+    """
+    Whether a window should be re-decoded at the next temperature
+
+    Same rule as whisper.transcribe: repetitive (highly compressible) or
+    low-confidence output is retried, unless the window is likely silence.
+    """
+    if no_speech_threshold is not None and result.no_speech_prob > no_speech_threshold:
+        return False
+    if compression_ratio_threshold is not None and result.compression_ratio > compression_ratio_threshold:
+        return True
+    return logprob_threshold is not None and result.avg_logprob < logprob_threshold
+
+
+def is_silent(
+    result: Any,
+    logprob_threshold: Optional[float] = -1.0,
+    no_speech_threshold: Optional[float] = 0.6
+) -> bool:
+    """Whether a decoded window is silence (its text is discarded, like whisper.transcribe)"""
+    if no_speech_threshold is None or result.no_speech_prob <= no_speech_threshold:
+        return False
+    return logprob_threshold is None or result.avg_logprob < logprob_threshold
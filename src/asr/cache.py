@@ -0,0 +1,166 @@
+"""
+Persistent Transcription Cache
+Content-addressed on-disk cache for Whisper transcription results
+"""
+import os
+import json
+import hashlib
+import logging
+import threading
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+from typing import Dict, Optional
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Read audio in 1 MB blocks when hashing
+HASH_BLOCK_SIZE = 1024 * 1024
+
+
+def _json_default(value):
+    """Serialize read-only views (e.g. a Transcript and its Segments) one item at a time"""
+    if isinstance(value, Mapping):
+        return dict(value)
+    if isinstance(value, Sequence):
+        return list(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class TranscriptionCache:
+    """
+    Disk cache of transcription results keyed by audio content and options
+
+    Keys are a SHA-256 over the audio bytes, the model size and every
+    decoding option, so re-uploading the same recording or re-running the
+    same request is a cache hit regardless of the file name. Entries are
+    JSON files; when the cache grows past max_bytes the least recently
+    used entries (by modification time, refreshed on every hit) are removed.
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int = 2 * 1024 ** 3):
+        """
+        Initialize cache
+
+        Args:
+            cache_dir: Directory holding cache entries
+            max_bytes: Size bound for all entries (LRU eviction beyond it)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+        # Audio digests memoized by (path, size, mtime) to avoid re-hashing
+        self._digests: Dict[tuple, str] = {}
+
+    def audio_digest(self, audio_path: str) -> str:
+        """SHA-256 of the audio file contents"""
+        stat = os.stat(audio_path)
+        memo_key = (os.path.abspath(audio_path), stat.st_size, stat.st_mtime_ns)
+
+        digest = self._digests.get(memo_key)
+        if digest is None:
+            sha = hashlib.sha256()
+            with open(audio_path, 'rb') as f:
+                for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b''):
+                    sha.update(block)
+            digest = sha.hexdigest()
+            self._digests[memo_key] = digest
+
+        return digest
+
+    def make_key(self, audio_path: str, model_size: str, options: Dict) -> str:
+        """
+        Build the cache key for a transcription request
+
+        Args:
+            audio_path: Path to audio file
+            model_size: Whisper model size
+            options: Every decoding option passed to Whisper
+
+        Returns:
+            Hex digest identifying the request
+        """
+        params = json.dumps(
+            {"model": model_size, "options": options},
+            sort_keys=True,
+            default=str
+        )
+        sha = hashlib.sha256()
+        sha.update(self.audio_digest(audio_path).encode('ascii'))
+        sha.update(params.encode('utf-8'))
+        return sha.hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def contains(self, key: str) -> bool:
+        """Check for an entry without reading it"""
+        return self._entry_path(key).exists()
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Return the cached result for key, or None on a miss"""
+        path = self._entry_path(key)
+
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                result = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"[Cache] Dropping unreadable entry {path.name}: {e}")
+            path.unlink(missing_ok=True)
+            return None
+
+        # Mark as recently used for LRU eviction
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+        return result
+
+    def put(self, key: str, result: Dict):
+        """
+        Store a result and evict old entries if over the size bound
+
+        Values may be Mapping/Sequence views instead of dicts and lists
+        (e.g. "segments" a Transcript); each is converted only when written.
+        """
+        path = self._entry_path(key)
+        tmp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(result, f, ensure_ascii=False, default=_json_default)
+        os.replace(tmp_path, path)
+
+        self._evict()
+
+    def _evict(self):
+        """Delete least recently used entries until under max_bytes"""
+        with self._lock:
+            entries = []
+            total = 0
+            for path in self.cache_dir.glob("*.json"):
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+                total += stat.st_size
+
+            entries.sort()
+            for _, size, path in entries:
+                if total <= self.max_bytes:
+                    break
+                path.unlink(missing_ok=True)
+                total -= size
+                logger.info(f"[Cache] Evicted {path.name}")
+
+    def clear(self):
+        """Remove every cache entry"""
+        with self._lock:
+            for path in self.cache_dir.glob("*.json"):
+                path.unlink(missing_ok=True)
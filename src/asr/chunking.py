@@ -0,0 +1,134 @@
+"""
+Audio Chunking Utilities
+Split long lectures into windows at quiet points for incremental decoding
+"""
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from .audio import SAMPLE_RATE
+
+# Frame length used for energy measurements (20 ms)
+FRAME_SECONDS = 0.02
+
+
+def frame_energy(audio: np.ndarray, frame_seconds: float = FRAME_SECONDS) -> np.ndarray:
+    """
+    RMS energy per frame
+
+    Args:
+        audio: 16 kHz mono float32 samples
+        frame_seconds: Frame length in seconds
+
+    Returns:
+        One RMS value per full frame
+    """
+    frame_length = int(SAMPLE_RATE * frame_seconds)
+    frame_count = len(audio) // frame_length
+    if frame_count == 0:
+        return np.zeros(0, dtype=np.float32)
+
+    frames = audio[:frame_count * frame_length].reshape(frame_count, frame_length)
+    return np.sqrt(np.mean(np.square(frames, dtype=np.float32), axis=1))
+
+
+def find_split_points(
+    audio: np.ndarray,
+    target_seconds: float = 30.0,
+    search_seconds: float = 5.0
+) -> List[int]:
+    """
+    Sample offsets that cut audio into windows of at most target_seconds
+
+    Each cut is placed at the quietest frame within the last
+    search_seconds of its window, so cuts fall in pauses rather than
+    through words.
+
+    Args:
+        audio: 16 kHz mono float32 samples
+        target_seconds: Maximum window length
+        search_seconds: How far back from the window end to look for a pause
+
+    Returns:
+        Sorted sample offsets of the cuts (excluding 0 and len(audio))
+    """
+    frame_length = int(SAMPLE_RATE * FRAME_SECONDS)
+    energy = frame_energy(audio)
+    target_frames = int(target_seconds / FRAME_SECONDS)
+    search_frames = max(1, int(search_seconds / FRAME_SECONDS))
+
+    cuts = []
+    position = 0  # in frames
+    while len(audio) - position * frame_length > target_seconds * SAMPLE_RATE:
+        window_end = position + target_frames
+        search_start = max(position + 1, window_end - search_frames)
+        quietest = search_start + int(np.argmin(energy[search_start:window_end]))
+        cuts.append(quietest * frame_length)
+        position = quietest
+
+    return cuts
+
+
+def split_windows(
+    audio: np.ndarray,
+    target_seconds: float = 30.0,
+    search_seconds: float = 5.0
+) -> List[Tuple[int, int]]:
+    """(start, end) sample ranges covering audio, cut at quiet points"""
+    bounds = [0] + find_split_points(audio, target_seconds, search_seconds) + [len(audio)]
+    return list(zip(bounds, bounds[1:]))
+
+
+def pad_windows(
+    windows: List[Tuple[int, int]],
+    overlap_seconds: float,
+    total_samples: int
+) -> List[Tuple[int, int]]:
+    """Widen each window by overlap_seconds on both sides (clipped to the audio)"""
+    overlap = int(overlap_seconds * SAMPLE_RATE)
+    return [(max(0, start - overlap), min(total_samples, end + overlap)) for start, end in windows]
+
+
+def trim_segments(segments: List[Dict], core_start: float, core_end: float) -> List[Dict]:
+    """
+    Keep only the parts of a chunk's segments that belong to its core region
+
+    Overlapping chunks transcribe the same boundary words twice. Each word
+    is owned by the chunk whose core [core_start, core_end) contains the
+    word's midpoint, so stitching the trimmed chunks in order yields every
+    word exactly once. Segments without word timestamps are kept or
+    dropped as a whole by their own midpoint.
+
+    Args:
+        segments: Segments with global timestamps
+        core_start: Start of the chunk's own region in seconds
+        core_end: End of the chunk's own region in seconds
+
+    Returns:
+        Trimmed segments
+    """
+    def owned(start: float, end: float) -> bool:
+        return core_start <= (start + end) / 2 < core_end
+
+    trimmed = []
+    for segment in segments:
+        words = segment.get("words") or []
+        if not words:
+            if owned(segment["start"], segment["end"]):
+                trimmed.append(segment)
+            continue
+
+        kept = [word for word in words if owned(word["start"], word["end"])]
+        if not kept:
+            continue
+        if len(kept) != len(words):
+            segment = dict(
+                segment,
+                start=kept[0]["start"],
+                end=kept[-1]["end"],
+                text=" ".join(word["word"] for word in kept),
+                words=kept
+            )
+        trimmed.append(segment)
+
+    return trimmed
@@ -0,0 +1,123 @@
+"""
+Parallel Chunked Transcription
+Transcribes long recordings on CPU across a pool of worker processes
+"""
+import os
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, Future
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from utils.lazy import lazy_import
+
+from .quantization import load_quantized_model
+
+torch = lazy_import("torch")
+whisper = lazy_import("whisper")
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Model loaded once per worker process by _init_worker
+_worker_model = None
+
+
+def _init_worker(model_size: str, threads: int, quantize: Optional[str], quantized_dir: Optional[str]):
+    """Load a private CPU model copy in each worker process"""
+    global _worker_model
+    torch.set_num_threads(threads)
+    if quantize:
+        _worker_model = load_quantized_model(model_size, quantized_dir)
+    else:
+        _worker_model = whisper.load_model(model_size, device="cpu")
+
+
+def _transcribe_chunk(audio: np.ndarray, decode_options: Dict) -> Dict:
+    """Transcribe one chunk in a worker (timestamps relative to the chunk)"""
+    result = _worker_model.transcribe(audio, **decode_options)
+
+    # Only ship back what the parent needs
+    return {
+        "language": result.get("language"),
+        "segments": [
+            {
+                "start": seg["start"],
+                "end": seg["end"],
+                "text": seg["text"],
+                "words": [
+                    {
+                        "word": word.get("word", ""),
+                        "start": word.get("start", 0),
+                        "end": word.get("end", 0),
+                        "probability": word.get("probability", 1.0)
+                    }
+                    for word in seg.get("words") or []
+                ]
+            }
+            for seg in result.get("segments", [])
+        ]
+    }
+
+
+class ParallelTranscriber:
+    """
+    Pool of worker processes, each holding its own CPU Whisper model
+
+    PyTorch CPU inference on one long file leaves most cores of a large
+    machine idle. Chunks of the file are instead transcribed independently
+    in separate processes, with the machine's threads split between them.
+    Workers use the 'spawn' start method so no OpenMP or lock state is
+    inherited from the (threaded) parent.
+    """
+
+    def __init__(
+        self,
+        model_size: str,
+        workers: Optional[int] = None,
+        quantize: Optional[str] = None,
+        quantized_dir: Optional[str] = None
+    ):
+        """
+        Initialize worker pool (models load in the background)
+
+        Args:
+            model_size: Whisper model size loaded by every worker
+            workers: Number of worker processes (default: CPU count)
+            quantize: 'int8' to load quantized models (see asr.quantization)
+            quantized_dir: Cache directory for quantized checkpoints
+        """
+        cpu_count = os.cpu_count() or 1
+        self.model_size = model_size
+        self.workers = workers or cpu_count
+        threads = max(1, cpu_count // self.workers)
+
+        logger.info(
+            f"[Parallel] Starting {self.workers} workers ({threads} threads each) "
+            f"with Whisper {model_size}"
+        )
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(model_size, threads, quantize, quantized_dir)
+        )
+
+    def submit(self, audio: np.ndarray, decode_options: Dict) -> Future:
+        """Queue one chunk; the future resolves to {"language", "segments"}"""
+        return self._pool.submit(_transcribe_chunk, audio, decode_options)
+
+    def map_chunks(
+        self,
+        audio: np.ndarray,
+        windows: List[Tuple[int, int]],
+        decode_options: Dict
+    ) -> List[Future]:
+        """Queue every (start, end) sample range of audio, in order"""
+        return [self.submit(audio[start:end], decode_options) for start, end in windows]
+
+    def shutdown(self):
+        """Stop the worker processes"""
+        self._pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,146 @@
+"""
+PCM Audio Store
+Uploaded audio transcoded once to raw 16 kHz PCM and opened with numpy.memmap
+"""
+import os
+import struct
+import hashlib
+import logging
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+from .audio import SAMPLE_RATE, load_audio
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Header: magic, version, sample rate, channels, sample count, then the
+# source file's size and mtime when it was decoded (64 bytes, padded)
+_MAGIC = b"PLXPCM"
+_VERSION = 2
+_HEADER = struct.Struct("<6sHIIQQq")
+HEADER_SIZE = 64
+
+
+class PCMStore:
+    """
+    Canonical decoded copies of audio files
+
+    Each source file is decoded once into <name>-<path hash>.pcm: a
+    64-byte header followed by 16 kHz mono float32 samples. Opening it is
+    a numpy.memmap, so repeat transcriptions skip ffmpeg entirely, slicing
+    a time range touches only those pages, and the samples are handed to
+    Whisper without a copy. The header records the source's size and
+    mtime; a copy that no longer matches its source is re-created.
+    """
+
+    def __init__(self, store_dir: str):
+        """
+        Initialize store
+
+        Args:
+            store_dir: Directory holding the .pcm files
+        """
+        self.store_dir = Path(store_dir)
+        self.store_dir.mkdir(parents=True, exist_ok=True)
+
+    def path_for(self, audio_path: str) -> Path:
+        """Location of the PCM copy of an audio file (files sharing a name get separate copies)"""
+        path = Path(audio_path).resolve()
+        digest = hashlib.sha256(str(path).encode("utf-8")).hexdigest()[:16]
+        return self.store_dir / f"{path.name}-{digest}.pcm"
+
+    def _read_header(self, audio_path: str, pcm_path: Path) -> Optional[int]:
+        """
+        Sample count from a PCM header
+
+        Returns:
+            None if there is no valid copy, or it was decoded from a
+            different version of the source (size or mtime changed)
+        """
+        try:
+            source = os.stat(audio_path)
+            with open(pcm_path, "rb") as f:
+                header = f.read(HEADER_SIZE)
+        except FileNotFoundError:
+            return None
+        if len(header) < HEADER_SIZE:
+            return None
+
+        magic, version, sample_rate, channels, samples, size, mtime_ns = _HEADER.unpack_from(header)
+        if magic != _MAGIC or version != _VERSION or sample_rate != SAMPLE_RATE or channels != 1:
+            return None
+        if size != source.st_size or mtime_ns != source.st_mtime_ns:
+            return None
+        return samples
+
+    def ingest(self, audio_path: str) -> Path:
+        """
+        Decode an audio file and write its PCM copy (atomically)
+
+        Args:
+            audio_path: Source audio file
+
+        Returns:
+            Path of the .pcm file
+        """
+        # Stat before decoding: a source replaced mid-decode then reads as stale
+        source = os.stat(audio_path)
+        audio = load_audio(str(audio_path)).astype(np.float32, copy=False)
+        pcm_path = self.path_for(audio_path)
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.store_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                header = _HEADER.pack(
+                    _MAGIC, _VERSION, SAMPLE_RATE, 1, len(audio), source.st_size, source.st_mtime_ns
+                )
+                f.write(header.ljust(HEADER_SIZE, b"\0"))
+                f.write(audio.tobytes())
+            os.replace(tmp_path, pcm_path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        logger.info(f"[PCM] Stored {pcm_path.name} ({len(audio) / SAMPLE_RATE:.1f}s)")
+        return pcm_path
+
+    def open(self, audio_path: str) -> Optional[np.ndarray]:
+        """
+        Memory-map the PCM copy of an audio file
+
+        Returns:
+            float32 samples (copy-on-write map), or None if there is no
+            up-to-date copy
+        """
+        pcm_path = self.path_for(audio_path)
+        samples = self._read_header(audio_path, pcm_path)
+        if samples is None:
+            return None
+        if samples == 0:
+            return np.zeros(0, dtype=np.float32)
+
+        # Copy-on-write: consumers may normalize in place without touching the file
+        return np.memmap(pcm_path, dtype=np.float32, mode="c", offset=HEADER_SIZE, shape=(samples,))
+
+    def load(self, audio_path: str) -> np.ndarray:
+        """Samples of an audio file, ingesting it first if needed"""
+        audio = self.open(audio_path)
+        if audio is None:
+            self.ingest(audio_path)
+            audio = self.open(audio_path)
+        return audio
+
+    def duration(self, audio_path: str) -> Optional[float]:
+        """Duration in seconds from the PCM header (None if not ingested)"""
+        samples = self._read_header(audio_path, self.path_for(audio_path))
+        return samples / SAMPLE_RATE if samples is not None else None
+
+    def remove(self, audio_path: str):
+        """Delete the PCM copy of an audio file, if any"""
+        self.path_for(audio_path).unlink(missing_ok=True)
@@ -0,0 +1,91 @@
+"""
+Int8 Quantization for CPU Inference
+Dynamic int8 quantization of Whisper's Linear layers with an on-disk cache
+"""
+import os
+import logging
+from dataclasses import asdict
+from pathlib import Path
+from typing import Optional
+
+from utils.lazy import lazy_import
+
+torch = lazy_import("torch")
+whisper = lazy_import("whisper")
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Supported values for WhisperASR(quantize=...)
+QUANTIZATION_MODES = ("int8",)
+
+
+def default_cache_dir() -> str:
+    """Next to Whisper's own downloaded checkpoints"""
+    return os.path.join(os.getenv("XDG_CACHE_HOME", os.path.expanduser("~/.cache")), "whisper", "quantized")
+
+
+def quantize_int8(model: "whisper.model.Whisper") -> "whisper.model.Whisper":
+    """
+    Apply dynamic int8 quantization to every Linear layer (CPU only)
+
+    Attention projections and MLPs hold nearly all of Whisper's weights;
+    storing them as int8 and quantizing activations on the fly cuts their
+    memory by 4x and runs them with integer kernels. Convolutions,
+    embeddings and layer norms stay fp32.
+    """
+    # Whisper's Linear only adds a dtype cast in forward(); make the layers
+    # plain nn.Linear so PyTorch's quantization mappings recognize them
+    for module in model.modules():
+        if isinstance(module, torch.nn.Linear) and type(module) is not torch.nn.Linear:
+            module.__class__ = torch.nn.Linear
+
+    return torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+
+
+def load_quantized_model(model_size: str, cache_dir: Optional[str] = None) -> "whisper.model.Whisper":
+    """
+    Load an int8 Whisper model, quantizing it once and caching the result
+
+    The quantized state dict is saved per model size and PyTorch version
+    (packed weight formats are version specific). Later loads build the
+    quantized module structure from an empty model and load the cached
+    weights, skipping the fp32 checkpoint and the quantization pass.
+
+    Args:
+        model_size: Whisper model size
+        cache_dir: Directory for quantized checkpoints
+
+    Returns:
+        Quantized model on CPU, in eval mode
+    """
+    cache_path = Path(cache_dir or default_cache_dir()) / f"{model_size}-int8-torch{torch.__version__}.pt"
+
+    if cache_path.exists():
+        try:
+            checkpoint = torch.load(cache_path, map_location="cpu", weights_only=False)
+            model = quantize_int8(whisper.model.Whisper(whisper.model.ModelDimensions(**checkpoint["dims"])))
+            model.load_state_dict(checkpoint["state_dict"])
+            _set_alignment_heads(model, model_size)
+            logger.info(f"Loaded quantized {model_size} model from {cache_path}")
+            return model.eval()
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable quantized checkpoint {cache_path}: {e}")
+
+    model = quantize_int8(whisper.load_model(model_size, device="cpu"))
+
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+    torch.save({"dims": asdict(model.dims), "state_dict": model.state_dict()}, tmp_path)
+    os.replace(tmp_path, cache_path)
+    logger.info(f"Cached quantized {model_size} model at {cache_path}")
+
+    return model.eval()
+
+
+def _set_alignment_heads(model: "whisper.model.Whisper", model_size: str):
+    """Restore the word-timestamp alignment heads (not part of the state dict)"""
+    alignment_heads = getattr(whisper, "_ALIGNMENT_HEADS", {}).get(model_size)
+    if alignment_heads is not None:
+        model.set_alignment_heads(alignment_heads)
@@ -0,0 +1,316 @@
+"""
+ASR Model Registry
+Keeps several Whisper models loaded at once within a memory budget
+"""
+import time
+import logging
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Approximate resident memory per Whisper model size (see architecture doc)
+MODEL_MEMORY_MB = {
+    'tiny': 1024,
+    'base': 1536,
+    'small': 3072,
+    'medium': 6144,
+    'large': 10240,
+}
+
+# Used for model sizes missing from MODEL_MEMORY_MB (e.g. 'large-v3')
+DEFAULT_MODEL_MEMORY_MB = 10240
+
+# Model states reported by state() and status()
+LOADING = "loading"
+WARMING = "warming"
+READY = "ready"
+FAILED = "failed"
+
+
+@dataclass
+class RegistryEntry:
+    """A loaded model and its bookkeeping"""
+    model: Any
+    memory_mb: float
+    load_time: float
+    warmup_time: float = 0.0
+    refcount: int = 0
+    last_used: float = 0.0
+
+
+class ModelRegistry:
+    """
+    Registry of loaded models keyed by (model_size, device)
+
+    Models are loaded on first use through the loader callable and stay
+    loaded until the memory budget is needed for another model. Eviction
+    picks the least recently used idle model; models currently acquired by
+    a request are reference counted and never unloaded.
+
+    With warmup enabled, a newly loaded model's warmup() runs before the
+    model is handed out, so no request pays for first-inference setup.
+    Models exposing memory_mb() are accounted at their measured size
+    rather than the per-size estimate.
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[str, Optional[str]], Any],
+        memory_budget_mb: int = 4096,
+        warmup: bool = False,
+        copies: int = 1
+    ):
+        """
+        Initialize registry
+
+        Args:
+            loader: Callable (model_size, device) -> model
+            memory_budget_mb: Total memory allowed for loaded models
+            warmup: Call model.warmup() (if defined) after loading
+            copies: Copies of the weights a loaded model may hold (e.g. 1 +
+                parallel CPU worker processes); multiplies the size estimate
+        """
+        self.loader = loader
+        self.memory_budget_mb = memory_budget_mb
+        self.warmup = warmup
+        self.copies = copies
+        self._entries: Dict[Tuple[str, str], RegistryEntry] = {}
+        self._lock = threading.Lock()
+        self._load_locks: Dict[Tuple[str, str], threading.Lock] = {}
+        # Models being loaded or warmed up, and the last load error per model
+        self._pending: Dict[Tuple[str, str], str] = {}
+        self._errors: Dict[Tuple[str, str], str] = {}
+        # Models that have loaded successfully at least once (even if since evicted)
+        self._loaded: set = set()
+        # Estimated memory of models being loaded, counted against the budget
+        self._reserved_mb: Dict[Tuple[str, str], int] = {}
+
+    def _key(self, model_size: str, device: Optional[str]) -> Tuple[str, str]:
+        return (model_size, device or 'auto')
+
+    def _estimate_mb(self, model_size: str) -> int:
+        return MODEL_MEMORY_MB.get(model_size, DEFAULT_MODEL_MEMORY_MB) * self.copies
+
+    def _used_mb(self) -> float:
+        loaded = sum(entry.memory_mb for entry in self._entries.values())
+        return loaded + sum(self._reserved_mb.values())
+
+    def _close(self, entries: List[RegistryEntry]):
+        """
+        Release resources dropped models hold (e.g. worker pools)
+
+        Called after self._lock is released: shutting a model down can take
+        a while, and every acquire() and status() needs the lock.
+        """
+        for entry in entries:
+            close = getattr(entry.model, "close", None)
+            if callable(close):
+                close()
+
+    def _make_room(self, needed_mb: int) -> List[RegistryEntry]:
+        """
+        Evict idle models (LRU first) until needed_mb fits the budget
+
+        Returns:
+            Evicted entries, for _close once the lock is released
+        """
+        idle = sorted(
+            (entry.last_used, key) for key, entry in self._entries.items()
+            if entry.refcount == 0
+        )
+
+        evicted = []
+        for _, key in idle:
+            if self._used_mb() + needed_mb <= self.memory_budget_mb:
+                break
+            evicted.append(self._entries.pop(key))
+            logger.info(f"[Registry] Unloaded idle model {key}")
+
+        if self._used_mb() + needed_mb > self.memory_budget_mb:
+            logger.warning(
+                f"[Registry] Memory budget {self.memory_budget_mb} MB exceeded: "
+                f"all loaded models are in use"
+            )
+
+        return evicted
+
+    def _get_or_load(self, model_size: str, device: Optional[str]) -> RegistryEntry:
+        """Return the entry for a model, loading it if needed (refcount taken)"""
+        key = self._key(model_size, device)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.refcount += 1
+                return entry
+            load_lock = self._load_locks.setdefault(key, threading.Lock())
+
+        # Only one thread loads a given model; others wait for it
+        with load_lock:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    entry.refcount += 1
+                    return entry
+
+                # Reserve the estimate so concurrent loads of other models
+                # see this one's memory before it is loaded
+                needed_mb = self._estimate_mb(model_size)
+                evicted = self._make_room(needed_mb)
+                self._reserved_mb[key] = needed_mb
+                self._pending[key] = LOADING
+                self._errors.pop(key, None)
+
+            entry = None
+            try:
+                self._close(evicted)
+                entry = self._load(key, model_size, device, needed_mb)
+            except Exception as e:
+                with self._lock:
+                    self._errors[key] = str(e)
+                raise
+            finally:
+                # Swap the reservation for the loaded entry in one step
+                with self._lock:
+                    self._pending.pop(key, None)
+                    self._reserved_mb.pop(key, None)
+                    if entry is not None:
+                        self._entries[key] = entry
+                        self._loaded.add(key)
+
+        return entry
+
+    def _load(self, key: Tuple[str, str], model_size: str, device: Optional[str], estimate_mb: int) -> RegistryEntry:
+        """Load and optionally warm up a model; returns its entry (refcount taken)"""
+        logger.info(f"[Registry] Loading model {key}")
+        start_time = time.time()
+        model = self.loader(model_size, device)
+        load_time = round(time.time() - start_time, 3)
+
+        warmup_time = 0.0
+        warmup = getattr(model, "warmup", None)
+        if self.warmup and callable(warmup):
+            with self._lock:
+                self._pending[key] = WARMING
+            start_time = time.time()
+            try:
+                warmup()
+            except Exception as e:
+                # A failed warm-up only means the first request pays the setup cost
+                logger.warning(f"[Registry] Warm-up of {key} failed: {e}")
+            warmup_time = round(time.time() - start_time, 3)
+
+        measure = getattr(model, "memory_mb", None)
+        memory_mb = round(measure(), 1) if callable(measure) else estimate_mb
+
+        logger.info(f"[Registry] {key} ready (load {load_time}s, warm-up {warmup_time}s, {memory_mb} MB)")
+        return RegistryEntry(
+            model=model,
+            memory_mb=memory_mb,
+            load_time=load_time,
+            warmup_time=warmup_time,
+            refcount=1,
+            last_used=time.time()
+        )
+
+    @contextmanager
+    def acquire(self, model_size: str = "base", device: Optional[str] = None) -> Iterator[Any]:
+        """
+        Use a model, loading it if needed
+
+        The model cannot be evicted while the context is active.
+
+        Args:
+            model_size: Whisper model size
+            device: 'cuda', 'cpu', or None for auto-detect
+
+        Yields:
+            Loaded model
+        """
+        entry = self._get_or_load(model_size, device)
+        try:
+            yield entry.model
+        finally:
+            with self._lock:
+                entry.refcount -= 1
+                entry.last_used = time.time()
+
+    def prewarm(self, specs: List[Tuple[str, Optional[str]]]):
+        """Load models ahead of time, e.g. [('tiny', None), ('small', 'cuda')]"""
+        for model_size, device in specs:
+            try:
+                with self.acquire(model_size, device):
+                    pass
+            except Exception as e:
+                logger.error(f"[Registry] Pre-warming {model_size} failed: {e}")
+
+    def unload(self, model_size: str, device: Optional[str] = None) -> bool:
+        """Unload an idle model; returns False if missing or in use"""
+        key = self._key(model_size, device)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.refcount > 0:
+                return False
+            del self._entries[key]
+        self._close([entry])
+        return True
+
+    def is_loaded(self, model_size: str, device: Optional[str] = None) -> bool:
+        """Check if a model is currently loaded"""
+        with self._lock:
+            return self._key(model_size, device) in self._entries
+
+    def can_serve(self, model_size: str, device: Optional[str] = None) -> bool:
+        """
+        Check if a model has loaded before and its last load did not fail
+
+        An idle model evicted to make room for another still counts: it is
+        reloaded on its next use.
+        """
+        key = self._key(model_size, device)
+        with self._lock:
+            return key in self._loaded and key not in self._errors
+
+    def state(self, model_size: str, device: Optional[str] = None) -> Optional[str]:
+        """LOADING, WARMING, READY or FAILED; None if not loaded and never attempted"""
+        key = self._key(model_size, device)
+        with self._lock:
+            if key in self._entries:
+                return READY
+            if key in self._pending:
+                return self._pending[key]
+            if key in self._errors:
+                return FAILED
+            return None
+
+    def status(self) -> List[Dict]:
+        """Describe loaded, loading and failed models for health/readiness endpoints"""
+        with self._lock:
+            status = [
+                {
+                    "model_size": model_size,
+                    "device": device,
+                    "state": READY,
+                    "memory_mb": entry.memory_mb,
+                    "load_time": entry.load_time,
+                    "warmup_time": entry.warmup_time,
+                    "in_use": entry.refcount,
+                    "last_used": entry.last_used
+                }
+                for (model_size, device), entry in self._entries.items()
+            ]
+            status.extend(
+                {"model_size": model_size, "device": device, "state": state, "in_use": 0}
+                for (model_size, device), state in self._pending.items()
+            )
+            status.extend(
+                {"model_size": model_size, "device": device, "state": FAILED, "error": error, "in_use": 0}
+                for (model_size, device), error in self._errors.items()
+                if (model_size, device) not in self._entries and (model_size, device) not in self._pending
+            )
+            return status
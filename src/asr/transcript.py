@@ -0,0 +1,239 @@
+"""
+Compact Transcript Representation
+Segments and words stored as parallel arrays instead of nested dicts
+"""
+import sys
+import logging
+from collections.abc import Mapping, Sequence
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from utils.transcript_format import (
+    TIME_DECIMALS,
+    decode_word,
+    encode_columns
+)
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Keys of a segment in the transcribe() format
+SEGMENT_KEYS = ("start", "end", "text", "language", "words")
+
+
+class Segment(Mapping):
+    """
+    Read-only view of one segment of a Transcript
+
+    Behaves like the segment dict of transcribe() (segment["text"],
+    segment.get("words"), dict(segment)), but holds only the transcript
+    and an index; values are read from the arrays on access. The word_*
+    properties are zero-copy slices of the word columns (NaN where the
+    source word had no such value). Keys absent from the source segment
+    are absent here too.
+    """
+
+    __slots__ = ("_transcript", "_index")
+
+    def __init__(self, transcript: "Transcript", index: int):
+        self._transcript = transcript
+        self._index = index
+
+    @property
+    def start(self) -> float:
+        return round(float(self._transcript._columns["segment_start"][self._index]), TIME_DECIMALS)
+
+    @property
+    def end(self) -> float:
+        return round(float(self._transcript._columns["segment_end"][self._index]), TIME_DECIMALS)
+
+    @property
+    def text(self) -> str:
+        columns = self._transcript._columns
+        offsets = columns["segment_text_offsets"]
+        return columns["segment_text"][offsets[self._index]:offsets[self._index + 1]].tobytes().decode("utf-8")
+
+    @property
+    def language(self) -> Optional[str]:
+        return self._transcript._languages[self._transcript._columns["segment_language"][self._index]]
+
+    def _word_slice(self, name: str) -> np.ndarray:
+        offsets = self._transcript._columns["segment_word_offsets"]
+        return self._transcript._columns[name][offsets[self._index]:offsets[self._index + 1]]
+
+    @property
+    def word_starts(self) -> np.ndarray:
+        return self._word_slice("word_start")
+
+    @property
+    def word_ends(self) -> np.ndarray:
+        return self._word_slice("word_end")
+
+    @property
+    def word_probabilities(self) -> np.ndarray:
+        return self._word_slice("word_probability")
+
+    @property
+    def word_texts(self) -> List[str]:
+        vocabulary = self._transcript.vocabulary
+        return [vocabulary[word_id] for word_id in self._word_slice("word_id").tolist()]
+
+    @property
+    def words(self) -> List[Dict]:
+        """Word dicts in the transcribe() format (built on each access)"""
+        return [
+            decode_word(word, start, end, probability)
+            for word, start, end, probability in zip(
+                self.word_texts,
+                self.word_starts.tolist(),
+                self.word_ends.tolist(),
+                self.word_probabilities.tolist()
+            )
+        ]
+
+    def _extras(self) -> Dict:
+        return self._transcript._extras.get(str(self._index), {})
+
+    def _column_keys(self) -> List[str]:
+        """Keys read from the columns (present in the source, not kept as extras)"""
+        missing = self._transcript._missing.get(str(self._index), ())
+        extras = self._extras()
+        return [key for key in SEGMENT_KEYS if key not in missing and key not in extras]
+
+    def __getitem__(self, key: str):
+        extras = self._extras()
+        if key in extras:
+            return extras[key]
+        if key in self._column_keys():
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._column_keys()
+        yield from self._extras()
+
+    def __len__(self) -> int:
+        return len(self._column_keys()) + len(self._extras())
+
+    def to_dict(self) -> Dict:
+        """The segment as a plain dict (JSON-serializable)"""
+        return {key: self[key] for key in self}
+
+    def __repr__(self) -> str:
+        return f"Segment({self.start:.2f}-{self.end:.2f}, {self.text!r})"
+
+
+class Transcript(Sequence):
+    """
+    A transcription result with segments and words in parallel arrays
+
+    Instead of a dict per segment and per word, times and probabilities
+    are float32 arrays, word texts are indexes into a vocabulary of
+    interned strings, and segment i's words are the slice
+    word_offsets[i]:word_offsets[i + 1]. The columns are the ones of the
+    binary transcript format (utils.transcript_format), so saving one
+    needs no conversion.
+
+    Indexing and iterating give Segment views; info holds the other
+    transcribe() fields (text, language, duration, model, ...) and
+    to_dict() rebuilds the transcribe() result for JSON.
+    """
+
+    __slots__ = ("info", "vocabulary", "_columns", "_languages", "_extras", "_missing")
+
+    def __init__(self, columns: Dict[str, np.ndarray], header: Dict, info: Optional[Dict] = None):
+        """
+        Wrap columns produced by encode_columns
+
+        Args:
+            columns: Column arrays by name
+            header: Column header fields (segment_languages, segment_extras,
+                segment_missing)
+            info: Non-segment result fields
+        """
+        self.info = dict(info or {})
+        self._columns = columns
+        self._languages = header["segment_languages"]
+        self._extras = header["segment_extras"]
+        self._missing = header.get("segment_missing", {})
+
+        offsets = columns["vocabulary_offsets"].tolist()
+        blob = columns["vocabulary"].tobytes()
+        self.vocabulary = [
+            sys.intern(blob[offsets[i]:offsets[i + 1]].decode("utf-8")) for i in range(len(offsets) - 1)
+        ]
+
+    @classmethod
+    def from_segments(cls, segments: Iterable[Dict], info: Optional[Dict] = None) -> "Transcript":
+        """
+        Build from segment dicts in the transcribe() format
+
+        Args:
+            segments: Segment dicts, read once (a generator avoids holding them all)
+            info: Non-segment result fields
+
+        Returns:
+            Transcript
+        """
+        columns, header = encode_columns(segments)
+        return cls(columns, header, info)
+
+    @classmethod
+    def from_result(cls, result: Dict) -> "Transcript":
+        """Build from a transcribe() result dict"""
+        info = {key: value for key, value in result.items() if key != "segments"}
+        return cls.from_segments(result.get("segments") or [], info)
+
+    @property
+    def word_count(self) -> int:
+        return len(self._columns["word_id"])
+
+    def __len__(self) -> int:
+        return len(self._columns["segment_start"])
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [Segment(self, i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("segment index out of range")
+        return Segment(self, index)
+
+    def segment_range(self, start: Optional[float] = None, end: Optional[float] = None) -> Tuple[int, int]:
+        """Indexes [first, last) of the segments overlapping [start, end) seconds"""
+        first = 0 if start is None else int(np.searchsorted(self._columns["segment_end"], start, side="right"))
+        last = len(self) if end is None else int(np.searchsorted(self._columns["segment_start"], end, side="left"))
+        return first, max(first, last)
+
+    def segments(self, start: Optional[float] = None, end: Optional[float] = None) -> List[Segment]:
+        """Segment views overlapping [start, end) seconds (all by default)"""
+        first, last = self.segment_range(start, end)
+        return [Segment(self, index) for index in range(first, last)]
+
+    def columns(self) -> Tuple[Dict[str, np.ndarray], Dict]:
+        """Columns and column header, as written by utils.transcript_format"""
+        header = {
+            "segment_count": len(self),
+            "word_count": self.word_count,
+            "segment_languages": self._languages,
+            "segment_extras": self._extras,
+            "segment_missing": self._missing
+        }
+        return self._columns, header
+
+    def nbytes(self) -> int:
+        """Bytes held by the arrays and vocabulary strings"""
+        return (
+            sum(column.nbytes for column in self._columns.values())
+            + sum(sys.getsizeof(word) for word in self.vocabulary)
+        )
+
+    def to_dict(self) -> Dict:
+        """The transcribe() result as plain dicts (JSON-serializable)"""
+        return dict(self.info, segments=[segment.to_dict() for segment in self])
+
+    def __repr__(self) -> str:
+        return f"Transcript({len(self)} segments, {self.word_count} words)"
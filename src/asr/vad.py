@@ -0,0 +1,177 @@
+"""
+Voice Activity Detection
+Energy and spectral-flatness VAD used to skip silence before Whisper decoding
+"""
+from bisect import bisect_left, bisect_right
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from .audio import SAMPLE_RATE
+
+# Analysis frame (30 ms) and frames per FFT block (bounds memory on long audio)
+FRAME_SECONDS = 0.03
+BLOCK_FRAMES = 4096
+
+
+def frame_features(audio: np.ndarray, frame_seconds: float = FRAME_SECONDS) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Per-frame log energy and spectral flatness
+
+    Args:
+        audio: 16 kHz mono float32 samples
+        frame_seconds: Frame length in seconds
+
+    Returns:
+        (energy in dBFS, flatness in [0, 1]) per full frame
+    """
+    frame_length = int(SAMPLE_RATE * frame_seconds)
+    frame_count = len(audio) // frame_length
+    frames = np.asarray(audio[:frame_count * frame_length], dtype=np.float32).reshape(frame_count, frame_length)
+
+    energy_db = np.empty(frame_count, dtype=np.float32)
+    flatness = np.empty(frame_count, dtype=np.float32)
+    window = np.hanning(frame_length).astype(np.float32)
+
+    for start in range(0, frame_count, BLOCK_FRAMES):
+        block = frames[start:start + BLOCK_FRAMES]
+        energy_db[start:start + len(block)] = 10 * np.log10(np.mean(np.square(block), axis=1) + 1e-10)
+
+        # Geometric over arithmetic mean of the power spectrum: near 0 for
+        # voiced speech (harmonic peaks), around 0.5 for broadband noise
+        power = np.abs(np.fft.rfft(block * window, axis=1)) ** 2 + 1e-10
+        flatness[start:start + len(block)] = np.exp(np.mean(np.log(power), axis=1)) / np.mean(power, axis=1)
+
+    return energy_db, flatness
+
+
+def _runs(mask: np.ndarray) -> List[Tuple[int, int]]:
+    """(start, end) index ranges where mask is True"""
+    edges = np.diff(np.concatenate(([0], mask.astype(np.int8), [0])))
+    return list(zip(np.flatnonzero(edges == 1).tolist(), np.flatnonzero(edges == -1).tolist()))
+
+
+def detect_speech(
+    audio: np.ndarray,
+    energy_margin_db: float = 12.0,
+    min_energy_db: float = -55.0,
+    max_flatness: float = 0.45,
+    min_speech_seconds: float = 0.3,
+    min_silence_seconds: float = 1.0,
+    pad_seconds: float = 0.2
+) -> List[Tuple[int, int]]:
+    """
+    Find speech regions
+
+    A frame is speech when its energy is energy_margin_db above the
+    recording's noise floor (10th percentile of frame energy, and never
+    below min_energy_db) and its spectrum is not flat like broadband
+    noise. Pauses shorter than min_silence_seconds are bridged, blips
+    shorter than min_speech_seconds dropped, and regions padded so word
+    onsets and endings are not clipped.
+
+    Args:
+        audio: 16 kHz mono float32 samples
+        energy_margin_db: Required energy above the noise floor
+        min_energy_db: Absolute energy threshold floor
+        max_flatness: Frames flatter than this count as noise
+        min_speech_seconds: Shortest speech region kept
+        min_silence_seconds: Shortest pause that splits regions
+        pad_seconds: Padding added around each region
+
+    Returns:
+        Sorted, non-overlapping (start, end) sample ranges
+    """
+    energy_db, flatness = frame_features(audio)
+    if len(energy_db) == 0:
+        return []
+
+    threshold = max(float(np.percentile(energy_db, 10)) + energy_margin_db, min_energy_db)
+    speech = (energy_db > threshold) & (flatness < max_flatness)
+
+    frame_length = int(SAMPLE_RATE * FRAME_SECONDS)
+    min_silence = int(min_silence_seconds / FRAME_SECONDS)
+    min_speech = int(min_speech_seconds / FRAME_SECONDS)
+    pad = int(pad_seconds * SAMPLE_RATE)
+
+    # Bridge short pauses, then drop short blips
+    merged: List[List[int]] = []
+    for start, end in _runs(speech):
+        if merged and start - merged[-1][1] < min_silence:
+            merged[-1][1] = end
+        else:
+            merged.append([start, end])
+
+    regions: List[Tuple[int, int]] = []
+    for start, end in merged:
+        if end - start < min_speech:
+            continue
+        sample_start = max(0, start * frame_length - pad)
+        sample_end = min(len(audio), end * frame_length + pad)
+        if regions and sample_start <= regions[-1][1]:
+            regions[-1] = (regions[-1][0], sample_end)
+        else:
+            regions.append((sample_start, sample_end))
+
+    return regions
+
+
+class SpeechTimeline:
+    """
+    Maps times in speech-only (compacted) audio back to the original
+
+    Built from the speech regions that were concatenated; each region
+    keeps its offset, so a time inside region i maps to the same offset
+    inside the original region i.
+    """
+
+    def __init__(self, regions: List[Tuple[int, int]]):
+        """
+        Args:
+            regions: (start, end) sample ranges of the original audio, in order
+        """
+        self.original_starts: List[float] = []
+        self.compact_starts: List[float] = []
+        position = 0
+        for start, end in regions:
+            self.original_starts.append(start / SAMPLE_RATE)
+            self.compact_starts.append(position / SAMPLE_RATE)
+            position += end - start
+        self.speech_seconds = position / SAMPLE_RATE
+
+    def to_original(self, t: float, is_end: bool = False) -> float:
+        """
+        Original time of compacted time t
+
+        At the seam between two regions, end times map to the end of the
+        earlier region rather than the start of the next one.
+        """
+        if not self.compact_starts:
+            return t
+        find = bisect_left if is_end else bisect_right
+        index = max(0, find(self.compact_starts, t) - 1)
+        return self.original_starts[index] + (t - self.compact_starts[index])
+
+    def map_segment(self, segment: Dict) -> Dict:
+        """Copy of a segment with its (and its words') times on the original timeline"""
+        return dict(
+            segment,
+            start=self.to_original(segment["start"]),
+            end=self.to_original(segment["end"], is_end=True),
+            words=[
+                dict(
+                    word,
+                    start=self.to_original(word["start"]),
+                    end=self.to_original(word["end"], is_end=True)
+                )
+                for word in segment.get("words") or []
+            ]
+        )
+
+
+def compact_speech(audio: np.ndarray, regions: List[Tuple[int, int]]) -> Tuple[np.ndarray, SpeechTimeline]:
+    """Concatenate the speech regions of audio; returns samples and their timeline"""
+    if not regions:
+        return np.zeros(0, dtype=np.float32), SpeechTimeline([])
+    speech = np.concatenate([audio[start:end] for start, end in regions]).astype(np.float32, copy=False)
+    return speech, SpeechTimeline(regions)
@@ -3,49 +3,117 @@ Whisper ASR Module for English-Tagalog Classroom Lectures
 """
 import os
 import json
-import whisper
-import torch
+import time
+import inspect
 import numpy as np
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
-import librosa
-import soundfile as sf
-from tqdm import tqdm
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
 import logging
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+
+from utils.lazy import lazy_import
+from utils.pipeline import BackgroundWriter, prefetch
+
+from .audio import SAMPLE_RATE, audio_duration, load_audio, probe_duration
+from .batching import BatchFile, BatchWindow, is_silent, needs_fallback, segments_from_tokens
+from .cache import TranscriptionCache
+from .chunking import pad_windows, split_windows, trim_segments
+from .parallel import ParallelTranscriber
+from .pcm_store import PCMStore
+from .quantization import QUANTIZATION_MODES, load_quantized_model
+from .transcript import Transcript
+from .vad import compact_speech, detect_speech
+
+# Heavy dependencies are imported on first use, so importing this module
+# (e.g. when the API starts) stays fast
+whisper = lazy_import("whisper")
+torch = lazy_import("torch")
+sf = lazy_import("soundfile")
+tqdm = lazy_import("tqdm")
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-@dataclass
-class TranscriptionSegment:
-    """Data class for transcript segments"""
-    start: float
-    end: float
-    text: str
-    language: Optional[str] = None
-    confidence: Optional[float] = None
+# Characters of previous text carried into the next window's prompt
+PROMPT_CONTEXT_CHARS = 400
+
+# Chunk length and boundary overlap for parallel CPU transcription
+PARALLEL_CHUNK_SECONDS = 60.0
+PARALLEL_OVERLAP_SECONDS = 1.0
+
+# Window length for batched multi-file decoding (one Whisper input each)
+BATCH_WINDOW_SECONDS = 30.0
+
+# transcribe_batch pipeline: decoded files waiting ahead of the model, and
+# finished results waiting for the writer
+PREFETCH_FILES = 2
+WRITE_QUEUE_FILES = 8
+
+# Initial prompt used for Tagalog when none is given
+TAGALOG_PROMPT = "Ito ay isang lecture sa classroom. This is a classroom lecture."
+
+
+class TranscriptionCancelled(Exception):
+    """Raised from a segment/progress callback to stop a transcription early"""
+
 
 class WhisperASR:
-    def __init__(self, model_size: str = "base", device: str = None):
+    def __init__(
+        self,
+        model_size: str = "base",
+        device: str = None,
+        cache_dir: str = None,
+        cache_max_bytes: int = 2 * 1024 ** 3,
+        pcm_dir: str = None,
+        quantize: str = None,
+        quantized_dir: str = None,
+        parallel_workers: int = 1
+    ):
+        if quantize is not None and quantize not in QUANTIZATION_MODES:
+            raise ValueError(f"Unsupported quantization '{quantize}' (choose from {QUANTIZATION_MODES})")
+
         if device is None:
             device = "cuda" if torch.cuda.is_available() else "cpu"
 
-        # Fallback to CPU if GPU fails
-        try:
-            self.model = whisper.load_model(model_size, device=device)
-            # Test if GPU works
-            if device == "cuda":
-                test_tensor = torch.randn(1, 80, 3000).to(device)
-                _ = self.model.encoder(test_tensor)
-        except Exception as e:
-            print(f"GPU failed ({e}), falling back to CPU")
-            device = "cpu"
-            self.model = whisper.load_model(model_size, device=device)
+        # Dynamic int8 quantization only has CPU kernels
+        if quantize and device != "cpu":
+            logger.warning(f"{quantize} quantization is CPU-only; loading {model_size} unquantized on {device}")
+            quantize = None
+
+        if quantize:
+            self.model = load_quantized_model(model_size, quantized_dir)
+        else:
+            # Fallback to CPU if GPU fails
+            try:
+                self.model = whisper.load_model(model_size, device=device)
+                # Test if GPU works
+                if device == "cuda":
+                    test_tensor = torch.randn(1, 80, 3000).to(device)
+                    _ = self.model.encoder(test_tensor)
+            except Exception as e:
+                print(f"GPU failed ({e}), falling back to CPU")
+                device = "cpu"
+                self.model = whisper.load_model(model_size, device=device)
 
         self.device = device
         self.model_size = model_size
-        print(f"✅ Using device: {self.device}")
+        self.quantize = quantize
+        self.quantized_dir = quantized_dir
+        # Identifies the weights in cache keys (int8 output differs from fp32)
+        self.model_id = f"{model_size}-{quantize}" if quantize else model_size
+        print(f"✅ Using device: {self.device}" + (f" ({quantize})" if quantize else ""))
+
+        # Optional persistent cache of transcription results
+        self.cache = TranscriptionCache(cache_dir, cache_max_bytes) if cache_dir else None
+
+        # Optional store of decoded audio, memory-mapped instead of re-decoded
+        self.pcm_store = PCMStore(pcm_dir) if pcm_dir else None
+
+        # Worker pool for parallel CPU transcription (started on first use);
+        # parallel_workers is the default pool size, counted by memory_mb()
+        self.parallel_workers = parallel_workers
+        self._parallel: Optional[ParallelTranscriber] = None
 
     def transcribe(
         self,
@@ -61,8 +129,15 @@ class WhisperASR:
         word_timestamps: bool = True,
         prepend_punctuations: str = "\"'([{-",
         append_punctuations: str = "\"'.,!?:)]}",
+        use_cache: bool = True,
+        progress_callback: Optional[Callable[[float, float], None]] = None,
+        segment_callback: Optional[Callable[[Dict], None]] = None,
+        workers: Optional[int] = None,
+        audio: Optional[np.ndarray] = None,
+        vad: bool = False,
+        compact: bool = False,
         **kwargs
-    ) -> Dict:
+    ) -> Union[Dict, Transcript]:
         """
         Transcribe audio file with Filipino/English optimization
 
@@ -77,22 +152,141 @@ class WhisperASR:
             condition_on_previous_text: Use previous text as context
             initial_prompt: Initial prompt for better context
             word_timestamps: Generate word-level timestamps
+            use_cache: Reuse a cached result for identical audio and options
+            progress_callback: Called as (processed_seconds, total_seconds)
+            segment_callback: Called with each segment as soon as it is decoded
+            workers: Worker processes for parallel chunked transcription (CPU
+                only; default parallel_workers)
+            audio: Samples of audio_path already decoded by load_audio (skips decoding)
+            vad: Decode only detected speech (see asr.vad); timestamps stay on
+                the original timeline
+            compact: Return a Transcript (segments and words in arrays, see
+                asr.transcript) instead of nested dicts; segments are added as
+                they are decoded, and to_dict() gives the dict
+
+        When a callback is given, audio is decoded window by window (see
+        transcribe_stream) so segments and progress arrive incrementally.
+        A callback may raise TranscriptionCancelled to stop early. With
+        workers > 1 on CPU, chunks are transcribed in parallel instead (see
+        _transcribe_parallel); callbacks then fire as chunks complete.
 
         Returns:
-            Dictionary with transcription results
+            Dictionary with transcription results (a Transcript if compact)
         """
         if not os.path.exists(audio_path):
             raise FileNotFoundError(f"Audio file not found: {audio_path}")
 
         logger.info(f"Transcribing: {audio_path}")
 
+        decode_options = self._decode_options(
+            language, task, temperature, beam_size, best_of, fp16, condition_on_previous_text,
+            initial_prompt, word_timestamps, prepend_punctuations, append_punctuations, kwargs
+        )
+
+        if workers is None:
+            workers = self.parallel_workers
+        mode = self._transcription_mode(workers, segment_callback is not None or progress_callback is not None)
+
+        # Return instantly if this audio was transcribed with the same options
+        # (by any route: full, windowed, parallel and batched share entries)
+        cache_key = None
+        if self.cache is not None and use_cache:
+            cache_key = self._cache_key(audio_path, decode_options, vad)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"Cache hit: {audio_path}")
+                if segment_callback:
+                    for segment in cached["segments"]:
+                        segment_callback(segment)
+                if progress_callback:
+                    progress_callback(cached["duration"], cached["duration"])
+                return Transcript.from_result(cached) if compact else cached
+
+        # Decode once; every mode works on the same samples
+        if audio is None:
+            audio = self._load_audio(audio_path)
+        duration = audio_duration(audio)
+
+        # Skip silence: decode only speech, then map times back to the recording
+        timeline = None
+        if vad:
+            audio, timeline = compact_speech(audio, detect_speech(audio))
+            logger.info(f"VAD kept {timeline.speech_seconds:.1f}s of {duration:.1f}s of audio")
+            if segment_callback:
+                forward_segment = segment_callback
+                segment_callback = lambda segment: forward_segment(timeline.map_segment(segment))
+            if progress_callback:
+                forward_progress = progress_callback
+                progress_callback = lambda processed, total: forward_progress(
+                    timeline.to_original(processed, is_end=True) if processed < total else duration,
+                    duration
+                )
+
+        # Segments are generated as they are decoded; the other result
+        # fields are filled into info once decoding is done
+        info: Dict = {}
+        if len(audio) == 0:
+            # Nothing to decode (e.g. silent recording): avoid hallucinated text
+            segments = iter(())
+            info.update(text="", language=language or "unknown", duration=duration, model=self.model_size)
+        elif mode == "parallel":
+            segments = self._transcribe_parallel(
+                audio, decode_options, workers, info, progress_callback, segment_callback
+            )
+        elif mode == "windowed":
+            segments = self._transcribe_windowed(
+                audio, decode_options, info, progress_callback, segment_callback
+            )
+        else:
+            segments = self._transcribe_full(audio, decode_options, info)
+
+        if timeline is not None:
+            segments = (timeline.map_segment(segment) for segment in segments)
+
+        if compact:
+            # Straight into the columns: the segment and word dicts are
+            # never all alive at once
+            transcript = Transcript.from_segments(segments)
+        else:
+            segments = list(segments)
+
+        if timeline is not None:
+            info["duration"] = duration
+            info["speech_duration"] = timeline.speech_seconds
+
+        if compact:
+            transcript.info.update(info)
+            if cache_key is not None:
+                # Segments are serialized one at a time (see TranscriptionCache.put)
+                self.cache.put(cache_key, dict(transcript.info, segments=transcript))
+            return transcript
+
+        output = {"text": info.pop("text"), "segments": segments, **info}
+        if cache_key is not None:
+            self.cache.put(cache_key, output)
+        return output
+
+    def _decode_options(
+        self,
+        language: Optional[str],
+        task: str,
+        temperature: float,
+        beam_size: int,
+        best_of: int,
+        fp16: bool,
+        condition_on_previous_text: bool,
+        initial_prompt: Optional[str],
+        word_timestamps: bool,
+        prepend_punctuations: str,
+        append_punctuations: str,
+        extra: Dict
+    ) -> Dict:
+        """Whisper decoding options for transcribe()"""
         # Optimize initial prompt for Filipino-English context
         if initial_prompt is None and language == "tl":
-            initial_prompt = "Ito ay isang lecture sa classroom. This is a classroom lecture."
+            initial_prompt = TAGALOG_PROMPT
 
-        # Full transcription using modern Whisper API
-        result = self.model.transcribe(
-            audio_path,
+        return dict(
             language=language,
             task=task,
             temperature=temperature,
@@ -104,81 +298,705 @@ class WhisperASR:
             word_timestamps=word_timestamps,
             prepend_punctuations=prepend_punctuations,
             append_punctuations=append_punctuations,
-            **kwargs
+            **extra
         )
 
-        # Process segments
-        segments = []
-        for seg in result.get("segments", []):
-            # Extract word-level timestamps if available
-            words = []
-            if "words" in seg and seg["words"]:
-                for word in seg["words"]:
-                    words.append({
-                        "word": word.get("word", "").strip(),
-                        "start": word.get("start", 0),
-                        "end": word.get("end", 0),
-                        "probability": word.get("probability", 1.0)
-                    })
-
-            segment = {
-                "start": seg["start"],
-                "end": seg["end"],
-                "text": seg["text"].strip(),
-                "language": self._detect_segment_language(seg["text"]),
-                "words": words
+    def _transcription_mode(self, workers: int, incremental: bool) -> str:
+        """Which decoding path transcribe() takes: parallel chunks, windows, or one full pass"""
+        if workers > 1 and self.device == "cpu":
+            return "parallel"
+        if incremental:
+            return "windowed"
+        return "full"
+
+    def _cache_key(self, audio_path: str, decode_options: Dict, vad: bool) -> str:
+        """Cache key of a transcription; the mode is left out so every route shares entries"""
+        return self.cache.make_key(audio_path, self.model_id, {**decode_options, "vad": vad})
+
+    def _is_cached(self, audio_path: str, transcribe_kwargs: Dict) -> bool:
+        """Check if transcribe(audio_path, **transcribe_kwargs) would be a cache hit"""
+        if self.cache is None or not os.path.exists(audio_path):
+            return False
+        arguments = inspect.signature(self.transcribe).bind(audio_path, **transcribe_kwargs)
+        arguments.apply_defaults()
+        options = arguments.arguments
+        if not options["use_cache"]:
+            return False
+
+        decode_options = self._decode_options(
+            options["language"], options["task"], options["temperature"], options["beam_size"],
+            options["best_of"], options["fp16"], options["condition_on_previous_text"],
+            options["initial_prompt"], options["word_timestamps"], options["prepend_punctuations"],
+            options["append_punctuations"], options["kwargs"]
+        )
+        return self.cache.contains(self._cache_key(audio_path, decode_options, options["vad"]))
+
+    def transcribe_stream(
+        self,
+        audio_path: str,
+        language: str = None,
+        initial_prompt: str = None,
+        chunk_seconds: float = 30.0,
+        **decode_options
+    ) -> Iterator[Dict]:
+        """
+        Yield segments incrementally, one Whisper window at a time
+
+        Audio is decoded once and cut into windows of at most chunk_seconds
+        at quiet points. Each window is transcribed on its own; its segments
+        (with words and a language tag, timestamps on the global timeline)
+        are yielded as soon as the window is done, so first output arrives
+        within seconds. Stopping iteration stops decoding.
+
+        Args:
+            audio_path: Path to audio file
+            language: Language hint ('en', 'tl', or None for auto-detect)
+            initial_prompt: Initial prompt for the first window
+            chunk_seconds: Maximum window length
+            **decode_options: Other Whisper decoding options
+
+        Yields:
+            Segment dictionaries (same format as transcribe()["segments"])
+        """
+        if not os.path.exists(audio_path):
+            raise FileNotFoundError(f"Audio file not found: {audio_path}")
+
+        if initial_prompt is None and language == "tl":
+            initial_prompt = TAGALOG_PROMPT
+
+        audio = self._load_audio(audio_path)
+        for window in self._decode_windows(
+            audio,
+            dict(decode_options, language=language, initial_prompt=initial_prompt),
+            chunk_seconds
+        ):
+            yield from window["segments"]
+
+    def _load_audio(self, audio_path: str) -> np.ndarray:
+        """Samples of an audio file, memory-mapped from the PCM store if configured"""
+        if self.pcm_store is not None:
+            return self.pcm_store.load(audio_path)
+        return load_audio(audio_path)
+
+    def _decode_windows(
+        self,
+        audio: np.ndarray,
+        decode_options: Dict,
+        chunk_seconds: float = 30.0
+    ) -> Iterator[Dict]:
+        """
+        Transcribe audio window by window
+
+        The language detected in the first window is kept for the rest, and
+        with condition_on_previous_text the tail of the previous window's
+        text is carried over as the prompt, like Whisper does internally.
+
+        Yields:
+            {"text", "segments", "language", "end"} per window
+        """
+        options = dict(decode_options)
+        base_prompt = options.pop("initial_prompt", None)
+        condition = options.get("condition_on_previous_text", True)
+        prompt = base_prompt
+
+        for start, end in split_windows(audio, chunk_seconds):
+            offset = start / SAMPLE_RATE
+            result = self.model.transcribe(audio[start:end], initial_prompt=prompt, **options)
+
+            if options.get("language") is None:
+                options["language"] = result.get("language")
+
+            if condition and result.get("text"):
+                context = result["text"].strip()[-PROMPT_CONTEXT_CHARS:]
+                prompt = f"{base_prompt} {context}" if base_prompt else context
+
+            yield {
+                "text": result.get("text", ""),
+                "segments": [
+                    self._format_segment(seg, offset) for seg in result.get("segments", [])
+                ],
+                "language": options.get("language"),
+                "end": end / SAMPLE_RATE
             }
-            segments.append(segment)
+
+    def _transcribe_full(self, audio: np.ndarray, decode_options: Dict, info: Dict) -> Iterator[Dict]:
+        """
+        Full transcription using modern Whisper API
+
+        Yields:
+            Segments; the other result fields are set in info
+        """
+        result = self.model.transcribe(audio, **decode_options)
+        info.update(
+            text=result["text"],
+            language=result.get("language", decode_options.get("language")),
+            duration=audio_duration(audio),
+            model=self.model_size
+        )
+        for seg in result.get("segments", []):
+            yield self._format_segment(seg)
+
+    def _transcribe_windowed(
+        self,
+        audio: np.ndarray,
+        decode_options: Dict,
+        info: Dict,
+        progress_callback: Optional[Callable[[float, float], None]],
+        segment_callback: Optional[Callable[[Dict], None]]
+    ) -> Iterator[Dict]:
+        """
+        Windowed transcription reporting segments and progress as they complete
+
+        Yields:
+            Segments; the other result fields are set in info once all are yielded
+        """
+        duration = audio_duration(audio)
+        if progress_callback:
+            progress_callback(0.0, duration)
+
+        texts = []
+        language = decode_options.get("language")
+
+        for window in self._decode_windows(audio, decode_options):
+            texts.append(window["text"])
+            language = window["language"]
+            for segment in window["segments"]:
+                if segment_callback:
+                    segment_callback(segment)
+                yield segment
+            if progress_callback:
+                progress_callback(window["end"], duration)
+
+        info.update(
+            text="".join(texts),
+            language=language or "unknown",
+            duration=duration,
+            model=self.model_size
+        )
+
+    def _transcribe_parallel(
+        self,
+        audio: np.ndarray,
+        decode_options: Dict,
+        workers: int,
+        info: Dict,
+        progress_callback: Optional[Callable[[float, float], None]],
+        segment_callback: Optional[Callable[[Dict], None]]
+    ) -> Iterator[Dict]:
+        """
+        Transcribe chunks of the audio concurrently in worker processes
+
+        The audio is cut at quiet points into chunks of about
+        PARALLEL_CHUNK_SECONDS, each widened by PARALLEL_OVERLAP_SECONDS so
+        words at a cut are heard in full by a chunk. Segments are shifted
+        to global time and trimmed to each chunk's own region, which drops
+        the words transcribed twice in an overlap. Segments are reported
+        in order as soon as all earlier chunks are done. If a worker dies,
+        the pool is restarted once and the uncollected chunks requeued.
+
+        Yields:
+            Segments; the other result fields are set in info once all are yielded
+        """
+        duration = audio_duration(audio)
+        if progress_callback:
+            progress_callback(0.0, duration)
+
+        windows = split_windows(audio, PARALLEL_CHUNK_SECONDS)
+        padded = pad_windows(windows, PARALLEL_OVERLAP_SECONDS, len(audio))
+
+        # Each chunk is independent, so there is no previous text to condition on
+        options = dict(decode_options, fp16=False, condition_on_previous_text=False)
+
+        texts = []
+        language_seconds: Dict[str, float] = {}
+        futures: List[Future] = []
+        restarted = False
+        try:
+            for index in range(len(padded)):
+                while True:
+                    try:
+                        if len(futures) <= index:
+                            futures[index:] = self._queue_chunks(audio, padded[index:], options, workers)
+                            logger.info(f"[Parallel] {len(padded) - index} chunks queued on {workers} workers")
+                        result = futures[index].result()
+                        break
+                    except BrokenProcessPool:
+                        # A worker died (e.g. killed for memory): drop the pool,
+                        # then start a fresh one once and requeue the chunks not
+                        # yet collected
+                        self.close()
+                        if restarted:
+                            raise
+                        restarted = True
+                        logger.warning("[Parallel] Worker pool broke, restarting it")
+                        del futures[index:]
+
+                core_start = windows[index][0] / SAMPLE_RATE if index else float("-inf")
+                core_end = windows[index][1] / SAMPLE_RATE if index < len(windows) - 1 else float("inf")
+                offset = padded[index][0] / SAMPLE_RATE
+
+                formatted = [self._format_segment(seg, offset) for seg in result["segments"]]
+                for segment in trim_segments(formatted, core_start, core_end):
+                    texts.append(segment["text"])
+                    if segment_callback:
+                        segment_callback(segment)
+                    yield segment
+
+                chunk_seconds = (windows[index][1] - windows[index][0]) / SAMPLE_RATE
+                if result["language"]:
+                    language_seconds[result["language"]] = (
+                        language_seconds.get(result["language"], 0.0) + chunk_seconds
+                    )
+                if progress_callback:
+                    progress_callback(windows[index][1] / SAMPLE_RATE, duration)
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+
+        language = decode_options.get("language")
+        if language is None and language_seconds:
+            language = max(language_seconds, key=language_seconds.get)
+
+        info.update(
+            text=" ".join(texts),
+            language=language or "unknown",
+            duration=duration,
+            model=self.model_size
+        )
+
+    def warmup(self) -> float:
+        """
+        Run a dummy inference on one second of silence
+
+        The first call on a fresh model pays for CUDA context and kernel
+        selection, allocator growth and the word-alignment path; doing it
+        here keeps that cost out of the first real request.
+
+        Returns:
+            Warm-up time in seconds
+        """
+        start_time = time.time()
+        with torch.no_grad():
+            self.model.transcribe(
+                np.zeros(SAMPLE_RATE, dtype=np.float32),
+                language="en",
+                fp16=self.device == "cuda",
+                word_timestamps=True,
+                condition_on_previous_text=False
+            )
+        return round(time.time() - start_time, 3)
+
+    def memory_mb(self) -> float:
+        """
+        Memory held by the model weights, including int8 packed weights
+
+        On CPU, each parallel worker process holds its own copy of the
+        weights; those copies are counted (for the running pool, or the
+        parallel_workers default before it starts).
+        """
+        total_bytes = 0
+        for value in self.model.state_dict().values():
+            # Quantized Linear layers store (weight, bias) tuples
+            for tensor in value if isinstance(value, tuple) else (value,):
+                if isinstance(tensor, torch.Tensor):
+                    total_bytes += tensor.element_size() * tensor.nelement()
+
+        workers = self._parallel.workers if self._parallel is not None else self.parallel_workers
+        if self.device == "cpu" and workers > 1:
+            total_bytes *= 1 + workers
+        return total_bytes / 1024 ** 2
+
+    def _queue_chunks(
+        self,
+        audio: np.ndarray,
+        windows: List[Tuple[int, int]],
+        decode_options: Dict,
+        workers: int
+    ) -> List[Future]:
+        """Queue sample ranges on the worker pool, starting it if needed"""
+        if self._parallel is None or self._parallel.workers != workers:
+            self.close()
+            self._parallel = ParallelTranscriber(
+                self.model_size, workers, quantize=self.quantize, quantized_dir=self.quantized_dir
+            )
+        return self._parallel.map_chunks(audio, windows, decode_options)
+
+    def close(self):
+        """Stop the parallel worker pool, if one was started"""
+        if self._parallel is not None:
+            self._parallel.shutdown()
+            self._parallel = None
+
+    def _format_segment(self, seg: Dict, offset: float = 0.0) -> Dict:
+        """Convert a Whisper segment to our serializable format"""
+        # Extract word-level timestamps if available
+        words = []
+        if "words" in seg and seg["words"]:
+            for word in seg["words"]:
+                words.append({
+                    "word": word.get("word", "").strip(),
+                    "start": word.get("start", 0) + offset,
+                    "end": word.get("end", 0) + offset,
+                    "probability": word.get("probability", 1.0)
+                })
 
         return {
-            "text": result["text"],
-            "segments": segments,
-            "language": result.get("language", language),
-            "duration": self._get_audio_duration(audio_path),
-            "model": self.model_size
+            "start": seg["start"] + offset,
+            "end": seg["end"] + offset,
+            "text": seg["text"].strip(),
+            "language": self._detect_segment_language(seg["text"]),
+            "words": words
         }
 
     def transcribe_batch(
         self,
         audio_paths: List[str],
         output_dir: str = None,
+        batch_size: int = 1,
+        decode_workers: int = 2,
         **transcribe_kwargs
     ) -> List[Dict]:
         """
         Transcribe multiple audio files
 
+        Runs as a three-stage pipeline so the model never waits on disk:
+        decode_workers threads decode audio up to PREFETCH_FILES files
+        ahead of the model, the calling thread runs inference, and a writer
+        thread saves results to output_dir as each file completes. With
+        batch_size > 1, 30 s windows of several files are also packed into
+        shared batches (see _transcribe_batched), so the encoder and
+        decoder see batch size > 1 instead of one window at a time.
+
         Args:
             audio_paths: List of audio file paths
             output_dir: Directory to save transcriptions
+            batch_size: Windows decoded together (1 = one file at a time)
+            decode_workers: Threads decoding audio ahead of the model
             **transcribe_kwargs: Arguments for transcribe method
 
         Returns:
-            List of transcription results
+            List of transcription results, in the order of audio_paths
         """
-        results = []
+        results: List[Optional[Dict]] = [None] * len(audio_paths)
+        progress = tqdm.tqdm(total=len(audio_paths), desc="Transcribing")
 
-        for audio_path in tqdm(audio_paths, desc="Transcribing"):
-            try:
-                result = self.transcribe(audio_path, **transcribe_kwargs)
-                results.append(result)
+        def write(item: Tuple[int, Dict]):
+            index, result = item
+            if output_dir and "error" not in result:
+                try:
+                    self._write_transcript(audio_paths[index], result, output_dir)
+                except Exception as e:
+                    logger.error(f"Error saving transcript of {audio_paths[index]}: {e}")
+                    results[index] = {"error": str(e), "audio_path": audio_paths[index]}
+            progress.update(1)
 
-                # Save to file if output directory specified
-                if output_dir:
-                    os.makedirs(output_dir, exist_ok=True)
-                    base_name = os.path.splitext(os.path.basename(audio_path))[0]
-                    output_path = os.path.join(output_dir, f"{base_name}_transcript.json")
+        def finish(index: int, result: Dict):
+            results[index] = result
+            writer.submit((index, result))
 
-                    # Segments are already in serializable format (dicts)
-                    serializable_result = result.copy()
+        try:
+            with BackgroundWriter(write, WRITE_QUEUE_FILES, name="asr-writer") as writer:
+                if batch_size > 1:
+                    self._transcribe_batched(
+                        audio_paths, batch_size, finish, decode_workers, **transcribe_kwargs
+                    )
+                else:
+                    self._transcribe_prefetched(audio_paths, finish, decode_workers, **transcribe_kwargs)
+        finally:
+            progress.close()
 
-                    with open(output_path, 'w', encoding='utf-8') as f:
-                        json.dump(serializable_result, f, ensure_ascii=False, indent=2)
+        return results
 
-            except Exception as e:
-                logger.error(f"Error transcribing {audio_path}: {e}")
-                results.append({"error": str(e), "audio_path": audio_path})
+    def _transcribe_prefetched(
+        self,
+        audio_paths: List[str],
+        on_result: Callable[[int, Dict], None],
+        decode_workers: int,
+        **transcribe_kwargs
+    ):
+        """Transcribe files one at a time while the next ones are decoded"""
+        def decode(item: Tuple[int, str]) -> Optional[np.ndarray]:
+            # transcribe() reports missing files and answers cache hits itself
+            audio_path = item[1]
+            if not os.path.exists(audio_path) or self._is_cached(audio_path, transcribe_kwargs):
+                return None
+            return self._load_audio(audio_path)
 
-        return results
+        decoded = prefetch(decode, enumerate(audio_paths), decode_workers, PREFETCH_FILES)
+        try:
+            for (index, audio_path), audio, error in decoded:
+                try:
+                    if error is not None:
+                        raise error
+                    result = self.transcribe(audio_path, audio=audio, **transcribe_kwargs)
+                except Exception as e:
+                    logger.error(f"Error transcribing {audio_path}: {e}")
+                    result = {"error": str(e), "audio_path": audio_path}
+                on_result(index, result)
+        finally:
+            decoded.close()
+
+    def _write_transcript(self, audio_path: str, result: Dict, output_dir: str):
+        """Save a result as <output_dir>/<name>_transcript.json"""
+        os.makedirs(output_dir, exist_ok=True)
+        base_name = os.path.splitext(os.path.basename(audio_path))[0]
+        output_path = os.path.join(output_dir, f"{base_name}_transcript.json")
+
+        # Segments are already in serializable format (dicts)
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+
+    def _transcribe_batched(
+        self,
+        audio_paths: List[str],
+        batch_size: int,
+        on_result: Callable[[int, Dict], None],
+        decode_workers: int = 2,
+        language: str = None,
+        task: str = "transcribe",
+        temperature: float = 0.0,
+        beam_size: int = 5,
+        best_of: int = 5,
+        fp16: bool = True,
+        condition_on_previous_text: bool = True,
+        initial_prompt: str = None,
+        word_timestamps: bool = True,
+        prepend_punctuations: str = "\"'([{-",
+        append_punctuations: str = "\"'.,!?:)]}",
+        use_cache: bool = True,
+        vad: bool = False,
+        compression_ratio_threshold: Optional[float] = 2.4,
+        logprob_threshold: Optional[float] = -1.0,
+        no_speech_threshold: Optional[float] = 0.6,
+        **kwargs
+    ):
+        """
+        Transcribe files with windows from several files decoded together
+
+        Decode workers prepare files (and run VAD) ahead of the model,
+        cutting each into windows of at most BATCH_WINDOW_SECONDS at quiet
+        points and computing their log-mel spectrograms. The model thread
+        packs up to batch_size windows, from however many files it takes,
+        into one whisper.decode call. Windows of a file are decoded
+        independently, so condition_on_previous_text does not apply; every
+        window gets initial_prompt. on_result(index, result) is called as
+        soon as the last window of a file is decoded.
+        """
+        if initial_prompt is None and language == "tl":
+            initial_prompt = TAGALOG_PROMPT
+
+        options = dict(
+            language=language,
+            task=task,
+            temperature=temperature,
+            beam_size=beam_size,
+            best_of=best_of,
+            fp16=fp16 and self.device == "cuda",
+            condition_on_previous_text=condition_on_previous_text,
+            initial_prompt=initial_prompt,
+            word_timestamps=word_timestamps,
+            prepend_punctuations=prepend_punctuations,
+            append_punctuations=append_punctuations,
+            **kwargs
+        )
+        thresholds = dict(
+            compression_ratio_threshold=compression_ratio_threshold,
+            logprob_threshold=logprob_threshold,
+            no_speech_threshold=no_speech_threshold
+        )
+
+        def prepare(item: Tuple[int, str]) -> BatchFile:
+            return self._prepare_batch_file(item[0], item[1], options, vad, use_cache)
+
+        def fail(file: BatchFile, error: Exception):
+            logger.error(f"Error transcribing {file.audio_path}: {error}")
+            file.error = error
+            on_result(file.index, {"error": str(error), "audio_path": file.audio_path})
+
+        files = prefetch(prepare, enumerate(audio_paths), decode_workers, PREFETCH_FILES)
+        pending: List[BatchWindow] = []
+        exhausted = False
+        try:
+            while True:
+                # Top up the batch with windows of the next decoded files
+                while not exhausted and len(pending) < batch_size:
+                    entry = next(files, None)
+                    if entry is None:
+                        exhausted = True
+                        break
+                    (index, audio_path), file, error = entry
+                    if error is not None:
+                        fail(BatchFile(index, audio_path), error)
+                    elif file.cached is not None:
+                        on_result(file.index, file.cached)
+                    elif not file.windows:
+                        on_result(file.index, self._finish_batch_file(file, language))
+                    else:
+                        pending.extend(file.windows)
+
+                pending = [window for window in pending if window.file.error is None]
+                if not pending:
+                    break
+
+                batch, pending = pending[:batch_size], pending[batch_size:]
+                try:
+                    self._decode_batch(batch, options, thresholds)
+                except Exception as e:
+                    for file in {id(window.file): window.file for window in batch}.values():
+                        if file.error is None:
+                            fail(file, e)
+                    continue
+
+                for window in batch:
+                    window.file.remaining -= 1
+                    if window.file.remaining == 0:
+                        on_result(window.file.index, self._finish_batch_file(window.file, language))
+        finally:
+            files.close()
+
+    def _prepare_batch_file(
+        self,
+        index: int,
+        audio_path: str,
+        options: Dict,
+        vad: bool,
+        use_cache: bool
+    ) -> BatchFile:
+        """Decode one file into log-mel windows (runs on a decode worker)"""
+        if not os.path.exists(audio_path):
+            raise FileNotFoundError(f"Audio file not found: {audio_path}")
+
+        file = BatchFile(index, audio_path)
+        if self.cache is not None and use_cache:
+            file.cache_key = self._cache_key(audio_path, options, vad)
+            file.cached = self.cache.get(file.cache_key)
+            if file.cached is not None:
+                logger.info(f"Cache hit: {audio_path}")
+                return file
+
+        audio = self._load_audio(audio_path)
+        file.duration = audio_duration(audio)
+        if vad:
+            audio, file.timeline = compact_speech(audio, detect_speech(audio))
+
+        n_mels = self.model.dims.n_mels
+        for start, end in split_windows(audio, BATCH_WINDOW_SECONDS) if len(audio) else []:
+            samples = torch.from_numpy(np.ascontiguousarray(audio[start:end], dtype=np.float32))
+            file.windows.append(BatchWindow(
+                file=file,
+                offset=start / SAMPLE_RATE,
+                seconds=(end - start) / SAMPLE_RATE,
+                frames=(end - start) // whisper.audio.HOP_LENGTH,
+                mel=whisper.log_mel_spectrogram(whisper.pad_or_trim(samples), n_mels)
+            ))
+        file.remaining = len(file.windows)
+        return file
+
+    def _decode_batch(self, batch: List[BatchWindow], options: Dict, thresholds: Dict):
+        """
+        Decode windows (from any files) together, filling in their segments
+
+        Windows whose output looks like a failure (repetitive or low
+        confidence) are re-decoded together at the next temperature, as
+        whisper.transcribe does one window at a time.
+        """
+        mel = torch.stack([window.mel for window in batch]).to(self.model.device)
+        temperature = options["temperature"]
+        temperatures = tuple(temperature) if isinstance(temperature, (list, tuple)) else (temperature,)
+        decode_kwargs = {
+            key: value for key, value in options.items()
+            if key not in (
+                "language", "task", "temperature", "beam_size", "best_of", "fp16",
+                "condition_on_previous_text", "initial_prompt", "word_timestamps",
+                "prepend_punctuations", "append_punctuations"
+            )
+        }
+
+        todo = list(range(len(batch)))
+        for attempt, temperature in enumerate(temperatures):
+            decoding = whisper.DecodingOptions(
+                task=options["task"],
+                language=options["language"],
+                temperature=temperature,
+                beam_size=options["beam_size"] if temperature == 0 else None,
+                best_of=options["best_of"] if temperature > 0 else None,
+                prompt=options["initial_prompt"],
+                fp16=options["fp16"],
+                **decode_kwargs
+            )
+            with torch.no_grad():
+                results = whisper.decode(self.model, mel[todo], decoding)
+
+            retry = []
+            for index, result in zip(todo, results):
+                batch[index].result = result
+                if attempt < len(temperatures) - 1 and needs_fallback(result, **thresholds):
+                    retry.append(index)
+            todo = retry
+            if not todo:
+                break
+
+        for index, window in enumerate(batch):
+            result = window.result
+            if is_silent(result, thresholds["logprob_threshold"], thresholds["no_speech_threshold"]):
+                continue
+
+            tokenizer = whisper.tokenizer.get_tokenizer(
+                self.model.is_multilingual,
+                num_languages=self.model.num_languages,
+                language=result.language,
+                task=options["task"]
+            )
+            segments = segments_from_tokens(
+                result.tokens, tokenizer.timestamp_begin, window.seconds, tokenizer.decode
+            )
+            if options["word_timestamps"] and segments:
+                whisper.timing.add_word_timestamps(
+                    segments=segments,
+                    model=self.model,
+                    tokenizer=tokenizer,
+                    mel=mel[index],
+                    num_frames=window.frames,
+                    prepend_punctuations=options["prepend_punctuations"],
+                    append_punctuations=options["append_punctuations"],
+                    last_speech_timestamp=0.0
+                )
+            window.segments = [self._format_segment(seg, window.offset) for seg in segments]
+
+        # Spectrograms are no longer needed once a window is decoded
+        for window in batch:
+            window.mel = None
+
+    def _finish_batch_file(self, file: BatchFile, language: Optional[str]) -> Dict:
+        """Assemble a file's result from its decoded windows"""
+        segments = [segment for window in file.windows for segment in window.segments]
+
+        # Windows detect their language independently; report the majority
+        language_seconds: Dict[str, float] = {}
+        for window in file.windows:
+            detected = getattr(window.result, "language", None)
+            if detected and window.segments:
+                language_seconds[detected] = language_seconds.get(detected, 0.0) + window.seconds
+        if language is None and language_seconds:
+            language = max(language_seconds, key=language_seconds.get)
+
+        output = {
+            "text": " ".join(segment["text"] for segment in segments),
+            "segments": segments,
+            "language": language or "unknown",
+            "duration": file.duration,
+            "model": self.model_size
+        }
+        if file.timeline is not None:
+            output["segments"] = [file.timeline.map_segment(segment) for segment in segments]
+            output["speech_duration"] = file.timeline.speech_seconds
+
+        if file.cache_key is not None:
+            self.cache.put(file.cache_key, output)
+
+        file.windows = []
+        return output
 
     def _detect_segment_language(self, text: str) -> str:
         """
@@ -216,9 +1034,12 @@ class WhisperASR:
             return 'mixed'
     
     def _get_audio_duration(self, audio_path: str) -> float:
-        """Get audio duration in seconds"""
-        audio, sr = librosa.load(audio_path, sr=None)
-        return len(audio) / sr
+        """Get audio duration in seconds (from the file header, no decoding)"""
+        if self.pcm_store is not None:
+            duration = self.pcm_store.duration(audio_path)
+            if duration is not None:
+                return duration
+        return probe_duration(audio_path)
     
     def evaluate_wer(
         self,
@@ -247,6 +1068,49 @@ class WhisperASR:
         }
 
 
+def evaluate_quantization(
+    audio_path: str,
+    reference_path: str,
+    model_size: str = "base",
+    quantize: str = "int8",
+    **transcribe_kwargs
+) -> Dict:
+    """
+    Compare a quantized CPU model against fp32 on a reference transcript
+
+    Both models transcribe the same audio (result cache disabled) and are
+    scored with evaluate_wer, so the accuracy cost of quantization is
+    measured on our own recordings next to the speedup.
+
+    Args:
+        audio_path: Audio file with a known transcript
+        reference_path: Path to reference transcript
+        model_size: Whisper model size
+        quantize: Quantization mode to evaluate
+        **transcribe_kwargs: Arguments for transcribe method
+
+    Returns:
+        {"fp32": {...}, quantize: {...}, "wer_delta", "speedup"} where each
+        model entry holds wer/cer/mer and transcription seconds
+    """
+    report = {}
+    for name, mode in (("fp32", None), (quantize, quantize)):
+        asr = WhisperASR(model_size=model_size, device="cpu", quantize=mode)
+        start_time = time.time()
+        result = asr.transcribe(audio_path, use_cache=False, **transcribe_kwargs)
+        elapsed = time.time() - start_time
+        report[name] = {**asr.evaluate_wer(reference_path, result["text"]), "seconds": round(elapsed, 2)}
+        del asr
+
+    report["wer_delta"] = report[quantize]["wer"] - report["fp32"]["wer"]
+    report["speedup"] = round(report["fp32"]["seconds"] / max(report[quantize]["seconds"], 1e-9), 2)
+    logger.info(
+        f"{quantize} vs fp32 ({model_size}): WER {report['fp32']['wer']:.3f} -> "
+        f"{report[quantize]['wer']:.3f}, {report['speedup']}x faster"
+    )
+    return report
+
+
 # Quick test function
 def test_whisper():
     """Test Whisper with a sample audio file"""
@@ -4,6 +4,7 @@ Error Correction Module for Filipino-English Code-Switched Text
 
 from .error_corrector import ErrorCorrector
 from .rules import CorrectionRules
+from .alignment import align_segments, align_words, count_changes
 from .models import (
     CorrectionResult,
     CorrectionChange,
@@ -19,5 +20,8 @@ __all__ = [
     'CorrectionChange',
     'CorrectionConfig',
     'CorrectionLevel',
-    'ErrorType'
+    'ErrorType',
+    'align_segments',
+    'align_words',
+    'count_changes'
 ]
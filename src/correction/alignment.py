@@ -0,0 +1,516 @@
+"""
+Word Alignment of Corrections onto Transcript Timestamps
+Banded edit-distance alignment, linear in length for near-identical texts
+"""
+import re
+import logging
+from bisect import bisect_left
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+# Setup logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Alignment costs: identical word, same word up to case/punctuation, other word,
+# gap (a substitution costs more than a gap so unchanged words stay paired)
+_MATCH_COST = 0
+_NORMALIZED_COST = 1
+_SUBSTITUTE_COST = 3
+_GAP_COST = 2
+
+# Half-width of the first band (in words off the diagonal), and the widest band
+# tried; the band doubles until the alignment is provably optimal, or until
+# the next band would exceed MAX_CELLS DP cells (bounding time and memory)
+INITIAL_BAND = 64
+MAX_BAND = 1024
+MAX_CELLS = 1 << 22
+
+# Rows whose substitution costs are computed together
+BLOCK_ROWS = 1024
+
+# Length of the word n-grams that anchor the alignment when unique in both texts
+ANCHOR_WORDS = 4
+
+# Traceback moves
+_DIAGONAL, _DELETE, _INSERT = 1, 2, 3
+
+_INF = 1 << 40
+_PUNCTUATION = re.compile(r"^\W+|\W+$")
+
+# Decimals kept for word times
+TIME_DECIMALS = 3
+
+
+def _normalize(word: str) -> str:
+    return _PUNCTUATION.sub("", word).casefold()
+
+
+def _word_ids(original: List[str], corrected: List[str], key) -> Tuple[np.ndarray, np.ndarray]:
+    """Map words to integer ids shared by both texts (by key(word))"""
+    ids: Dict[str, int] = {}
+    encode = lambda words: np.fromiter(
+        (ids.setdefault(key(word), len(ids)) for word in words), dtype=np.int64, count=len(words)
+    )
+    return encode(original), encode(corrected)
+
+
+def _band_centers(n: int, m: int) -> np.ndarray:
+    """Column of the diagonal from (0, 0) to (n, m) in each row (n >= m)"""
+    return np.arange(n + 1, dtype=np.int64) * m // max(n, 1)
+
+
+def _banded_moves(
+    a: np.ndarray, b: np.ndarray, na: np.ndarray, nb: np.ndarray, band: int
+) -> Tuple[int, np.ndarray]:
+    """
+    Edit distance of a -> b restricted to a band around the diagonal
+
+    The band follows the straight line from (0, 0) to (len(a), len(b)),
+    so its width does not grow with the length difference; a must be the
+    longer text, so the line moves at most one column per row. Cells are
+    indexed by row i (words of a) and offset d = j - center(i). Each row
+    is computed with array operations: substitutions and deletions come
+    from the previous row, and runs of insertions within the row are
+    resolved with a cumulative minimum.
+
+    Returns:
+        (cost, moves per (row, offset + band))
+    """
+    n, m = len(a), len(b)
+    centers = _band_centers(n, m)
+    moved = (np.diff(centers) > 0).tolist()
+    d = np.arange(-band, band + 1, dtype=np.int64)
+    gap_steps = d * _GAP_COST
+    infinite = np.array([_INF], dtype=np.int64)
+
+    moves = np.zeros((n + 1, len(d)), dtype=np.uint8)
+    row = np.where((d >= 0) & (d <= m), gap_steps, _INF)
+    moves[0] = np.where(d > 0, _INSERT, 0)
+
+    for block_start in range(1, n + 1, BLOCK_ROWS):
+        rows = np.arange(block_start, min(block_start + BLOCK_ROWS, n + 1))
+        # Substitution costs for a block of rows at once (_INF left of column 1)
+        j = centers[rows, None] + d
+        previous_word = np.clip(j - 1, 0, m - 1)
+        substitutes = np.where(
+            b[previous_word] == a[rows - 1, None], _MATCH_COST,
+            np.where(nb[previous_word] == na[rows - 1, None], _NORMALIZED_COST, _SUBSTITUTE_COST)
+        )
+        substitutes[j < 1] = _INF
+        invalid = (j < 0) | (j > m)
+
+        for i, substitute, outside in zip(rows.tolist(), substitutes, invalid):
+            # Same column in the previous row is offset d (line moved) or d + 1
+            if moved[i - 1]:
+                diagonal = row + substitute
+                delete = np.concatenate((row[1:], infinite))
+            else:
+                diagonal = np.concatenate((infinite, row[:-1])) + substitute
+                delete = row
+            delete = delete + _GAP_COST
+
+            best = np.minimum(diagonal, delete)
+            best[outside] = _INF
+            move = np.where(diagonal <= delete, _DIAGONAL, _DELETE)
+            insert = np.minimum.accumulate(best - gap_steps) + gap_steps
+            move[insert < best] = _INSERT
+
+            row = np.minimum(best, insert)
+            row[outside] = _INF
+            moves[i] = move
+
+    return int(row[band]), moves
+
+
+def _outside_band_bound(n: int, m: int, band: int) -> int:
+    """
+    Lowest cost of any alignment leaving the band
+
+    A path leaving the band passes a cell just outside it, and a path
+    through (i, j) needs at least |j - i| + |(m - j) - (n - i)| gaps.
+    """
+    i = np.arange(n + 1, dtype=np.int64)
+    centers = _band_centers(n, m)
+    bound = _INF
+    for j in (centers - band - 1, centers + band + 1):
+        inside = (j >= 0) & (j <= m)
+        if inside.any():
+            gaps = np.abs(j - i) + np.abs((m - j) - (n - i))
+            bound = min(bound, int(gaps[inside].min()) * _GAP_COST)
+    return bound
+
+
+def _anchors(original: List[str], corrected: List[str]) -> List[Tuple[int, int, int]]:
+    """
+    Runs of words certainly matched between the texts
+
+    Word n-grams occurring exactly once in each text are matched, the
+    longest subsequence of them in the same order in both texts is kept
+    (patience sorting), and overlapping n-grams on the same diagonal are
+    merged into runs.
+
+    Returns:
+        [(i, j, length)] non-overlapping, increasing in i and j
+    """
+    def unique_grams(words: List[str]) -> Dict[tuple, int]:
+        positions: Dict[tuple, int] = {}
+        for index in range(len(words) - ANCHOR_WORDS + 1):
+            gram = tuple(words[index:index + ANCHOR_WORDS])
+            positions[gram] = -1 if gram in positions else index
+        return positions
+
+    corrected_grams = unique_grams(corrected)
+    matches = [
+        (i, corrected_grams[gram]) for gram, i in unique_grams(original).items()
+        if i >= 0 and corrected_grams.get(gram, -1) >= 0
+    ]
+    matches.sort()
+
+    # Longest increasing subsequence of j (i is already increasing)
+    tails: List[int] = []
+    tail_index: List[int] = []
+    previous = [-1] * len(matches)
+    for index, (_, j) in enumerate(matches):
+        position = bisect_left(tails, j)
+        if position == len(tails):
+            tails.append(j)
+            tail_index.append(index)
+        else:
+            tails[position] = j
+            tail_index[position] = index
+        previous[index] = tail_index[position - 1] if position else -1
+    chain = []
+    index = tail_index[-1] if tail_index else -1
+    while index >= 0:
+        chain.append(matches[index])
+        index = previous[index]
+    chain.reverse()
+
+    runs: List[Tuple[int, int, int]] = []
+    for i, j in chain:
+        if runs:
+            run_i, run_j, length = runs[-1]
+            if i - run_i == j - run_j and i <= run_i + length:
+                runs[-1] = (run_i, run_j, i + ANCHOR_WORDS - run_i)
+                continue
+            if i < run_i + length or j < run_j + length:
+                continue
+        runs.append((i, j, ANCHOR_WORDS))
+    return runs
+
+
+def _align_gap(
+    original: List[str],
+    corrected: List[str],
+    i1: int, i2: int, j1: int, j2: int,
+    max_band: int
+) -> List[Tuple[int, int]]:
+    """Align original[i1:i2] with corrected[j1:j2] by banded DP (absolute pairs)"""
+    prefix = 0
+    while prefix < min(i2 - i1, j2 - j1) and original[i1 + prefix] == corrected[j1 + prefix]:
+        prefix += 1
+    suffix = 0
+    while suffix < min(i2 - i1, j2 - j1) - prefix and original[i2 - 1 - suffix] == corrected[j2 - 1 - suffix]:
+        suffix += 1
+
+    pairs = [(i1 + offset, j1 + offset) for offset in range(prefix)]
+    i1, j1 = i1 + prefix, j1 + prefix
+    i2, j2 = i2 - suffix, j2 - suffix
+
+    middle_a = original[i1:i2]
+    middle_b = corrected[j1:j2]
+    if not middle_a or not middle_b:
+        pairs.extend((i, -1) for i in range(i1, i2))
+        pairs.extend((-1, j) for j in range(j1, j2))
+    else:
+        a, b = _word_ids(middle_a, middle_b, lambda word: word)
+        na, nb = _word_ids(middle_a, middle_b, _normalize)
+
+        # Rows run over the longer text; pairs are swapped back below
+        swapped = len(b) > len(a)
+        if swapped:
+            a, b, na, nb = b, a, nb, na
+
+        band = INITIAL_BAND
+        while True:
+            cost, moves = _banded_moves(a, b, na, nb, band)
+            widest = band >= max_band or band >= len(b) or (len(a) + 1) * (4 * band + 1) > MAX_CELLS
+            if widest or cost <= _outside_band_bound(len(a), len(b), band):
+                break
+            band *= 2
+
+        # Trace back from the end of both stretches
+        centers = _band_centers(len(a), len(b))
+        middle = []
+        i, j = len(a), len(b)
+        while i > 0 or j > 0:
+            move = moves[i][j - centers[i] + band]
+            if move == _DIAGONAL:
+                middle.append((i - 1, j - 1))
+                i -= 1
+                j -= 1
+            elif move == _DELETE:
+                middle.append((i - 1, -1))
+                i -= 1
+            else:
+                middle.append((-1, j - 1))
+                j -= 1
+        for row_word, column_word in reversed(middle):
+            if swapped:
+                row_word, column_word = column_word, row_word
+            pairs.append((
+                i1 + row_word if row_word >= 0 else -1,
+                j1 + column_word if column_word >= 0 else -1
+            ))
+
+    pairs.extend((i2 + offset, j2 + offset) for offset in range(suffix))
+    return pairs
+
+
+def align_words(
+    original: List[str],
+    corrected: List[str],
+    max_band: int = MAX_BAND
+) -> List[Tuple[int, int]]:
+    """
+    Align two word sequences
+
+    Identical words are matched, and words differing only in case or
+    punctuation are preferred over other substitutions. Runs anchored by
+    word n-grams unique to both texts are matched directly (as patience
+    diff does); each stretch between anchors, less its common prefix and
+    suffix, is aligned by a banded dynamic program whose band doubles
+    until no path outside it can be cheaper. The band follows the line
+    between the stretch's corners, so a correction much shorter or longer
+    than the transcript costs no more than an equal-length one; the work
+    grows linearly with the text. A stretch that reaches max_band or
+    MAX_CELLS still gets a valid, possibly non-minimal alignment.
+
+    Args:
+        original: Words of the original text
+        corrected: Words of the corrected text
+        max_band: Widest band tried
+
+    Returns:
+        Pairs (i, j) in text order: i indexes original, j corrected; i is -1
+        for an inserted corrected word, j is -1 for a deleted original word
+    """
+    pairs: List[Tuple[int, int]] = []
+    i, j = 0, 0
+    for anchor_i, anchor_j, length in _anchors(original, corrected) + [(len(original), len(corrected), 0)]:
+        pairs.extend(_align_gap(original, corrected, i, anchor_i, j, anchor_j, max_band))
+        pairs.extend((anchor_i + offset, anchor_j + offset) for offset in range(length))
+        i, j = anchor_i + length, anchor_j + length
+    return pairs
+
+
+def get_opcodes(original: List[str], corrected: List[str], pairs: List[Tuple[int, int]]) -> List[Tuple]:
+    """
+    Group an alignment into difflib-style opcodes
+
+    Returns:
+        [(tag, i1, i2, j1, j2)] with tag 'equal', 'replace', 'delete' or 'insert'
+    """
+    opcodes = []
+    i1 = j1 = 0
+    i, j = 0, 0
+    equal = None
+    for a, b in pairs:
+        is_equal = a >= 0 and b >= 0 and original[a] == corrected[b]
+        if is_equal != equal and (i > i1 or j > j1):
+            opcodes.append((_tag(equal, i - i1, j - j1), i1, i, j1, j))
+            i1, j1 = i, j
+        equal = is_equal
+        i += a >= 0
+        j += b >= 0
+    if i > i1 or j > j1:
+        opcodes.append((_tag(equal, i - i1, j - j1), i1, i, j1, j))
+    return opcodes
+
+
+def _tag(equal: bool, original_count: int, corrected_count: int) -> str:
+    if equal:
+        return "equal"
+    if original_count and corrected_count:
+        return "replace"
+    return "delete" if original_count else "insert"
+
+
+def count_changes(original: str, corrected: str) -> Dict:
+    """
+    Word-level change statistics between two texts
+
+    Returns:
+        {word_changes, additions, deletions, similarity_ratio} where
+        similarity_ratio is 2 * matched words / total words (as difflib)
+    """
+    original_words = original.split()
+    corrected_words = corrected.split()
+    opcodes = get_opcodes(original_words, corrected_words, align_words(original_words, corrected_words))
+
+    changes = {'word_changes': 0, 'additions': 0, 'deletions': 0}
+    matched = 0
+    for tag, i1, i2, j1, j2 in opcodes:
+        if tag == 'equal':
+            matched += i2 - i1
+        elif tag == 'replace':
+            changes['word_changes'] += max(i2 - i1, j2 - j1)
+        elif tag == 'delete':
+            changes['deletions'] += i2 - i1
+        elif tag == 'insert':
+            changes['additions'] += j2 - j1
+
+    total = len(original_words) + len(corrected_words)
+    changes['similarity_ratio'] = 2.0 * matched / total if total else 1.0
+    return changes
+
+
+def _timeline(segments: List[Dict]) -> Tuple[List[str], List[float], List[float], List[int], List[float]]:
+    """
+    Flatten transcript segments into words with times
+
+    Segments without word timestamps have their text words spread evenly
+    over the segment.
+
+    Returns:
+        (words, starts, ends, segment index per word, probabilities)
+    """
+    words, starts, ends, owners, probabilities = [], [], [], [], []
+    for index, segment in enumerate(segments):
+        segment_words = segment.get("words") or []
+        if segment_words:
+            for word in segment_words:
+                text = word.get("word", "").strip()
+                if text:
+                    words.append(text)
+                    starts.append(word.get("start", segment["start"]))
+                    ends.append(word.get("end", segment["end"]))
+                    owners.append(index)
+                    probabilities.append(word.get("probability", 1.0))
+        else:
+            texts = segment.get("text", "").split()
+            step = (segment["end"] - segment["start"]) / max(len(texts), 1)
+            for position, text in enumerate(texts):
+                words.append(text)
+                starts.append(segment["start"] + position * step)
+                ends.append(segment["start"] + (position + 1) * step)
+                owners.append(index)
+                probabilities.append(1.0)
+    return words, starts, ends, owners, probabilities
+
+
+def _span_deleted(edits: List[Tuple[int, int]], word_times: List, starts: List[float], ends: List[float]):
+    """Extend substituted words over the deleted original words of their run of edits"""
+    # Deletions go to the preceding substitution, or the first one if none precedes
+    target = next((j for i, j in edits if i >= 0 and j >= 0), None)
+    for i, j in edits:
+        if i >= 0 and j >= 0:
+            target = j
+        elif j < 0 and target is not None:
+            start, end = word_times[target]
+            word_times[target] = (min(start, starts[i]), max(end, ends[i]))
+
+
+def align_segments(segments: List[Dict], corrected_text: str) -> List[Dict]:
+    """
+    Map corrected text onto the original word timeline
+
+    Each corrected word aligned to an original word takes that word's
+    start/end (and, if unchanged, its probability), widened over original
+    words deleted in the same edit (merged words). Inserted words share
+    the time between their aligned neighbours evenly. Words are grouped
+    into the segments of the original words they align to (inserted words
+    join the segment of the preceding original word), so segment
+    boundaries are kept; segments whose words were all deleted are dropped.
+
+    Args:
+        segments: Transcript segments (transcribe() format)
+        corrected_text: Corrected text of the whole transcript
+
+    Returns:
+        Corrected segments in the transcribe() format, with word timestamps
+    """
+    words, starts, ends, owners, probabilities = _timeline(segments)
+    corrected = corrected_text.split()
+    if not words or not corrected:
+        return []
+
+    pairs = align_words(words, corrected)
+
+    # Times, owning segment and probability per corrected word (None for inserted)
+    word_times: List[Optional[Tuple[float, float]]] = [None] * len(corrected)
+    word_owner = [0] * len(corrected)
+    word_probability = [1.0] * len(corrected)
+    owner = owners[0]
+    for i, j in pairs:
+        if i >= 0:
+            owner = owners[i]
+        if j < 0:
+            continue
+        word_owner[j] = owner
+        if i >= 0:
+            word_times[j] = (starts[i], ends[i])
+            if words[i] == corrected[j]:
+                word_probability[j] = probabilities[i]
+
+    # A word replacing several (e.g. "power house" -> "powerhouse") spans the
+    # original words deleted within the same run of edits
+    edits: List[Tuple[int, int]] = []
+    for i, j in pairs + [(-1, -1)]:
+        if (i, j) != (-1, -1) and not (i >= 0 and j >= 0 and words[i] == corrected[j]):
+            edits.append((i, j))
+            continue
+        _span_deleted(edits, word_times, starts, ends)
+        edits = []
+
+    # Spread runs of inserted words over the gap between aligned neighbours
+    j = 0
+    while j < len(corrected):
+        if word_times[j] is not None:
+            j += 1
+            continue
+        run_end = j
+        while run_end < len(corrected) and word_times[run_end] is None:
+            run_end += 1
+        gap_start = word_times[j - 1][1] if j > 0 else segments[word_owner[j]]["start"]
+        if run_end < len(corrected):
+            gap_end = max(gap_start, word_times[run_end][0])
+        else:
+            gap_end = max(gap_start, segments[word_owner[j]]["end"])
+        step = (gap_end - gap_start) / (run_end - j)
+        for position in range(j, run_end):
+            offset = position - j
+            word_times[position] = (gap_start + offset * step, gap_start + (offset + 1) * step)
+        j = run_end
+
+    corrected_segments: List[Dict] = []
+    for j, word in enumerate(corrected):
+        source = segments[word_owner[j]]
+        if not corrected_segments or corrected_segments[-1]["_index"] != word_owner[j]:
+            corrected_segments.append({
+                "_index": word_owner[j],
+                "start": source["start"],
+                "end": source["end"],
+                "language": source.get("language"),
+                "words": []
+            })
+        start, end = word_times[j]
+        corrected_segments[-1]["words"].append({
+            "word": word,
+            "start": round(start, TIME_DECIMALS),
+            "end": round(end, TIME_DECIMALS),
+            "probability": word_probability[j]
+        })
+
+    for segment in corrected_segments:
+        del segment["_index"]
+        segment["text"] = " ".join(word["word"] for word in segment["words"])
+        segment["start"] = min(segment["start"], segment["words"][0]["start"])
+        segment["end"] = max(segment["end"], segment["words"][-1]["end"])
+
+    return [
+        {key: segment[key] for key in ("start", "end", "text", "language", "words")}
+        for segment in corrected_segments
+    ]
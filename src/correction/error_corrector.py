@@ -4,19 +4,18 @@ Combines rule-based and ML-based correction for Filipino-English text
 """
 import time
 import re
-from typing import Optional, List
+from dataclasses import replace
+from typing import Optional, List, Dict, Iterable, Iterator
 import logging
 
-# Optional ML dependencies (only needed if use_ml=True)
-try:
-    import torch
-    from transformers import T5ForConditionalGeneration, T5Tokenizer
-    HAS_ML_DEPS = True
-except ImportError:
-    HAS_ML_DEPS = False
-    torch = None
-    T5ForConditionalGeneration = None
-    T5Tokenizer = None
+from utils.lazy import is_available, lazy_import
+
+# Optional ML dependencies (only needed if use_ml=True). They are checked
+# without importing and only imported when an ML model is loaded, so
+# rules-only correction never pays for torch/transformers.
+HAS_ML_DEPS = is_available("torch") and is_available("transformers")
+torch = lazy_import("torch") if HAS_ML_DEPS else None
+transformers = lazy_import("transformers") if HAS_ML_DEPS else None
 
 from .rules import CorrectionRules
 from .models import (
@@ -27,6 +26,42 @@ from .models import (
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Padded token budget per ML generate call (batch size x longest prompt)
+DEFAULT_MAX_BATCH_TOKENS = 4096
+
+
+def plan_micro_batches(lengths: List[int], max_batch_tokens: int) -> List[List[int]]:
+    """
+    Pack items into length-sorted micro-batches under a padded token budget
+
+    Sorting by length keeps similar-length prompts together, which
+    minimises padding. A batch costs len(batch) * longest item tokens.
+
+    Args:
+        lengths: Token length of each item
+        max_batch_tokens: Maximum padded tokens per batch
+
+    Returns:
+        Lists of item indices, one list per micro-batch
+    """
+    batches = []
+    current = []
+    longest = 0
+
+    for index in sorted(range(len(lengths)), key=lambda i: lengths[i]):
+        candidate_longest = max(longest, lengths[index])
+        if current and candidate_longest * (len(current) + 1) > max_batch_tokens:
+            batches.append(current)
+            current = []
+            candidate_longest = lengths[index]
+        current.append(index)
+        longest = candidate_longest
+
+    if current:
+        batches.append(current)
+
+    return batches
+
 
 class ErrorCorrector:
     """
@@ -58,8 +93,9 @@ class ErrorCorrector:
         self.ml_model = None
         self.tokenizer = None
 
+        # Only ML inference can use a GPU (checking would import torch)
         if device is None:
-            device = "cuda" if (torch and torch.cuda.is_available()) else "cpu"
+            device = "cuda" if (self.use_ml and torch.cuda.is_available()) else "cpu"
         self.device = device
 
         # Load ML model if requested and dependencies available
@@ -70,8 +106,8 @@ class ErrorCorrector:
         if self.use_ml:
             try:
                 logger.info(f"Loading correction model: {model_name}")
-                self.tokenizer = T5Tokenizer.from_pretrained(model_name)
-                self.ml_model = T5ForConditionalGeneration.from_pretrained(model_name)
+                self.tokenizer = transformers.T5Tokenizer.from_pretrained(model_name)
+                self.ml_model = transformers.T5ForConditionalGeneration.from_pretrained(model_name)
                 self.ml_model.to(self.device)
                 self.ml_model.eval()
                 logger.info(f"✅ Correction model loaded on {self.device}")
@@ -99,6 +135,55 @@ class ErrorCorrector:
             config = CorrectionConfig()
 
         start_time = time.time()
+
+        # Steps 1-2: Detect language and apply rule-based corrections
+        corrected_text, changes, language = self._apply_rule_stage(text, config)
+
+        # Step 3: Apply ML-based corrections (if available and enabled)
+        if self._wants_ml(config):
+            ml_corrected, ml_confidence = self._ml_correct(
+                corrected_text,
+                language,
+                config.level
+            )
+            corrected_text = self._merge_ml_correction(
+                corrected_text, ml_corrected, ml_confidence, changes, config
+            )
+
+        return self._build_result(
+            text, corrected_text, changes, language, config,
+            time.time() - start_time
+        )
+
+    def warmup(self) -> float:
+        """
+        Run one correction so the first request skips first-call setup
+
+        Returns:
+            Warm-up time in seconds
+        """
+        start_time = time.time()
+        self.correct("salamat po sa inyong tulong, see you tomorrow")
+        return round(time.time() - start_time, 3)
+
+    def memory_mb(self) -> float:
+        """Memory held by the ML model weights (0 in rules-only mode)"""
+        if self.ml_model is None:
+            return 0.0
+        total_bytes = sum(p.element_size() * p.nelement() for p in self.ml_model.parameters())
+        return total_bytes / 1024 ** 2
+
+    def _apply_rule_stage(
+        self,
+        text: str,
+        config: CorrectionConfig
+    ) -> tuple[str, List[CorrectionChange], str]:
+        """
+        Detect language and apply rule-based corrections
+
+        Returns:
+            (corrected_text, changes, language)
+        """
         changes = []
         corrected_text = text
 
@@ -120,21 +205,38 @@ class ErrorCorrector:
                     description=change_desc
                 ))
 
-        # Step 3: Apply ML-based corrections (if available and enabled)
-        if config.use_ml and self.use_ml and self.ml_model is not None:
-            ml_corrected, ml_confidence = self._ml_correct(
-                corrected_text,
-                language,
-                config.level
-            )
+        return corrected_text, changes, language
 
-            # Only apply ML correction if confidence is high enough
-            if ml_confidence >= config.min_confidence and ml_corrected != corrected_text:
-                # Track ML changes
-                ml_changes = self._find_differences(corrected_text, ml_corrected)
-                changes.extend(ml_changes)
-                corrected_text = ml_corrected
+    def _wants_ml(self, config: CorrectionConfig) -> bool:
+        """Check if ML correction should run for this config"""
+        return config.use_ml and self.use_ml and self.ml_model is not None
 
+    def _merge_ml_correction(
+        self,
+        corrected_text: str,
+        ml_corrected: str,
+        ml_confidence: float,
+        changes: List[CorrectionChange],
+        config: CorrectionConfig
+    ) -> str:
+        """Accept the ML output if confident enough, recording its changes"""
+        # Only apply ML correction if confidence is high enough
+        if ml_confidence >= config.min_confidence and ml_corrected != corrected_text:
+            # Track ML changes
+            changes.extend(self._find_differences(corrected_text, ml_corrected))
+            return ml_corrected
+        return corrected_text
+
+    def _build_result(
+        self,
+        text: str,
+        corrected_text: str,
+        changes: List[CorrectionChange],
+        language: str,
+        config: CorrectionConfig,
+        processing_time: float
+    ) -> CorrectionResult:
+        """Final cleanup, confidence and method bookkeeping"""
         # Step 4: Final cleanup
         corrected_text = self._final_cleanup(corrected_text)
 
@@ -144,8 +246,6 @@ class ErrorCorrector:
         else:
             confidence = 1.0 if corrected_text == text else 0.8
 
-        processing_time = time.time() - start_time
-
         # Determine method used
         method = "rules" if not self.use_ml else ("ml" if not config.use_rules else "hybrid")
 
@@ -181,44 +281,81 @@ class ErrorCorrector:
         if self.ml_model is None:
             return text, 0.0
 
-        try:
-            # Prepare prompt based on language and level
-            prompt = self._create_ml_prompt(text, language, level)
-
-            # Tokenize
-            inputs = self.tokenizer(
-                prompt,
-                return_tensors="pt",
-                max_length=512,
-                truncation=True
-            ).to(self.device)
-
-            # Generate correction
-            with torch.no_grad():
-                outputs = self.ml_model.generate(
-                    **inputs,
-                    max_length=512,
-                    num_beams=4,
-                    early_stopping=True,
-                    output_scores=True,
-                    return_dict_in_generate=True
-                )
+        return self._ml_correct_batch([text], language, level)[0]
 
-            # Decode
-            corrected = self.tokenizer.decode(outputs.sequences[0], skip_special_tokens=True)
+    def _ml_correct_batch(
+        self,
+        texts: List[str],
+        language: str,
+        level: CorrectionLevel,
+        max_batch_tokens: int = DEFAULT_MAX_BATCH_TOKENS
+    ) -> List[tuple[str, float]]:
+        """
+        Apply ML-based correction to texts sharing one prompt
 
-            # Calculate confidence from generation scores
-            # This is a simplified confidence metric
-            if hasattr(outputs, 'sequences_scores'):
-                confidence = torch.exp(outputs.sequences_scores[0]).item()
-            else:
-                confidence = 0.8  # Default confidence
+        Prompts are tokenized once, sorted by length and packed into
+        micro-batches of at most max_batch_tokens (padded) tokens, each
+        decoded with a single generate call.
 
-            return corrected, min(confidence, 1.0)
+        Args:
+            texts: Texts to correct
+            language: Language hint (shared by all texts)
+            level: Correction level (shared by all texts)
+            max_batch_tokens: Padded token budget per generate call
+
+        Returns:
+            (corrected_text, confidence_score) per text, in input order
+        """
+        if self.ml_model is None:
+            return [(text, 0.0) for text in texts]
+
+        results = [(text, 0.0) for text in texts]
+
+        try:
+            # Prepare prompts based on language and level
+            prompts = [self._create_ml_prompt(text, language, level) for text in texts]
+
+            # Tokenize once; padding happens per micro-batch
+            encodings = self.tokenizer(prompts, max_length=512, truncation=True)
+            lengths = [len(ids) for ids in encodings["input_ids"]]
+
+            for batch in plan_micro_batches(lengths, max_batch_tokens):
+                inputs = self.tokenizer.pad(
+                    {
+                        "input_ids": [encodings["input_ids"][i] for i in batch],
+                        "attention_mask": [encodings["attention_mask"][i] for i in batch]
+                    },
+                    return_tensors="pt"
+                ).to(self.device)
+
+                # Generate corrections for the whole micro-batch
+                with torch.no_grad():
+                    outputs = self.ml_model.generate(
+                        **inputs,
+                        max_length=512,
+                        num_beams=4,
+                        early_stopping=True,
+                        output_scores=True,
+                        return_dict_in_generate=True
+                    )
+
+                # Decode
+                decoded = self.tokenizer.batch_decode(outputs.sequences, skip_special_tokens=True)
+
+                # Calculate per-sequence confidence from generation scores
+                # This is a simplified confidence metric
+                if getattr(outputs, 'sequences_scores', None) is not None:
+                    confidences = torch.exp(outputs.sequences_scores).tolist()
+                else:
+                    confidences = [0.8] * len(batch)  # Default confidence
+
+                for position, index in enumerate(batch):
+                    results[index] = (decoded[position], min(confidences[position], 1.0))
 
         except Exception as e:
             logger.error(f"ML correction failed: {e}")
-            return text, 0.0
+
+        return results
 
     def _create_ml_prompt(self, text: str, language: str, level: CorrectionLevel) -> str:
         """Create prompt for ML model based on language and level"""
@@ -335,19 +472,124 @@ class ErrorCorrector:
     def correct_batch(
         self,
         texts: List[str],
-        config: Optional[CorrectionConfig] = None
+        config: Optional[CorrectionConfig] = None,
+        max_batch_tokens: int = DEFAULT_MAX_BATCH_TOKENS
     ) -> List[CorrectionResult]:
         """
         Correct multiple texts
 
+        Rules run per text; ML correction runs batched, one generate call
+        per micro-batch of texts sharing the same language/level prompt.
+
         Args:
             texts: List of texts to correct
             config: Correction configuration
+            max_batch_tokens: Padded token budget per ML generate call
 
         Returns:
             List of CorrectionResults
         """
-        return [self.correct(text, config) for text in texts]
+        if config is None:
+            config = CorrectionConfig()
+
+        return self._correct_many(texts, [config] * len(texts), max_batch_tokens)
+
+    def _correct_many(
+        self,
+        texts: List[str],
+        configs: List[CorrectionConfig],
+        max_batch_tokens: int = DEFAULT_MAX_BATCH_TOKENS
+    ) -> List[CorrectionResult]:
+        """Correct texts with per-item configs, batching the ML stage"""
+        staged = []
+        elapsed = []
+        for text, config in zip(texts, configs):
+            start_time = time.time()
+            staged.append(self._apply_rule_stage(text, config))
+            elapsed.append(time.time() - start_time)
+
+        # Group ML work by prompt (language + level)
+        groups: Dict[tuple, List[int]] = {}
+        for index, config in enumerate(configs):
+            if self._wants_ml(config):
+                language = staged[index][2]
+                groups.setdefault((language, config.level), []).append(index)
+
+        for (language, level), indices in groups.items():
+            start_time = time.time()
+            ml_results = self._ml_correct_batch(
+                [staged[i][0] for i in indices], language, level, max_batch_tokens
+            )
+            # Share the batch time across its items
+            batch_share = (time.time() - start_time) / len(indices)
+
+            for index, (ml_corrected, ml_confidence) in zip(indices, ml_results):
+                corrected_text, changes, _ = staged[index]
+                corrected_text = self._merge_ml_correction(
+                    corrected_text, ml_corrected, ml_confidence, changes, configs[index]
+                )
+                staged[index] = (corrected_text, changes, language)
+                elapsed[index] += batch_share
+
+        return [
+            self._build_result(text, corrected_text, changes, language, config, seconds)
+            for text, (corrected_text, changes, language), config, seconds
+            in zip(texts, staged, configs, elapsed)
+        ]
+
+    def correct_transcript(
+        self,
+        segments: Iterable[Dict],
+        config: Optional[CorrectionConfig] = None,
+        batch_size: int = 16
+    ) -> Iterator[CorrectionResult]:
+        """
+        Correct a transcript segment by segment
+
+        Consumes the segments produced by WhisperASR.transcribe lazily and
+        yields one result per segment, so memory stays bounded and each ML
+        input stays inside the model window. Each segment's own language
+        tag is used unless config.language_hint is set. Segments are
+        corrected in chunks of batch_size so ML inference can be batched.
+
+        Args:
+            segments: Transcript segments (dicts with text, start, end, language)
+            config: Correction configuration
+            batch_size: Segments corrected together per chunk
+
+        Yields:
+            CorrectionResult per segment, with start/end timestamps
+        """
+        if config is None:
+            config = CorrectionConfig()
+
+        chunk = []
+        for segment in segments:
+            chunk.append(segment)
+            if len(chunk) >= batch_size:
+                yield from self._correct_segment_chunk(chunk, config)
+                chunk = []
+
+        if chunk:
+            yield from self._correct_segment_chunk(chunk, config)
+
+    def _correct_segment_chunk(
+        self,
+        segments: List[Dict],
+        config: CorrectionConfig
+    ) -> List[CorrectionResult]:
+        """Correct a chunk of segments, keeping their timestamps"""
+        configs = [
+            replace(config, language_hint=config.language_hint or segment.get("language"))
+            for segment in segments
+        ]
+        results = self._correct_many([segment.get("text", "") for segment in segments], configs)
+
+        for segment, result in zip(segments, results):
+            result.start = segment.get("start")
+            result.end = segment.get("end")
+
+        return results
 
 
 # Quick test
@@ -44,6 +44,8 @@ class CorrectionResult:
     method: str = "hybrid"  # 'rules', 'ml', or 'hybrid'
     language: str = "mixed"  # 'en', 'tl', or 'mixed'
     processing_time: float = 0.0
+    start: Optional[float] = None  # Segment start time (transcript correction only)
+    end: Optional[float] = None  # Segment end time (transcript correction only)
 
     def get_changes_summary(self) -> Dict:
         """Get summary statistics of changes"""
@@ -71,7 +73,7 @@ class CorrectionResult:
 
     def to_dict(self) -> Dict:
         """Convert to dictionary for JSON serialization"""
-        return {
+        data = {
             "original_text": self.original_text,
             "corrected_text": self.corrected_text,
             "changes": [
@@ -91,6 +93,13 @@ class CorrectionResult:
             "summary": self.get_changes_summary()
         }
 
+        # Segment timestamps are only present for transcript corrections
+        if self.start is not None:
+            data["start"] = self.start
+            data["end"] = self.end
+
+        return data
+
 
 @dataclass
 class CorrectionConfig:
@@ -4,8 +4,8 @@ Handles common ASR errors specific to Philippine classroom lectures
 """
 import re
 import logging
-from typing import Dict, List, Tuple
-from dataclasses import dataclass
+from typing import Dict, List, Optional, Pattern, Tuple
+from dataclasses import dataclass, field
 
 # Import Tagalog-specific corrections
 from .rules_tl import (
@@ -17,6 +17,21 @@ from .rules_tl import (
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Trie key marking the end of a phrase (never collides with a single character)
+_PHRASE_END = ''
+
+
+# Rule patterns that are a single literal word, e.g. r'\bdat\b(?!\w)'
+_LITERAL_WORD_PATTERN = re.compile(r'^\\b(\w+)\\b(?:\(\?!\\w\))?$')
+
+_SENTENCE_BOUNDARY = re.compile(r'([.!?]+\s+)')
+_WHITESPACE = re.compile(r'\s+')
+
+
+def _is_word_char(ch: str) -> bool:
+    """Match the definition of \\w used by re for str patterns"""
+    return ch.isalnum() or ch == '_'
+
 
 @dataclass
 class CorrectionRule:
@@ -27,6 +42,91 @@ class CorrectionRule:
     language: str  # 'en', 'tl', 'both'
 
 
+@dataclass
+class CompiledRuleStep:
+    """
+    One precompiled step of a rule plan
+
+    A regex step holds a single rule. A literal step merges a run of
+    consecutive literal-word rules into one alternation with a capture
+    group per rule, so the whole run is handled by a single sub().
+    """
+    pattern: Pattern
+    rules: List[CorrectionRule] = field(default_factory=list)
+    literal: bool = False
+
+
+class PhraseMatcher:
+    """
+    Trie of literal phrases matched in a single left-to-right scan
+
+    Equivalent to trying r'\\b<phrase>\\b' (case-insensitive) for every phrase,
+    but the cost depends on the length of the text and the longest phrase
+    rather than on the number of phrases. Matches only start at word starts,
+    and the longest phrase ending on a word boundary wins.
+    """
+
+    def __init__(self, phrases: Dict[str, str]):
+        self.phrases = list(phrases.items())
+        self.root: Dict = {}
+
+        for index, (phrase, _) in enumerate(self.phrases):
+            node = self.root
+            for ch in phrase.lower():
+                node = node.setdefault(ch, {})
+            node[_PHRASE_END] = index
+
+    def _longest_match(self, text: str, start: int) -> Tuple[int, int]:
+        """Return (end, phrase_index) of the longest phrase at start, or (-1, -1)"""
+        node = self.root
+        best = (-1, -1)
+        pos = start
+        length = len(text)
+
+        while pos < length:
+            node = node.get(text[pos].lower())
+            if node is None:
+                break
+            pos += 1
+            if _PHRASE_END in node and (pos == length or not _is_word_char(text[pos])):
+                best = (pos, node[_PHRASE_END])
+
+        return best
+
+    def replace(self, text: str) -> Tuple[str, List[Tuple[str, str]]]:
+        """
+        Replace every phrase occurrence in one pass
+
+        Args:
+            text: Input text
+
+        Returns:
+            (replaced_text, matched (phrase, replacement) pairs in table order)
+        """
+        pieces = []
+        matched = set()
+        last = 0
+        pos = 0
+        length = len(text)
+
+        while pos < length:
+            if _is_word_char(text[pos]) and (pos == 0 or not _is_word_char(text[pos - 1])):
+                end, index = self._longest_match(text, pos)
+                if index >= 0:
+                    pieces.append(text[last:pos])
+                    pieces.append(self.phrases[index][1])
+                    matched.add(index)
+                    last = pos = end
+                    continue
+            pos += 1
+
+        if not matched:
+            return text, []
+
+        pieces.append(text[last:])
+        return ''.join(pieces), [self.phrases[i] for i in sorted(matched)]
+
+
 class CorrectionRules:
     """Collection of correction rules for Filipino-English text"""
 
@@ -38,6 +138,13 @@ class CorrectionRules:
 
         # Merge Tagalog corrections into common errors
         self.common_errors.update(ALL_TAGALOG_CORRECTIONS)
+
+        # Compile dictionaries once so each call is a single scan of the text
+        self.split_matcher = PhraseMatcher(self.tagalog_word_splits)
+        self.common_error_matcher = PhraseMatcher(self.common_errors)
+
+        # Precompile pattern rules into one plan per language filter
+        self.rule_plans = self._compile_rule_plans(self.rules)
         logger.info(f"[Rules] Loaded {len(self.rules)} pattern rules + {len(self.tagalog_word_splits)} word splits + {len(ALL_TAGALOG_CORRECTIONS)} Tagalog corrections")
 
     def _load_rules(self) -> List[CorrectionRule]:
@@ -202,6 +309,79 @@ class CorrectionRules:
 
         return rules
 
+    def _compile_rule_plans(self, rules: List[CorrectionRule]) -> Dict[str, List[CompiledRuleStep]]:
+        """
+        Precompile rules into ordered plans keyed by language filter
+
+        'en' and 'tl' hold their own rules plus the 'both' rules, 'both'
+        holds every rule (used for 'both' and 'mixed' input), and 'shared'
+        holds only the 'both' rules (used for any other language value).
+        """
+        buckets = {
+            'en': [r for r in rules if r.language in ('en', 'both')],
+            'tl': [r for r in rules if r.language in ('tl', 'both')],
+            'both': list(rules),
+            'shared': [r for r in rules if r.language == 'both'],
+        }
+        return {key: self._compile_plan(bucket) for key, bucket in buckets.items()}
+
+    def _compile_plan(self, rules: List[CorrectionRule]) -> List[CompiledRuleStep]:
+        """Compile rules in order, merging runs of literal-word rules"""
+        plan = []
+        run = []
+
+        def flush_run():
+            if len(run) == 1:
+                plan.append(CompiledRuleStep(re.compile(run[0].pattern, re.IGNORECASE), [run[0]]))
+            elif run:
+                words = '|'.join(
+                    f"({_LITERAL_WORD_PATTERN.match(r.pattern).group(1)})" for r in run
+                )
+                plan.append(CompiledRuleStep(
+                    re.compile(r'\b(?:' + words + r')\b', re.IGNORECASE),
+                    list(run),
+                    literal=True
+                ))
+            run.clear()
+
+        for rule in rules:
+            if self._is_literal_rule(rule):
+                run.append(rule)
+            else:
+                flush_run()
+                plan.append(CompiledRuleStep(re.compile(rule.pattern, re.IGNORECASE), [rule]))
+        flush_run()
+
+        return plan
+
+    def _is_literal_rule(self, rule: CorrectionRule) -> bool:
+        """Check if a rule replaces one literal word with fixed text"""
+        return bool(_LITERAL_WORD_PATTERN.match(rule.pattern)) and '\\' not in rule.replacement
+
+    def _get_rule_plan(self, language: Optional[str]) -> List[CompiledRuleStep]:
+        """Get the precompiled plan for a language filter"""
+        # For mixed language text, apply ALL rules (both en and tl)
+        # This handles Filipino-English code-switching properly
+        if language in ('both', 'mixed'):
+            return self.rule_plans['both']
+        if language in ('en', 'tl'):
+            return self.rule_plans[language]
+        return self.rule_plans['shared']
+
+    def _apply_literal_step(self, step: CompiledRuleStep, text: str) -> Tuple[str, List[str]]:
+        """Apply a merged literal step, returning descriptions of rules that changed text"""
+        changed = set()
+
+        def dispatch(match):
+            index = match.lastindex - 1
+            replacement = step.rules[index].replacement
+            if match.group(0) != replacement:
+                changed.add(index)
+            return replacement
+
+        new_text = step.pattern.sub(dispatch, text)
+        return new_text, [step.rules[i].description for i in sorted(changed)]
+
     def _load_tagalog_dictionary(self) -> set:
         """Common Tagalog words for spell checking"""
         return {
@@ -273,16 +453,12 @@ class CorrectionRules:
         Returns:
             (corrected_text, list_of_changes)
         """
-        corrected = text
+        corrected, matched = self.split_matcher.replace(text)
         changes = []
 
-        for concatenated, split in self.tagalog_word_splits.items():
-            if concatenated in corrected.lower():
-                pattern = re.compile(r'\b' + re.escape(concatenated) + r'\b', re.IGNORECASE)
-                if pattern.search(corrected):
-                    corrected = pattern.sub(split, corrected)
-                    changes.append(f"Split: '{concatenated}' -> '{split}'")
-                    logger.debug(f"[Rules] Applied word split: '{concatenated}' -> '{split}'")
+        for concatenated, split in matched:
+            changes.append(f"Split: '{concatenated}' -> '{split}'")
+            logger.debug(f"[Rules] Applied word split: '{concatenated}' -> '{split}'")
 
         return corrected, changes
 
@@ -311,38 +487,28 @@ class CorrectionRules:
         if split_changes:
             logger.info(f"[Correction] Applied {len(split_changes)} word split(s)")
 
-        # Step 2: Apply common error corrections
-        for error, correction in self.common_errors.items():
-            if error in corrected.lower():
-                pattern = re.compile(r'\b' + re.escape(error) + r'\b', re.IGNORECASE)
-                if pattern.search(corrected):
-                    corrected = pattern.sub(correction, corrected)
-                    changes.append(f"'{error}' -> '{correction}'")
-
-        # Apply pattern-based rules
-        for rule in self.rules:
-            # For mixed language text, apply ALL rules (both en and tl)
-            # This handles Filipino-English code-switching properly
-            should_apply = (
-                language == 'both' or
-                rule.language == 'both' or
-                rule.language == language or
-                language == 'mixed'  # Apply all rules for code-switched text
-            )
-
-            if should_apply:
-                pattern = re.compile(rule.pattern, re.IGNORECASE)
-                if pattern.search(corrected):
-                    new_text = pattern.sub(rule.replacement, corrected)
-                    if new_text != corrected:
-                        changes.append(f"{rule.description}")
-                        corrected = new_text
+        # Step 2: Apply common error corrections (single pass, longest match wins)
+        corrected, matched = self.common_error_matcher.replace(corrected)
+        for error, correction in matched:
+            changes.append(f"'{error}' -> '{correction}'")
+
+        # Apply pattern-based rules (precompiled, pre-filtered by language)
+        for step in self._get_rule_plan(language):
+            if step.literal:
+                corrected, literal_changes = self._apply_literal_step(step, corrected)
+                changes.extend(literal_changes)
+            else:
+                rule = step.rules[0]
+                new_text = step.pattern.sub(rule.replacement, corrected)
+                if new_text != corrected:
+                    changes.append(f"{rule.description}")
+                    corrected = new_text
 
         # Capitalize sentences
         corrected = self._capitalize_sentences(corrected)
 
         # Clean up extra spaces
-        corrected = re.sub(r'\s+', ' ', corrected).strip()
+        corrected = _WHITESPACE.sub(' ', corrected).strip()
 
         logger.info(f"[Correction] Applied {len(changes)} correction(s)")
         if changes:
@@ -353,7 +519,7 @@ class CorrectionRules:
     def _capitalize_sentences(self, text: str) -> str:
         """Capitalize the first letter of each sentence"""
         # Split on sentence boundaries
-        sentences = re.split(r'([.!?]+\s+)', text)
+        sentences = _SENTENCE_BOUNDARY.split(text)
 
         result = []
         for i, part in enumerate(sentences):
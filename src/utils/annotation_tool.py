@@ -3,6 +3,7 @@ Simple Annotation Tool for Creating ASR Correction Pairs
 Streamlit-based interface for annotating transcripts
 """
 import os
+import sys
 import json
 import pandas as pd
 import streamlit as st
@@ -13,6 +14,12 @@ import soundfile as sf
 import numpy as np
 from pathlib import Path
 
+# Make the src packages importable under `streamlit run src/utils/annotation_tool.py`
+sys.path.append(str(Path(__file__).parent.parent))
+
+from correction.alignment import align_segments, count_changes
+from utils.transcript_format import BINARY_SUFFIX, TranscriptFile, read_transcript
+
 # Page config
 st.set_page_config(
     page_title="Pulox Annotation Tool",
@@ -51,7 +58,7 @@ class AnnotationTool:
     def get_transcript_files(self) -> List[str]:
         """Get list of transcript files"""
         files = []
-        for ext in ['*.json', '*.txt']:
+        for ext in ['*.json', '*.txt', f'*{BINARY_SUFFIX}']:
             files.extend(self.transcripts_dir.glob(ext))
         return sorted([f.name for f in files])
     
@@ -63,13 +70,23 @@ class AnnotationTool:
             with open(filepath, 'r', encoding='utf-8') as f:
                 data = json.load(f)
                 return data.get('text', '')
+        elif filename.endswith(BINARY_SUFFIX):
+            # The text is in the header; word columns are never read
+            with TranscriptFile(filepath) as transcript:
+                return transcript.header().get('text', '')
         else:
             with open(filepath, 'r', encoding='utf-8') as f:
                 return f.read()
     
+    def load_segments(self, filename: str) -> List[Dict]:
+        """Load a transcript's timed segments (none for plain text files)"""
+        if not filename.endswith(('.json', BINARY_SUFFIX)):
+            return []
+        return read_transcript(self.transcripts_dir / filename).get('segments', [])
+    
     def save_correction(self, filename: str, original: str, corrected: str, metadata: Dict):
-        """Save correction pair"""
-        correction_id = filename.replace('.json', '').replace('.txt', '')
+        """Save correction pair, with the corrected text aligned to the word timestamps"""
+        correction_id = filename.replace('.json', '').replace('.txt', '').replace(BINARY_SUFFIX, '')
         
         correction_data = {
             'id': correction_id,
@@ -77,7 +94,8 @@ class AnnotationTool:
             'original': original,
             'corrected': corrected,
             'metadata': metadata,
-            'changes': self.calculate_changes(original, corrected)
+            'changes': self.calculate_changes(original, corrected),
+            'segments': align_segments(self.load_segments(filename), corrected)
         }
         
         # Save to corrections directory
@@ -96,28 +114,8 @@ class AnnotationTool:
         return output_path
     
     def calculate_changes(self, original: str, corrected: str) -> Dict:
-        """Calculate statistics about changes made"""
-        orig_words = original.split()
-        corr_words = corrected.split()
-        
-        # Use difflib to find changes
-        matcher = difflib.SequenceMatcher(None, orig_words, corr_words)
-        changes = {
-            'word_changes': 0,
-            'additions': 0,
-            'deletions': 0,
-            'similarity_ratio': matcher.ratio()
-        }
-        
-        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
-            if tag == 'replace':
-                changes['word_changes'] += max(i2 - i1, j2 - j1)
-            elif tag == 'delete':
-                changes['deletions'] += i2 - i1
-            elif tag == 'insert':
-                changes['additions'] += j2 - j1
-        
-        return changes
+        """Calculate statistics about changes made (word alignment, see correction.alignment)"""
+        return count_changes(original, corrected)
 
 
 def render_annotation_interface():
@@ -191,7 +189,7 @@ def render_annotation_interface():
         st.subheader("✏️ Corrected Transcript")
         
         # Pre-fill with original if no correction exists
-        correction_file = selected_file.replace('.json', '').replace('.txt', '')
+        correction_file = selected_file.replace('.json', '').replace('.txt', '').replace(BINARY_SUFFIX, '')
         if correction_file in tool.annotations:
             st.info("✅ This file has been annotated")
             # Load existing correction
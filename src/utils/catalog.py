@@ -0,0 +1,603 @@
+"""
+Transcript Catalog
+SQLite index of transcript and correction headers and full-text search
+"""
+import os
+import re
+import sys
+import json
+import sqlite3
+import logging
+import argparse
+from bisect import bisect_right
+from contextlib import contextmanager
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS transcripts (
+    id TEXT PRIMARY KEY,
+    audio_file TEXT,
+    language TEXT,
+    duration REAL,
+    model TEXT,
+    timestamp TEXT,
+    mtime_ns INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_transcripts_timestamp ON transcripts (timestamp);
+CREATE INDEX IF NOT EXISTS idx_transcripts_language_timestamp ON transcripts (language, timestamp);
+CREATE INDEX IF NOT EXISTS idx_transcripts_duration ON transcripts (duration);
+
+CREATE TABLE IF NOT EXISTS corrections (
+    id TEXT PRIMARY KEY,
+    transcript_id TEXT,
+    timestamp TEXT,
+    annotator TEXT,
+    changes INTEGER,
+    mtime_ns INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_corrections_transcript ON corrections (transcript_id);
+CREATE INDEX IF NOT EXISTS idx_corrections_timestamp ON corrections (timestamp);
+CREATE INDEX IF NOT EXISTS idx_corrections_annotator_timestamp ON corrections (annotator, timestamp);
+
+CREATE TABLE IF NOT EXISTS segments (
+    id INTEGER PRIMARY KEY,
+    transcript_id TEXT NOT NULL,
+    source TEXT NOT NULL,
+    segment_index INTEGER NOT NULL,
+    start_time REAL,
+    end_time REAL,
+    text TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_segments_document ON segments (transcript_id, source, segment_index);
+
+-- unicode61 without stemming: an English stemmer would mangle Tagalog words,
+-- and folding diacritics lets "po" match "pó". Prefix indexes keep short
+-- prefix queries (e.g. "mag*") from expanding over the whole vocabulary
+CREATE VIRTUAL TABLE IF NOT EXISTS segments_fts USING fts5(
+    text, content='segments', content_rowid='id',
+    tokenize='unicode61 remove_diacritics 2', prefix='2 3 4'
+);
+CREATE TRIGGER IF NOT EXISTS segments_insert AFTER INSERT ON segments BEGIN
+    INSERT INTO segments_fts (rowid, text) VALUES (new.id, new.text);
+END;
+CREATE TRIGGER IF NOT EXISTS segments_delete AFTER DELETE ON segments BEGIN
+    INSERT INTO segments_fts (segments_fts, rowid, text) VALUES ('delete', old.id, old.text);
+END;
+"""
+
+# Bumped when tables are added; older catalogs are rebuilt by the next sync()
+SCHEMA_VERSION = 2
+
+# File name suffixes of the documents the catalog indexes (transcripts: JSON or binary)
+TRANSCRIPT_SUFFIXES = ("_transcript.json", "_transcript.ptx")
+CORRECTION_SUFFIXES = ("_corrected.json",)
+
+# Columns the listings may be sorted by
+TRANSCRIPT_SORTS = ("timestamp", "duration", "audio_file", "language")
+CORRECTION_SORTS = ("timestamp", "changes", "annotator")
+
+MAX_PAGE_SIZE = 1000
+
+# Searchable text sources
+TRANSCRIPT = "transcript"
+CORRECTION = "correction"
+
+# Search result orderings: best match first, or most recently indexed first
+SEARCH_ORDERS = ("relevance", "recent")
+
+# Relevance ranking scores at most this many (most recent) matches, so
+# very common terms cost the same as rare ones on a large index
+RELEVANCE_CANDIDATES = 5000
+
+_WORD = re.compile(r"\w+")
+_PHRASE = re.compile(r'"([^"]*)"|(\S+)')
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+
+def build_match_query(query: str) -> str:
+    """
+    Translate a user query into an FTS5 MATCH expression
+
+    Words are ANDed; "double quoted" text is a phrase; a trailing * makes
+    a word a prefix (useful for Tagalog affixed forms, e.g. aral*).
+    Punctuation never reaches FTS5, so any input is a valid query.
+    Hyphenated words (mag-aral) become phrases of their parts, matching
+    how the tokenizer splits them.
+
+    Raises:
+        ValueError: If the query has no words
+    """
+    terms = []
+    for phrase, word in _PHRASE.findall(query):
+        words = _WORD.findall(phrase or word)
+        if not words:
+            continue
+        term = '"' + " ".join(words) + '"'
+        if word and word.endswith("*"):
+            term += "*"
+        terms.append(term)
+
+    if not terms:
+        raise ValueError("Search query has no words")
+    return " ".join(terms)
+
+
+def _correction_chunks(text: str, transcript_segments: List[sqlite3.Row]) -> List[tuple]:
+    """
+    Split corrected text into sentences with approximate start/end times
+
+    For corrections saved without aligned segments (older files): each
+    sentence is placed at the transcript segments holding the same
+    relative word position, which is close enough to jump to the audio.
+
+    Returns:
+        [(start_time, end_time, text)] (times None without a transcript)
+    """
+    sentences = [sentence for sentence in _SENTENCE_END.split(text.strip()) if sentence]
+    corrected_words = sum(len(sentence.split()) for sentence in sentences)
+
+    # Cumulative word counts of the transcript segments
+    bounds = []
+    total = 0
+    for segment in transcript_segments:
+        total += len(segment["text"].split())
+        bounds.append(total)
+
+    chunks = []
+    position = 0
+    for sentence in sentences:
+        words = len(sentence.split())
+        if total and corrected_words:
+            scale = total / corrected_words
+            first = min(bisect_right(bounds, int(position * scale)), len(bounds) - 1)
+            last = min(bisect_right(bounds, max(0, int((position + words) * scale) - 1)), len(bounds) - 1)
+            chunks.append((transcript_segments[first]["start_time"], transcript_segments[last]["end_time"], sentence))
+        else:
+            chunks.append((None, None, sentence))
+        position += words
+    return chunks
+
+
+def _date_filters(column: str, date_from: Optional[str], date_to: Optional[str]) -> Tuple[List[str], List]:
+    """
+    WHERE clauses for an ISO timestamp range
+
+    A bare date as date_to includes that whole day.
+    """
+    clauses, params = [], []
+    if date_from:
+        clauses.append(f"{column} >= ?")
+        params.append(date_from)
+    if date_to:
+        if len(date_to) == 10:
+            clauses.append(f"{column} < ?")
+            params.append((date.fromisoformat(date_to) + timedelta(days=1)).isoformat())
+        else:
+            clauses.append(f"{column} <= ?")
+            params.append(date_to)
+    return clauses, params
+
+
+def _order_by(sort: str, order: str, allowed: Tuple[str, ...], table: str) -> str:
+    if sort not in allowed:
+        raise ValueError(f"Cannot sort by '{sort}' (choose from {', '.join(allowed)})")
+    if order not in ("asc", "desc"):
+        raise ValueError(f"Invalid order '{order}' (choose asc or desc)")
+    # Ties broken by id so pages are stable
+    return f" ORDER BY {table}.{sort} {order.upper()}, {table}.id {order.upper()}"
+
+
+class TranscriptCatalog:
+    """
+    Index of transcript and correction documents
+
+    Transcripts and corrections stay JSON files; the catalog holds the
+    few header fields the list views need, so listing, filtering and
+    paging run against indexes instead of parsing every document.
+    Transcript segments and corrected sentences are kept in an FTS5 index
+    with their start/end times, so search() finds where in which lecture
+    a term was said. The API updates the catalog on every write. sync()
+    picks up files written by other tools by re-reading only those whose
+    modification time changed.
+    """
+
+    def __init__(self, db_path: str):
+        """
+        Initialize catalog
+
+        Args:
+            db_path: SQLite database file
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+            self._needs_rebuild = conn.execute("PRAGMA user_version").fetchone()[0] < SCHEMA_VERSION
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Short-lived autocommit connection (safe to use from any thread)"""
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _transcript_row(data: Dict, mtime_ns: int) -> tuple:
+        return (
+            data.get("id"), data.get("audio_file"), data.get("language"),
+            data.get("duration"), data.get("model"), data.get("timestamp"), mtime_ns
+        )
+
+    @staticmethod
+    def _correction_row(data: Dict, mtime_ns: int) -> tuple:
+        return (
+            data.get("id"), data.get("transcript_id", data.get("id")),
+            data.get("timestamp"), (data.get("metadata") or {}).get("annotator"),
+            (data.get("changes") or {}).get("word_changes", 0), mtime_ns
+        )
+
+    def _upsert_transcripts(self, conn: sqlite3.Connection, rows: List[tuple]):
+        conn.executemany(
+            "INSERT OR REPLACE INTO transcripts "
+            "(id, audio_file, language, duration, model, timestamp, mtime_ns) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            rows
+        )
+
+    def _upsert_corrections(self, conn: sqlite3.Connection, rows: List[tuple]):
+        conn.executemany(
+            "INSERT OR REPLACE INTO corrections "
+            "(id, transcript_id, timestamp, annotator, changes, mtime_ns) VALUES (?, ?, ?, ?, ?, ?)",
+            rows
+        )
+
+    def _store_transcript(self, conn: sqlite3.Connection, data: Dict, mtime_ns: int):
+        """Upsert a transcript's header and replace its searchable segments"""
+        self._upsert_transcripts(conn, [self._transcript_row(data, mtime_ns)])
+        conn.execute("DELETE FROM segments WHERE transcript_id = ? AND source = ?", (data["id"], TRANSCRIPT))
+        conn.executemany(
+            "INSERT INTO segments (transcript_id, source, segment_index, start_time, end_time, text) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                (data["id"], TRANSCRIPT, index, segment.get("start"), segment.get("end"), segment.get("text", ""))
+                for index, segment in enumerate(data.get("segments") or [])
+            ]
+        )
+
+    def _store_correction(self, conn: sqlite3.Connection, data: Dict, mtime_ns: int):
+        """Upsert a correction's header and replace its searchable segments"""
+        row = self._correction_row(data, mtime_ns)
+        self._upsert_corrections(conn, [row])
+        transcript_id = row[1]
+        if data.get("segments"):
+            # Aligned onto word timestamps when saved (correction.alignment)
+            chunks = [(segment["start"], segment["end"], segment["text"]) for segment in data["segments"]]
+        else:
+            transcript_segments = conn.execute(
+                "SELECT start_time, end_time, text FROM segments "
+                "WHERE transcript_id = ? AND source = ? ORDER BY segment_index",
+                (transcript_id, TRANSCRIPT)
+            ).fetchall()
+            chunks = _correction_chunks(data.get("corrected") or "", transcript_segments)
+        conn.execute("DELETE FROM segments WHERE transcript_id = ? AND source = ?", (transcript_id, CORRECTION))
+        conn.executemany(
+            "INSERT INTO segments (transcript_id, source, segment_index, start_time, end_time, text) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                (transcript_id, CORRECTION, index, start, end, text)
+                for index, (start, end, text) in enumerate(chunks)
+            ]
+        )
+
+    def _store(self, store, data: Dict, path: Optional[Path]):
+        mtime_ns = path.stat().st_mtime_ns if path is not None else 0
+        with self._connect() as conn:
+            conn.execute("BEGIN")
+            store(conn, data, mtime_ns)
+            conn.execute("COMMIT")
+
+    def add_transcript(self, data: Dict, path: Optional[Path] = None):
+        """Index a transcript document and its segments (path: its saved file, for sync())"""
+        self._store(self._store_transcript, data, path)
+
+    def add_correction(self, data: Dict, path: Optional[Path] = None):
+        """Index a correction document and its text (path: its saved file, for sync())"""
+        self._store(self._store_correction, data, path)
+
+    def search(
+        self,
+        query: str,
+        limit: int = 20,
+        offset: int = 0,
+        source: Optional[str] = None,
+        language: Optional[str] = None,
+        transcript_id: Optional[str] = None,
+        order: str = "relevance"
+    ) -> Tuple[List[Dict], bool]:
+        """
+        Full-text search over transcript segments and corrections
+
+        Args:
+            query: Words, "phrases" and prefix* terms (see build_match_query)
+            limit: Page size (at most MAX_PAGE_SIZE)
+            offset: Hits to skip
+            source: Only TRANSCRIPT or CORRECTION text
+            language: Only transcripts in this language
+            transcript_id: Only this transcript
+            order: 'relevance' (BM25 over the RELEVANCE_CANDIDATES most
+                recent matches) or 'recent' (newest indexed first)
+
+        Returns:
+            (hits with transcript_id, source, segment_index, start, end,
+            text and a highlighted snippet; whether more hits follow)
+        """
+        if order not in SEARCH_ORDERS:
+            raise ValueError(f"Invalid order '{order}' (choose from {', '.join(SEARCH_ORDERS)})")
+
+        match = build_match_query(query)
+        clauses = ["segments_fts MATCH ?"]
+        params: List = [match]
+        if source:
+            clauses.append("s.source = ?")
+            params.append(source)
+        if transcript_id:
+            clauses.append("s.transcript_id = ?")
+            params.append(transcript_id)
+        if language:
+            clauses.append("t.language = ?")
+            params.append(language)
+
+        limit = min(limit, MAX_PAGE_SIZE)
+        from_sql = (
+            "FROM segments_fts JOIN segments s ON s.id = segments_fts.rowid "
+            "LEFT JOIN transcripts t ON t.id = s.transcript_id "
+        )
+        with self._connect() as conn:
+            if order == "relevance":
+                # Walking the match list by rowid is cheap; scoring it is not.
+                # The floor is taken over filtered matches, so a filter never
+                # leaves fewer than RELEVANCE_CANDIDATES candidates to rank
+                floor = conn.execute(
+                    "SELECT segments_fts.rowid " + from_sql + "WHERE " + " AND ".join(clauses)
+                    + " ORDER BY segments_fts.rowid DESC LIMIT 1 OFFSET ?",
+                    params + [RELEVANCE_CANDIDATES - 1]
+                ).fetchone()
+                if floor is not None:
+                    clauses.append("segments_fts.rowid >= ?")
+                    params.append(floor[0])
+
+            query_sql = (
+                "SELECT s.transcript_id, s.source, s.segment_index, s.start_time AS start, s.end_time AS end, "
+                "s.text, snippet(segments_fts, 0, '<mark>', '</mark>', '…', 16) AS snippet, "
+                "t.audio_file, t.language "
+                + from_sql + "WHERE " + " AND ".join(clauses)
+                + (" ORDER BY segments_fts.rank" if order == "relevance" else " ORDER BY segments_fts.rowid DESC")
+                + " LIMIT ? OFFSET ?"
+            )
+            rows = conn.execute(query_sql, params + [limit + 1, offset]).fetchall()
+
+        return [dict(row) for row in rows[:limit]], len(rows) > limit
+
+    def list_transcripts(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        sort: str = "timestamp",
+        order: str = "desc",
+        language: Optional[str] = None,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        has_correction: Optional[bool] = None,
+        annotator: Optional[str] = None
+    ) -> Tuple[List[Dict], int]:
+        """
+        One page of transcript headers
+
+        Args:
+            limit: Page size (at most MAX_PAGE_SIZE)
+            offset: Rows to skip
+            sort: One of TRANSCRIPT_SORTS
+            order: 'asc' or 'desc'
+            language: Only transcripts in this language
+            date_from: Only transcripts created at or after this ISO date/time
+            date_to: Only transcripts created up to this ISO date/time
+            has_correction: Only transcripts with (True) or without (False) a correction
+            annotator: Only transcripts corrected by this annotator
+
+        Returns:
+            (rows, total number of matching transcripts)
+        """
+        clauses, params = _date_filters("t.timestamp", date_from, date_to)
+        if language:
+            clauses.append("t.language = ?")
+            params.append(language)
+        if has_correction is not None:
+            clauses.append(("" if has_correction else "NOT ") + "EXISTS (SELECT 1 FROM corrections c WHERE c.transcript_id = t.id)")
+        if annotator:
+            clauses.append("EXISTS (SELECT 1 FROM corrections c WHERE c.transcript_id = t.id AND c.annotator = ?)")
+            params.append(annotator)
+        where = " WHERE " + " AND ".join(clauses) if clauses else ""
+
+        query = (
+            "SELECT t.id, t.audio_file, t.language, t.duration, t.timestamp, "
+            "EXISTS (SELECT 1 FROM corrections c WHERE c.transcript_id = t.id) AS has_correction "
+            "FROM transcripts t" + where + _order_by(sort, order, TRANSCRIPT_SORTS, "t") + " LIMIT ? OFFSET ?"
+        )
+        with self._connect() as conn:
+            total = conn.execute("SELECT COUNT(*) FROM transcripts t" + where, params).fetchone()[0]
+            rows = conn.execute(query, params + [min(limit, MAX_PAGE_SIZE), offset]).fetchall()
+
+        return [dict(row, has_correction=bool(row["has_correction"])) for row in rows], total
+
+    def list_corrections(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        sort: str = "timestamp",
+        order: str = "desc",
+        annotator: Optional[str] = None,
+        transcript_id: Optional[str] = None,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None
+    ) -> Tuple[List[Dict], int]:
+        """
+        One page of correction headers
+
+        Args:
+            limit: Page size (at most MAX_PAGE_SIZE)
+            offset: Rows to skip
+            sort: One of CORRECTION_SORTS
+            order: 'asc' or 'desc'
+            annotator: Only corrections by this annotator
+            transcript_id: Only corrections of this transcript
+            date_from: Only corrections saved at or after this ISO date/time
+            date_to: Only corrections saved up to this ISO date/time
+
+        Returns:
+            (rows, total number of matching corrections)
+        """
+        clauses, params = _date_filters("c.timestamp", date_from, date_to)
+        if annotator:
+            clauses.append("c.annotator = ?")
+            params.append(annotator)
+        if transcript_id:
+            clauses.append("c.transcript_id = ?")
+            params.append(transcript_id)
+        where = " WHERE " + " AND ".join(clauses) if clauses else ""
+
+        query = (
+            "SELECT c.id, c.transcript_id, c.timestamp, c.annotator, c.changes FROM corrections c"
+            + where + _order_by(sort, order, CORRECTION_SORTS, "c") + " LIMIT ? OFFSET ?"
+        )
+        with self._connect() as conn:
+            total = conn.execute("SELECT COUNT(*) FROM corrections c" + where, params).fetchone()[0]
+            rows = conn.execute(query, params + [min(limit, MAX_PAGE_SIZE), offset]).fetchall()
+
+        return [dict(row) for row in rows], total
+
+    def sync(self, transcripts_dir: str, corrections_dir: str, full: bool = False) -> Dict[str, int]:
+        """
+        Bring the catalog in line with the documents on disk
+
+        Only files that are new or whose modification time changed are
+        parsed; entries of deleted files are dropped. full=True re-reads
+        every file (rebuild).
+
+        Args:
+            transcripts_dir: Directory of *_transcript.json / *_transcript.ptx files
+            corrections_dir: Directory of *_corrected.json files
+            full: Re-index every file
+
+        Returns:
+            Counts of indexed and removed documents
+        """
+        # Catalogs from before the search index get fully re-read once
+        full = full or self._needs_rebuild
+        indexed_transcripts, removed_transcripts = self._sync_table(
+            "transcripts", TRANSCRIPT, Path(transcripts_dir), TRANSCRIPT_SUFFIXES, self._store_transcript, full
+        )
+        indexed_corrections, removed_corrections = self._sync_table(
+            "corrections", CORRECTION, Path(corrections_dir), CORRECTION_SUFFIXES, self._store_correction, full
+        )
+        if self._needs_rebuild:
+            with self._connect() as conn:
+                conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            self._needs_rebuild = False
+        counts = {
+            "transcripts_indexed": indexed_transcripts,
+            "transcripts_removed": removed_transcripts,
+            "corrections_indexed": indexed_corrections,
+            "corrections_removed": removed_corrections
+        }
+        logger.info(f"[Catalog] Synced: {counts}")
+        return counts
+
+    def _sync_table(self, table, source, directory, suffixes, store, full) -> Tuple[int, int]:
+        """Sync one table with one directory; returns (indexed, removed)"""
+        with self._connect() as conn:
+            known = {} if full else dict(conn.execute(f"SELECT id, mtime_ns FROM {table}").fetchall())
+
+        on_disk = {}
+        if directory.exists():
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    for suffix in suffixes:
+                        if entry.name.endswith(suffix):
+                            on_disk[entry.name[:-len(suffix)]] = (Path(entry.path), entry.stat().st_mtime_ns)
+
+        documents = []
+        for doc_id, (path, mtime_ns) in on_disk.items():
+            if known.get(doc_id) == mtime_ns:
+                continue
+            try:
+                data = _load_document(path)
+            except Exception as e:
+                logger.warning(f"[Catalog] Skipping unreadable {path}: {e}")
+                continue
+            # The file name is the document's identity on disk
+            data.setdefault("id", doc_id)
+            documents.append((data, mtime_ns))
+
+        with self._connect() as conn:
+            conn.execute("BEGIN")
+            if full:
+                conn.execute(f"DELETE FROM {table}")
+                conn.execute("DELETE FROM segments WHERE source = ?", (source,))
+                removed = []
+            else:
+                removed = [doc_id for doc_id in known if doc_id not in on_disk]
+                for doc_id in removed:
+                    document_id = doc_id
+                    if table == "corrections":
+                        row = conn.execute("SELECT transcript_id FROM corrections WHERE id = ?", (doc_id,)).fetchone()
+                        document_id = row[0] if row and row[0] else doc_id
+                    conn.execute(f"DELETE FROM {table} WHERE id = ?", (doc_id,))
+                    conn.execute(
+                        "DELETE FROM segments WHERE transcript_id = ? AND source = ?", (document_id, source)
+                    )
+            for data, mtime_ns in documents:
+                store(conn, data, mtime_ns)
+            conn.execute("COMMIT")
+
+        return len(documents), len(removed)
+
+
+def _load_document(path: Path) -> Dict:
+    """Read a JSON document, or a binary transcript's header and segments"""
+    if path.suffix == ".json":
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    # Binary transcripts need NumPy; only imported when such files exist
+    from utils.transcript_format import read_transcript
+    return read_transcript(path)
+
+
+def main():
+    """Rebuild the catalog from the transcript and correction files"""
+    parser = argparse.ArgumentParser(description="Rebuild the transcript catalog")
+    parser.add_argument("--data-dir", default="data", help="Data directory (default: data)")
+    parser.add_argument("--incremental", action="store_true", help="Only re-read changed files")
+    args = parser.parse_args()
+
+    # Run as a script: make utils.transcript_format importable for binary transcripts
+    sys.path.append(str(Path(__file__).parent.parent))
+
+    data_dir = Path(args.data_dir)
+    catalog = TranscriptCatalog(data_dir / "catalog.db")
+    counts = catalog.sync(data_dir / "transcripts", data_dir / "corrections", full=not args.incremental)
+    print(json.dumps(counts, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+Bounded Executor for Blocking Work
+Runs blocking inference off the asyncio event loop with backpressure
+"""
+import asyncio
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class QueueFullError(Exception):
+    """Raised when a BoundedExecutor has no free slot or queue space"""
+
+    def __init__(self, name: str, pending: int):
+        super().__init__(f"{name} queue is full ({pending} jobs pending)")
+        self.name = name
+        self.pending = pending
+
+
+class BoundedExecutor:
+    """
+    Thread pool with a concurrency limit and a bounded wait queue
+
+    At most max_workers calls run at once and at most max_queued more wait
+    for a worker. Further submissions fail fast with QueueFullError so the
+    API can answer 429 instead of piling up work. Whisper and PyTorch
+    release the GIL during inference, so worker threads keep the event
+    loop (and endpoints like /health) responsive.
+    """
+
+    def __init__(self, name: str, max_workers: int = 1, max_queued: int = 8):
+        """
+        Initialize executor
+
+        Args:
+            name: Name used in logs, thread names and errors
+            max_workers: Calls allowed to run concurrently
+            max_queued: Calls allowed to wait for a worker
+        """
+        self.name = name
+        self.max_workers = max_workers
+        self.max_queued = max_queued
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=name)
+        self._lock = threading.Lock()
+        self._pending = 0  # running + waiting
+
+    def _reserve(self) -> int:
+        """Take a slot; returns the queue position (0 = runs immediately)"""
+        with self._lock:
+            if self._pending >= self.max_workers + self.max_queued:
+                raise QueueFullError(self.name, self._pending)
+            position = max(0, self._pending - self.max_workers + 1)
+            self._pending += 1
+            return position
+
+    def _release(self):
+        with self._lock:
+            self._pending -= 1
+
+    def queue_position(self) -> int:
+        """Queue position a new submission would get (0 = runs immediately)"""
+        with self._lock:
+            return max(0, self._pending - self.max_workers + 1)
+
+    async def run(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Run a blocking callable in the pool and await its result
+
+        Raises:
+            QueueFullError: If all workers are busy and the queue is full
+        """
+        position = self._reserve()
+        if position:
+            logger.info(f"[{self.name}] Queued at position {position}")
+
+        try:
+            future = self._pool.submit(fn, *args, **kwargs)
+        except Exception:
+            self._release()
+            raise
+
+        # Free the slot when the work finishes, even if the caller gave up waiting
+        future.add_done_callback(lambda _: self._release())
+        return await asyncio.wrap_future(future)
+
+    def call(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Run a blocking callable in the pool from another thread and wait
+
+        For callers that queue their own work (e.g. background job workers):
+        the call shares the concurrency limit and counts toward the load
+        seen by run(), but waits for a worker instead of failing when the
+        queue is full.
+        """
+        with self._lock:
+            self._pending += 1
+        try:
+            future = self._pool.submit(fn, *args, **kwargs)
+        except Exception:
+            self._release()
+            raise
+
+        future.add_done_callback(lambda _: self._release())
+        return future.result()
+
+    def status(self) -> Dict:
+        """Describe load for health endpoints"""
+        with self._lock:
+            return {
+                "running": min(self._pending, self.max_workers),
+                "queued": max(0, self._pending - self.max_workers),
+                "max_workers": self.max_workers,
+                "max_queued": self.max_queued
+            }
+
+    def shutdown(self, wait: bool = True):
+        """Stop accepting work and release the worker threads"""
+        self._pool.shutdown(wait=wait)
@@ -0,0 +1,100 @@
+"""
+HTTP Range Helpers
+Byte-range parsing, validators and ranged file reads for media playback
+"""
+import os
+from email.utils import formatdate
+from typing import Iterator, Optional, Tuple
+
+# Read size when streaming a byte range
+RANGE_CHUNK_BYTES = 64 * 1024
+
+
+class RangeNotSatisfiable(Exception):
+    """Raised when a Range header lies entirely outside the file"""
+
+    def __init__(self, size: int):
+        super().__init__(f"Range not satisfiable for {size} bytes")
+        self.size = size
+
+
+def parse_range_header(header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """
+    Parse a single-range Range header
+
+    Supports "bytes=start-end", "bytes=start-" and "bytes=-suffix".
+    Malformed or multi-range headers are ignored (the caller sends the
+    whole file, which RFC 9110 allows).
+
+    Args:
+        header: Value of the Range header (or None)
+        size: File size in bytes
+
+    Returns:
+        Inclusive (start, end) byte positions, or None for the whole file
+
+    Raises:
+        RangeNotSatisfiable: If the range starts past the end of the file
+    """
+    if not header:
+        return None
+
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+
+    first, dash, last = spec.strip().partition("-")
+    # Positions are plain digits (int() would also take signs, "_" and spaces)
+    if not dash or not (first or last) or not all(
+        part.isascii() and part.isdigit() for part in (first, last) if part
+    ):
+        return None
+
+    if first:
+        start = int(first)
+        end = int(last) if last else size - 1
+        if start >= size:
+            raise RangeNotSatisfiable(size)
+        if end < start:
+            return None
+    else:
+        # Suffix range: the last N bytes
+        suffix = int(last)
+        if suffix == 0 or size == 0:
+            raise RangeNotSatisfiable(size)
+        start = max(0, size - suffix)
+        end = size - 1
+
+    return start, min(end, size - 1)
+
+
+def file_validators(stat: os.stat_result) -> Tuple[str, str]:
+    """(ETag, Last-Modified) header values for a file"""
+    etag = f'"{stat.st_size:x}-{stat.st_mtime_ns:x}"'
+    return etag, formatdate(stat.st_mtime, usegmt=True)
+
+
+def etag_matches(header: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match / If-Range header against an ETag"""
+    if not header:
+        return False
+    candidates = [tag.strip().removeprefix("W/") for tag in header.split(",")]
+    return "*" in candidates or etag in candidates
+
+
+def iter_file_range(
+    path: str,
+    start: int,
+    end: int,
+    chunk_size: int = RANGE_CHUNK_BYTES
+) -> Iterator[bytes]:
+    """Yield bytes start..end (inclusive) of a file in chunks"""
+    remaining = end - start + 1
+    with open(path, "rb") as f:
+        f.seek(start)
+        while remaining > 0:
+            data = f.read(min(chunk_size, remaining))
+            if not data:
+                break
+            remaining -= len(data)
+            yield data
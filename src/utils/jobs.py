@@ -0,0 +1,290 @@
+"""
+Persistent Background Job Queue
+SQLite-backed job journal drained by worker threads
+"""
+import json
+import time
+import uuid
+import sqlite3
+import logging
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Job states
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+# handler(payload, progress) -> result, where progress(processed, total)
+# reports processed vs total units (audio seconds for transcription)
+JobHandler = Callable[[Dict, Callable[[float, float], None]], Dict]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    state TEXT NOT NULL,
+    processed REAL NOT NULL DEFAULT 0,
+    total REAL,
+    result TEXT,
+    error TEXT,
+    created_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_state_created ON jobs (state, created_at);
+"""
+
+
+def _iso(timestamp: Optional[float]) -> Optional[str]:
+    return datetime.fromtimestamp(timestamp).isoformat() if timestamp else None
+
+
+class JobQueue:
+    """
+    Background job queue persisted in a local SQLite journal
+
+    Submitting only writes a row, so callers get a job id immediately.
+    Worker threads claim the oldest queued job, run the handler registered
+    for its kind and store the result or error. Jobs left 'running' by a
+    crash or restart are re-queued when the queue starts.
+    """
+
+    def __init__(self, db_path: str, workers: int = 1, poll_interval: float = 5.0):
+        """
+        Initialize job queue
+
+        Args:
+            db_path: SQLite database file for the journal
+            workers: Number of worker threads
+            poll_interval: Seconds between idle checks for new jobs
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.workers = workers
+        self.poll_interval = poll_interval
+        self.handlers: Dict[str, JobHandler] = {}
+
+        self._wakeup = threading.Condition()
+        self._stopping = False
+        self._threads: List[threading.Thread] = []
+
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Short-lived autocommit connection (safe to use from any thread)"""
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            yield conn
+        finally:
+            conn.close()
+
+    def register(self, kind: str, handler: JobHandler):
+        """Register the handler that runs jobs of a kind"""
+        self.handlers[kind] = handler
+
+    def submit(self, kind: str, payload: Dict) -> str:
+        """
+        Queue a job
+
+        Args:
+            kind: Registered job kind (e.g. 'transcribe')
+            payload: JSON-serializable job arguments
+
+        Returns:
+            Job id
+        """
+        if kind not in self.handlers:
+            raise ValueError(f"Unknown job kind: {kind}")
+
+        job_id = uuid.uuid4().hex
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO jobs (id, kind, payload, state, created_at) VALUES (?, ?, ?, ?, ?)",
+                (job_id, kind, json.dumps(payload), QUEUED, time.time())
+            )
+
+        with self._wakeup:
+            self._wakeup.notify()
+
+        return job_id
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        """Get job state, progress and ETA (None if unknown)"""
+        with self._connect() as conn:
+            row = conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+            if row is None:
+                return None
+            position = self._position(conn, row)
+
+        return self._to_dict(row, position)
+
+    def list(self, limit: int = 50, state: Optional[str] = None) -> List[Dict]:
+        """List most recent jobs, optionally filtered by state"""
+        query = "SELECT * FROM jobs"
+        params: tuple = ()
+        if state:
+            query += " WHERE state = ?"
+            params = (state,)
+        query += " ORDER BY created_at DESC LIMIT ?"
+
+        with self._connect() as conn:
+            rows = conn.execute(query, params + (limit,)).fetchall()
+            return [self._to_dict(row, self._position(conn, row)) for row in rows]
+
+    def _position(self, conn: sqlite3.Connection, row: sqlite3.Row) -> int:
+        """1-based queue position of a queued job (0 if not queued)"""
+        if row["state"] != QUEUED:
+            return 0
+        ahead = conn.execute(
+            "SELECT COUNT(*) FROM jobs WHERE state = ? AND created_at < ?",
+            (QUEUED, row["created_at"])
+        ).fetchone()[0]
+        return ahead + 1
+
+    def _to_dict(self, row: sqlite3.Row, position: int) -> Dict:
+        processed = row["processed"] or 0.0
+        total = row["total"]
+
+        percent = None
+        eta_seconds = None
+        if row["state"] == DONE:
+            percent = 100.0
+            eta_seconds = 0.0
+        elif total:
+            percent = round(min(processed / total, 1.0) * 100, 1)
+            # Extrapolate the processing rate seen so far
+            if row["state"] == RUNNING and processed > 0 and row["started_at"]:
+                elapsed = time.time() - row["started_at"]
+                eta_seconds = round(elapsed / processed * max(total - processed, 0.0), 1)
+
+        return {
+            "id": row["id"],
+            "kind": row["kind"],
+            "state": row["state"],
+            "payload": json.loads(row["payload"]),
+            "position": position,
+            "processed": processed,
+            "total": total,
+            "percent": percent,
+            "eta_seconds": eta_seconds,
+            "result": json.loads(row["result"]) if row["result"] else None,
+            "error": row["error"],
+            "created_at": _iso(row["created_at"]),
+            "started_at": _iso(row["started_at"]),
+            "finished_at": _iso(row["finished_at"])
+        }
+
+    def _claim(self) -> Optional[sqlite3.Row]:
+        """Atomically move the oldest queued job to running"""
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = conn.execute(
+                    "SELECT * FROM jobs WHERE state = ? ORDER BY created_at LIMIT 1",
+                    (QUEUED,)
+                ).fetchone()
+                if row is not None:
+                    conn.execute(
+                        "UPDATE jobs SET state = ?, started_at = ?, processed = 0 WHERE id = ?",
+                        (RUNNING, time.time(), row["id"])
+                    )
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        return row
+
+    def _report_progress(self, job_id: str, processed: float, total: Optional[float]):
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE jobs SET processed = ?, total = COALESCE(?, total) WHERE id = ?",
+                (processed, total, job_id)
+            )
+
+    def _finish(self, job_id: str, result: Optional[Dict] = None, error: Optional[str] = None):
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE jobs SET state = ?, result = ?, error = ?, finished_at = ?, "
+                "processed = CASE WHEN ? THEN COALESCE(total, processed) ELSE processed END "
+                "WHERE id = ?",
+                (
+                    FAILED if error else DONE,
+                    json.dumps(result) if result is not None else None,
+                    error,
+                    time.time(),
+                    error is None,
+                    job_id
+                )
+            )
+
+    def run_next(self) -> bool:
+        """Run one queued job in the calling thread; False if none queued"""
+        row = self._claim()
+        if row is None:
+            return False
+
+        job_id = row["id"]
+        handler = self.handlers.get(row["kind"])
+        logger.info(f"[Jobs] Running {row['kind']} job {job_id}")
+
+        try:
+            if handler is None:
+                raise ValueError(f"No handler registered for job kind: {row['kind']}")
+            result = handler(
+                json.loads(row["payload"]),
+                lambda processed, total=None: self._report_progress(job_id, processed, total)
+            )
+            self._finish(job_id, result=result)
+            logger.info(f"[Jobs] Job {job_id} done")
+        except Exception as e:
+            logger.error(f"[Jobs] Job {job_id} failed: {e}")
+            self._finish(job_id, error=str(e))
+
+        return True
+
+    def _worker_loop(self):
+        while not self._stopping:
+            if self.run_next():
+                continue
+            with self._wakeup:
+                if not self._stopping:
+                    self._wakeup.wait(self.poll_interval)
+
+    def start(self):
+        """Re-queue interrupted jobs and start the worker threads"""
+        with self._connect() as conn:
+            recovered = conn.execute(
+                "UPDATE jobs SET state = ?, started_at = NULL, processed = 0 WHERE state = ?",
+                (QUEUED, RUNNING)
+            ).rowcount
+        if recovered:
+            logger.info(f"[Jobs] Re-queued {recovered} interrupted job(s)")
+
+        self._stopping = False
+        for index in range(self.workers):
+            thread = threading.Thread(target=self._worker_loop, name=f"job-worker-{index}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self, timeout: Optional[float] = None):
+        """Stop workers after their current job"""
+        self._stopping = True
+        with self._wakeup:
+            self._wakeup.notify_all()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
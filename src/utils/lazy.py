@@ -0,0 +1,66 @@
+"""
+Lazy Module Imports
+Defer heavy dependencies (torch, whisper, transformers) until first use
+"""
+import importlib
+import importlib.util
+import threading
+from types import ModuleType
+
+_import_lock = threading.RLock()
+
+
+class LazyModule(ModuleType):
+    """
+    Stand-in for a module that is imported on first attribute access
+
+    Binding torch = lazy_import("torch") at module level costs nothing;
+    the real import runs the first time code touches torch.<name>. After
+    that the real module's namespace is copied in, so later lookups are
+    plain attribute reads. Imports go through importlib under a lock, so
+    concurrent first uses from worker threads import only once.
+    """
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.__dict__["_lazy_loaded"] = False
+
+    def _load(self) -> ModuleType:
+        if self.__dict__["_lazy_loaded"]:
+            return importlib.import_module(self.__name__)
+        with _import_lock:
+            module = importlib.import_module(self.__name__)
+            if not self.__dict__["_lazy_loaded"]:
+                self.__dict__.update(module.__dict__)
+                self.__dict__["_lazy_loaded"] = True
+        return module
+
+    def __getattr__(self, attr: str):
+        # Only called for names not copied in (yet): delegate to the real
+        # module, which may define some names lazily itself (transformers)
+        return getattr(self._load(), attr)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.__dict__["_lazy_loaded"] else "not loaded"
+        return f"<lazy module '{self.__name__}' ({state})>"
+
+
+def is_available(name: str) -> bool:
+    """Check that a module can be imported, without importing it"""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+def lazy_import(name: str) -> ModuleType:
+    """
+    Module proxy that imports name on first use
+
+    Args:
+        name: Absolute module name (e.g. 'torch', 'whisper')
+
+    Returns:
+        LazyModule for name
+    """
+    return LazyModule(name)
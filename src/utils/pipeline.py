@@ -0,0 +1,110 @@
+"""
+Producer/Consumer Pipeline Stages
+Bounded prefetching and background writing around a compute-bound loop
+"""
+import logging
+import queue
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, Optional, Tuple
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Marks the end of the input / the writer queue
+_DONE = object()
+
+
+def prefetch(
+    fn: Callable[[Any], Any],
+    items: Iterable[Any],
+    workers: int = 2,
+    ahead: int = 2
+) -> Iterator[Tuple[Any, Any, Optional[Exception]]]:
+    """
+    Run fn over items on worker threads, yielding results in input order
+
+    At most workers + ahead calls are in flight or waiting to be consumed,
+    so a slow consumer (the model) bounds memory while the workers keep
+    the next inputs ready. Closing the iterator early cancels calls that
+    have not started.
+
+    Args:
+        fn: Called with each item (e.g. decode an audio file)
+        items: Inputs, consumed lazily
+        workers: Worker threads
+        ahead: Finished results allowed to wait beyond the running calls
+
+    Yields:
+        (item, result, error) with error set (and result None) if fn raised
+    """
+    items = iter(items)
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="prefetch")
+    pending = deque((item, executor.submit(fn, item)) for item in islice(items, workers + ahead))
+    try:
+        while pending:
+            item, future = pending.popleft()
+            next_item = next(items, _DONE)
+            if next_item is not _DONE:
+                pending.append((next_item, executor.submit(fn, next_item)))
+            try:
+                result, error = future.result(), None
+            except Exception as e:
+                result, error = None, e
+            yield item, result, error
+    finally:
+        for _, future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
+
+
+class BackgroundWriter:
+    """
+    Thread applying write(item) to submitted items, in order
+
+    submit() blocks once max_queued items are waiting, so output cannot
+    pile up in memory if the disk is slower than the producer. Errors
+    raised by write are logged and do not stop the writer.
+    """
+
+    def __init__(self, write: Callable[[Any], None], max_queued: int = 8, name: str = "writer"):
+        """
+        Start the writer thread
+
+        Args:
+            write: Called with each submitted item on the writer thread
+            max_queued: Items allowed to wait for the writer
+            name: Thread name
+        """
+        self.write = write
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queued)
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is _DONE:
+                return
+            try:
+                self.write(item)
+            except Exception as e:
+                logger.error(f"[{self._thread.name}] Write failed: {e}")
+
+    def submit(self, item: Any):
+        """Queue an item for writing (blocks while the queue is full)"""
+        self._queue.put(item)
+
+    def close(self):
+        """Write everything submitted so far, then stop the thread"""
+        self._queue.put(_DONE)
+        self._thread.join()
+
+    def __enter__(self) -> "BackgroundWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,413 @@
+"""
+Binary Transcript Format
+Columnar, memory-mappable transcript storage with lazy segment loading
+"""
+import os
+import json
+import math
+import mmap
+import struct
+import logging
+import argparse
+from array import array
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# File suffix next to the JSON format's "_transcript.json"
+BINARY_SUFFIX = ".ptx"
+
+# Prefix: magic, version, JSON header length, data section offset (32 bytes, padded)
+_MAGIC = b"PLXTRN"
+_VERSION = 1
+_PREFIX = struct.Struct("<6sHIQ")
+PREFIX_SIZE = 32
+
+# Arrays start on 8-byte boundaries so every column maps without copying
+_ALIGN = 8
+
+# Stored precision: times in ms, probabilities to 4 places (float32 columns)
+TIME_DECIMALS = 3
+PROBABILITY_DECIMALS = 4
+
+# Segment and word keys stored as columns; other segment keys go in the header
+_SEGMENT_KEYS = {"start", "end", "text", "language", "words"}
+
+# Column keys a segment may lack (recorded per segment in the header)
+_OPTIONAL_KEYS = ("text", "language", "words")
+
+# Stored for word times and probabilities absent from the source word
+_ABSENT = float("nan")
+
+
+def _pad(size: int) -> int:
+    return -size % _ALIGN
+
+
+def _strings(values: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """UTF-8 blob and (n + 1) byte offsets of a list of strings"""
+    encoded = [value.encode("utf-8") for value in values]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(value) for value in encoded], out=offsets[1:])
+    return np.frombuffer(b"".join(encoded), dtype=np.uint8), offsets
+
+
+def decode_word(text: str, start: float, end: float, probability: float) -> Dict:
+    """Word dict in the JSON format, leaving out values stored as absent (NaN)"""
+    word = {"word": text}
+    if not math.isnan(start):
+        word["start"] = round(start, TIME_DECIMALS)
+    if not math.isnan(end):
+        word["end"] = round(end, TIME_DECIMALS)
+    if not math.isnan(probability):
+        word["probability"] = round(probability, PROBABILITY_DECIMALS)
+    return word
+
+
+def encode_columns(segments: Iterable[Dict]) -> Tuple[Dict[str, np.ndarray], Dict]:
+    """
+    Convert segment dicts (transcribe() format) to columns
+
+    Segments are read in one pass, so a generator can feed them without
+    the whole list being held. Word texts are interned: each distinct word
+    is stored once in a vocabulary and words refer to it by index.
+
+    Decoding gives back the same dicts up to the stored precision: segment
+    keys that are absent (text, language, words) are listed per segment in
+    the header, None text or words are kept with the other segment keys,
+    and absent word times and probabilities are stored as NaN.
+
+    Returns:
+        (columns by name, header fields describing them)
+    """
+    languages: List[str] = []
+    language_ids: Dict[Optional[str], int] = {}
+    vocabulary: Dict[str, int] = {}
+    extras: Dict[str, Dict] = {}
+    missing: Dict[str, List[str]] = {}
+
+    segment_times = array("f")
+    segment_language = array("B")
+    segment_texts: List[str] = []
+    word_offsets = array("q", [0])
+    word_ids = array("I")
+    word_starts, word_ends, word_probabilities = array("f"), array("f"), array("f")
+
+    for index, segment in enumerate(segments):
+        language = segment.get("language")
+        if language not in language_ids:
+            language_ids[language] = len(languages)
+            languages.append(language)
+        segment_language.append(language_ids[language])
+        segment_times.extend((segment["start"], segment["end"]))
+        segment_texts.append(segment.get("text") or "")
+
+        extra = {
+            key: value for key, value in segment.items()
+            if key not in _SEGMENT_KEYS or (value is None and key != "language")
+        }
+        if extra:
+            extras[str(index)] = extra
+        absent = [key for key in _OPTIONAL_KEYS if key not in segment]
+        if absent:
+            missing[str(index)] = absent
+
+        words = segment.get("words") or []
+        for word in words:
+            word_ids.append(vocabulary.setdefault(word.get("word", ""), len(vocabulary)))
+            word_starts.append(word.get("start", _ABSENT))
+            word_ends.append(word.get("end", _ABSENT))
+            word_probabilities.append(word.get("probability", _ABSENT))
+        word_offsets.append(word_offsets[-1] + len(words))
+
+    segment_text, segment_text_offsets = _strings(segment_texts)
+    vocabulary_text, vocabulary_offsets = _strings(list(vocabulary))
+    segment_times = np.frombuffer(segment_times, dtype=np.float32).reshape(-1, 2)
+
+    columns = {
+        "segment_start": np.ascontiguousarray(segment_times[:, 0]),
+        "segment_end": np.ascontiguousarray(segment_times[:, 1]),
+        "segment_language": np.frombuffer(segment_language, dtype=np.uint8),
+        "segment_text_offsets": segment_text_offsets,
+        "segment_text": segment_text,
+        "segment_word_offsets": np.frombuffer(word_offsets, dtype=np.int64),
+        "word_id": np.frombuffer(word_ids, dtype=np.uint32),
+        "word_start": np.frombuffer(word_starts, dtype=np.float32),
+        "word_end": np.frombuffer(word_ends, dtype=np.float32),
+        "word_probability": np.frombuffer(word_probabilities, dtype=np.float32),
+        "vocabulary_offsets": vocabulary_offsets,
+        "vocabulary": vocabulary_text
+    }
+    header = {
+        "segment_count": len(segment_texts),
+        "word_count": len(word_ids),
+        "segment_languages": languages,
+        "segment_extras": extras,
+        "segment_missing": missing
+    }
+    return columns, header
+
+
+def write_transcript(path: str, data: Dict) -> Path:
+    """
+    Save a transcript document in the binary format (atomically)
+
+    Args:
+        path: Destination file (conventionally <id>_transcript.ptx)
+        data: Transcript document as saved to JSON; "segments" may also be
+            an asr.transcript.Transcript, whose columns are written as they are
+
+    Returns:
+        Path of the written file
+    """
+    path = Path(path)
+    segments = data.get("segments")
+    if hasattr(segments, "columns"):
+        columns, header = segments.columns()
+    else:
+        columns, header = encode_columns(segments or [])
+    header["transcript"] = {key: value for key, value in data.items() if key != "segments"}
+
+    # Lay out columns relative to the data section
+    layout = {}
+    position = 0
+    for name, array in columns.items():
+        layout[name] = [array.dtype.str, position, len(array)]
+        position += array.nbytes + _pad(array.nbytes)
+    header["columns"] = layout
+
+    header_bytes = json.dumps(header, ensure_ascii=False).encode("utf-8")
+    data_offset = PREFIX_SIZE + len(header_bytes) + _pad(PREFIX_SIZE + len(header_bytes))
+
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(_PREFIX.pack(_MAGIC, _VERSION, len(header_bytes), data_offset).ljust(PREFIX_SIZE, b"\0"))
+        f.write(header_bytes)
+        f.write(b"\0" * (data_offset - PREFIX_SIZE - len(header_bytes)))
+        for array in columns.values():
+            f.write(array.tobytes())
+            f.write(b"\0" * _pad(array.nbytes))
+    os.replace(tmp_path, path)
+    return path
+
+
+def is_binary_transcript(path: str) -> bool:
+    """Check a file's magic bytes"""
+    with open(path, "rb") as f:
+        return f.read(len(_MAGIC)) == _MAGIC
+
+
+class TranscriptFile:
+    """
+    Reader for binary transcripts
+
+    Opening a file reads only the prefix and JSON header, so header() is
+    cheap regardless of length. Columns are memory-mapped on first use;
+    segments(start, end) binary-searches the segment times and decodes
+    only the segments overlapping that range, touching only their pages.
+    """
+
+    def __init__(self, path: str):
+        """
+        Open a binary transcript
+
+        Args:
+            path: File written by write_transcript
+
+        Raises:
+            ValueError: If the file is not a binary transcript of this version
+        """
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            prefix = f.read(PREFIX_SIZE)
+            if len(prefix) < PREFIX_SIZE:
+                raise ValueError(f"{path} is not a binary transcript")
+            magic, version, header_length, self._data_offset = _PREFIX.unpack_from(prefix)
+            if magic != _MAGIC or version != _VERSION:
+                raise ValueError(f"{path} is not a version {_VERSION} binary transcript")
+            self._header = json.loads(f.read(header_length).decode("utf-8"))
+
+        self._mmap: Optional[mmap.mmap] = None
+        self._columns: Dict[str, np.ndarray] = {}
+        self._vocabulary: Optional[List[str]] = None
+
+    @property
+    def segment_count(self) -> int:
+        return self._header["segment_count"]
+
+    @property
+    def word_count(self) -> int:
+        return self._header["word_count"]
+
+    def header(self) -> Dict:
+        """Transcript fields other than segments (id, text, language, ...)"""
+        return dict(self._header["transcript"])
+
+    def column(self, name: str) -> np.ndarray:
+        """A column as a read-only array over the mapped file"""
+        if name not in self._columns:
+            if self._mmap is None:
+                with open(self.path, "rb") as f:
+                    # Empty transcripts have no data to map
+                    size = os.fstat(f.fileno()).st_size
+                    self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+            dtype, offset, count = self._header["columns"][name]
+            if count == 0:
+                self._columns[name] = np.zeros(0, dtype=dtype)
+            else:
+                self._columns[name] = np.frombuffer(
+                    self._mmap, dtype=dtype, count=count, offset=self._data_offset + offset
+                )
+        return self._columns[name]
+
+    def _string(self, blob: str, offsets: str, index: int) -> str:
+        bounds = self.column(offsets)
+        return self.column(blob)[bounds[index]:bounds[index + 1]].tobytes().decode("utf-8")
+
+    def vocabulary(self) -> List[str]:
+        """Distinct word texts, indexed by the word_id column"""
+        if self._vocabulary is None:
+            offsets = self.column("vocabulary_offsets")
+            blob = self.column("vocabulary").tobytes()
+            self._vocabulary = [
+                blob[offsets[i]:offsets[i + 1]].decode("utf-8") for i in range(len(offsets) - 1)
+            ]
+        return self._vocabulary
+
+    def segment_range(self, start: Optional[float] = None, end: Optional[float] = None) -> Tuple[int, int]:
+        """Indexes [first, last) of the segments overlapping [start, end) seconds"""
+        first = 0 if start is None else int(np.searchsorted(self.column("segment_end"), start, side="right"))
+        last = self.segment_count if end is None else int(np.searchsorted(self.column("segment_start"), end, side="left"))
+        return first, max(first, last)
+
+    def segment(self, index: int) -> Dict:
+        """One segment in the JSON format"""
+        word_offsets = self.column("segment_word_offsets")
+        first, last = int(word_offsets[index]), int(word_offsets[index + 1])
+        vocabulary = self.vocabulary()
+        # tolist() converts the slices to Python numbers in one pass
+        word_ids = self.column("word_id")[first:last].tolist()
+        starts = self.column("word_start")[first:last].tolist()
+        ends = self.column("word_end")[first:last].tolist()
+        probabilities = self.column("word_probability")[first:last].tolist()
+
+        segment = {
+            "start": round(float(self.column("segment_start")[index]), TIME_DECIMALS),
+            "end": round(float(self.column("segment_end")[index]), TIME_DECIMALS),
+            "text": self._string("segment_text", "segment_text_offsets", index),
+            "language": self._header["segment_languages"][self.column("segment_language")[index]],
+            "words": [
+                decode_word(vocabulary[word_id], word_start, word_end, probability)
+                for word_id, word_start, word_end, probability in zip(word_ids, starts, ends, probabilities)
+            ]
+        }
+        for key in self._header.get("segment_missing", {}).get(str(index), ()):
+            del segment[key]
+        segment.update(self._header["segment_extras"].get(str(index), {}))
+        return segment
+
+    def segments(self, start: Optional[float] = None, end: Optional[float] = None) -> List[Dict]:
+        """Segments overlapping [start, end) seconds (all by default)"""
+        first, last = self.segment_range(start, end)
+        return [self.segment(index) for index in range(first, last)]
+
+    def to_dict(self) -> Dict:
+        """The whole transcript in the JSON format"""
+        return dict(self.header(), segments=self.segments())
+
+    def close(self):
+        """Release the memory map"""
+        self._columns.clear()
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def __enter__(self) -> "TranscriptFile":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def read_transcript(
+    path: str,
+    start: Optional[float] = None,
+    end: Optional[float] = None,
+    segments: bool = True
+) -> Dict:
+    """
+    Load a transcript saved in either format as a JSON-format dict
+
+    Args:
+        path: .json or binary transcript file
+        start: Only segments ending after this time (seconds)
+        end: Only segments starting before this time (seconds)
+        segments: False to return only the header fields
+
+    Returns:
+        Transcript document (segments limited to [start, end) if given)
+    """
+    if is_binary_transcript(path):
+        with TranscriptFile(path) as transcript:
+            if not segments:
+                return transcript.header()
+            return dict(transcript.header(), segments=transcript.segments(start, end))
+
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    if not segments:
+        data.pop("segments", None)
+    elif start is not None or end is not None:
+        data["segments"] = [
+            segment for segment in data.get("segments", [])
+            if (start is None or segment["end"] > start) and (end is None or segment["start"] < end)
+        ]
+    return data
+
+
+def convert(path: str, to_binary: bool) -> Path:
+    """
+    Convert a transcript file between the JSON and binary formats
+
+    The converted file replaces the original (same id, other suffix).
+
+    Returns:
+        Path of the converted file
+    """
+    path = Path(path)
+    data = read_transcript(path)
+    stem = path.name[:-len(BINARY_SUFFIX)] if path.name.endswith(BINARY_SUFFIX) else path.stem
+
+    if to_binary:
+        target = write_transcript(path.with_name(stem + BINARY_SUFFIX), data)
+    else:
+        target = path.with_name(stem + ".json")
+        tmp_path = target.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, target)
+
+    if target != path:
+        path.unlink()
+    return target
+
+
+def main():
+    """Convert transcript files between the JSON and binary formats"""
+    parser = argparse.ArgumentParser(description="Convert transcripts between JSON and binary formats")
+    parser.add_argument("format", choices=["binary", "json"], help="Target format")
+    parser.add_argument("paths", nargs="+", help="Transcript files to convert")
+    args = parser.parse_args()
+
+    for path in args.paths:
+        target = convert(path, to_binary=args.format == "binary")
+        logger.info(f"{path} -> {target} ({os.path.getsize(target)} bytes)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,266 @@
+"""
+Streaming and Resumable Uploads
+Chunked writes to disk with on-the-fly hashing, size limits and dedupe
+"""
+import os
+import json
+import time
+import uuid
+import hashlib
+import logging
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Unfinished upload sessions older than this are deleted
+SESSION_TTL_SECONDS = 24 * 3600
+
+
+class UploadError(Exception):
+    """Base class for rejected upload requests"""
+
+
+class UploadTooLargeError(UploadError):
+    """Raised when an upload exceeds the size limit or its declared size"""
+
+    def __init__(self, limit: int):
+        super().__init__(f"Upload exceeds {limit} bytes")
+        self.limit = limit
+
+
+class UploadOffsetError(UploadError):
+    """Raised when a chunk does not start where the upload left off"""
+
+    def __init__(self, expected: int):
+        super().__init__(f"Upload must resume at offset {expected}")
+        self.expected = expected
+
+
+class UploadStore:
+    """
+    Upload sessions written to disk chunk by chunk
+
+    A session is a <id>.part file plus a <id>.json sidecar in upload_dir.
+    Chunks are appended at the offset the client says it is sending,
+    which must equal the bytes already received, so a client whose
+    connection dropped asks for the current offset and continues from
+    there. The part file itself is the record of progress, so sessions
+    survive server restarts.
+
+    Content is hashed (SHA-256) while it is written. On completion a file
+    whose hash is already known is not stored twice: the existing
+    filename is returned instead.
+    """
+
+    def __init__(self, audio_dir: str, upload_dir: str, max_bytes: int):
+        """
+        Initialize store
+
+        Args:
+            audio_dir: Directory completed uploads are moved into
+            upload_dir: Directory for in-progress sessions and the hash index
+            max_bytes: Largest accepted upload
+        """
+        self.audio_dir = Path(audio_dir)
+        self.upload_dir = Path(upload_dir)
+        self.audio_dir.mkdir(parents=True, exist_ok=True)
+        self.upload_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+
+        self._index_path = self.upload_dir / "index.json"
+        self._lock = threading.Lock()
+        self._session_locks: Dict[str, threading.Lock] = {}
+        # upload_id -> (hasher, bytes hashed); lost on restart, then rebuilt from disk
+        self._hashers: Dict[str, tuple] = {}
+
+    def _part_path(self, upload_id: str) -> Path:
+        return self.upload_dir / f"{upload_id}.part"
+
+    def _meta_path(self, upload_id: str) -> Path:
+        return self.upload_dir / f"{upload_id}.json"
+
+    def _session_lock(self, upload_id: str) -> threading.Lock:
+        with self._lock:
+            return self._session_locks.setdefault(upload_id, threading.Lock())
+
+    def _read_meta(self, upload_id: str) -> Dict:
+        # Ids are generated by us; reject anything that could escape upload_dir
+        if not upload_id.isalnum():
+            raise KeyError(upload_id)
+        try:
+            with open(self._meta_path(upload_id), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            raise KeyError(upload_id)
+
+    def create(self, filename: str, size: Optional[int] = None) -> Dict:
+        """
+        Start an upload session
+
+        Args:
+            filename: Original file name
+            size: Total size in bytes, if known (checked against the limit now)
+
+        Returns:
+            Session status
+        """
+        if size is not None and size > self.max_bytes:
+            raise UploadTooLargeError(self.max_bytes)
+
+        self.purge_stale()
+
+        upload_id = uuid.uuid4().hex
+        meta = {"id": upload_id, "filename": Path(filename).name, "size": size, "created_at": time.time()}
+        with open(self._meta_path(upload_id), 'w', encoding='utf-8') as f:
+            json.dump(meta, f)
+        self._part_path(upload_id).touch()
+        self._hashers[upload_id] = (hashlib.sha256(), 0)
+
+        return self.status(upload_id)
+
+    def status(self, upload_id: str) -> Dict:
+        """Session status, including the offset to resume from"""
+        meta = self._read_meta(upload_id)
+        return {
+            "upload_id": upload_id,
+            "filename": meta["filename"],
+            "size": meta["size"],
+            "offset": self._part_path(upload_id).stat().st_size,
+            "max_bytes": self.max_bytes
+        }
+
+    def append(self, upload_id: str, offset: int, data: bytes) -> int:
+        """
+        Append a chunk at offset
+
+        Raises:
+            KeyError: Unknown session
+            UploadOffsetError: offset is not the number of bytes received
+            UploadTooLargeError: The chunk would exceed the limit or declared size
+
+        Returns:
+            New offset
+        """
+        meta = self._read_meta(upload_id)
+        limit = min(self.max_bytes, meta["size"]) if meta["size"] is not None else self.max_bytes
+
+        with self._session_lock(upload_id):
+            part_path = self._part_path(upload_id)
+            received = part_path.stat().st_size
+            if offset != received:
+                raise UploadOffsetError(received)
+            if received + len(data) > limit:
+                raise UploadTooLargeError(limit)
+
+            with open(part_path, 'ab') as f:
+                f.write(data)
+
+            hasher = self._hashers.get(upload_id)
+            if hasher is not None and hasher[1] == received:
+                hasher[0].update(data)
+                self._hashers[upload_id] = (hasher[0], received + len(data))
+
+            return received + len(data)
+
+    def _digest(self, upload_id: str) -> str:
+        """SHA-256 of a part file, reusing the running hash when it is complete"""
+        part_path = self._part_path(upload_id)
+        hasher = self._hashers.pop(upload_id, None)
+        if hasher is not None and hasher[1] == part_path.stat().st_size:
+            return hasher[0].hexdigest()
+
+        digest = hashlib.sha256()
+        with open(part_path, 'rb') as f:
+            for block in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def _load_index(self) -> Dict[str, str]:
+        try:
+            with open(self._index_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _save_index(self, index: Dict[str, str]):
+        tmp_path = self._index_path.with_suffix(".tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(index, f)
+        os.replace(tmp_path, self._index_path)
+
+    def complete(self, upload_id: str) -> Dict:
+        """
+        Finish an upload: move it into audio_dir unless identical content exists
+
+        Raises:
+            KeyError: Unknown session
+            UploadOffsetError: Fewer bytes received than the declared size
+
+        Returns:
+            {"filename", "size", "sha256", "duplicate"}
+        """
+        meta = self._read_meta(upload_id)
+
+        with self._session_lock(upload_id):
+            part_path = self._part_path(upload_id)
+            size = part_path.stat().st_size
+            if meta["size"] is not None and size != meta["size"]:
+                raise UploadOffsetError(size)
+
+            sha256 = self._digest(upload_id)
+
+            with self._lock:
+                index = self._load_index()
+                existing = index.get(sha256)
+                if existing and (self.audio_dir / existing).exists():
+                    part_path.unlink()
+                    filename, duplicate = existing, True
+                else:
+                    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                    filename = f"{timestamp}_{meta['filename']}"
+                    os.replace(part_path, self.audio_dir / filename)
+                    index[sha256] = filename
+                    self._save_index(index)
+                    duplicate = False
+
+            self._meta_path(upload_id).unlink(missing_ok=True)
+
+        with self._lock:
+            self._session_locks.pop(upload_id, None)
+
+        if duplicate:
+            logger.info(f"[Uploads] {meta['filename']} is identical to {filename}")
+        return {"filename": filename, "size": size, "sha256": sha256, "duplicate": duplicate}
+
+    def abort(self, upload_id: str) -> bool:
+        """Discard an upload session; returns False if it does not exist"""
+        try:
+            self._read_meta(upload_id)
+        except KeyError:
+            return False
+        self._part_path(upload_id).unlink(missing_ok=True)
+        self._meta_path(upload_id).unlink(missing_ok=True)
+        self._hashers.pop(upload_id, None)
+        with self._lock:
+            self._session_locks.pop(upload_id, None)
+        return True
+
+    def purge_stale(self, max_age: float = SESSION_TTL_SECONDS):
+        """Delete unfinished sessions older than max_age seconds"""
+        cutoff = time.time() - max_age
+        for meta_path in self.upload_dir.glob("*.json"):
+            if meta_path == self._index_path:
+                continue
+            try:
+                with open(meta_path, 'r', encoding='utf-8') as f:
+                    created_at = json.load(f)["created_at"]
+            except (OSError, ValueError, KeyError):
+                continue
+            if created_at < cutoff:
+                self.abort(meta_path.stem)
+                logger.info(f"[Uploads] Purged stale session {meta_path.stem}")
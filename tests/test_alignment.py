@@ -0,0 +1,163 @@
+"""
+Unit tests for aligning corrections onto transcript word timestamps
+"""
+import sys
+import time
+import random
+from pathlib import Path
+
+# Add src to path
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+from correction.alignment import align_segments, align_words, count_changes, get_opcodes
+
+
+def make_segments():
+    return [
+        {
+            "start": 0.0, "end": 3.0, "text": "the mitochondria is the", "language": "en",
+            "words": [
+                {"word": "the", "start": 0.0, "end": 0.5, "probability": 0.9},
+                {"word": "mitochondria", "start": 0.5, "end": 1.5, "probability": 0.8},
+                {"word": "is", "start": 1.5, "end": 2.0, "probability": 0.9},
+                {"word": "the", "start": 2.0, "end": 3.0, "probability": 0.7}
+            ]
+        },
+        {
+            "start": 3.0, "end": 6.0, "text": "power house of cell", "language": "en",
+            "words": [
+                {"word": "power", "start": 3.0, "end": 3.5, "probability": 0.9},
+                {"word": "house", "start": 3.5, "end": 4.0, "probability": 0.6},
+                {"word": "of", "start": 4.0, "end": 5.0, "probability": 0.9},
+                {"word": "cell", "start": 5.0, "end": 6.0, "probability": 0.9}
+            ]
+        },
+        {"start": 6.0, "end": 8.0, "text": "Magandang umaga", "language": "tl", "words": []}
+    ]
+
+
+class TestAlignWords:
+    """Test word alignment and change statistics"""
+
+    def test_opcodes_match_difflib_format(self):
+        """Test opcodes group the alignment like difflib's get_opcodes"""
+        original = "ang klase ay nagsimula na".split()
+        corrected = "ang klase ay nagsimula na po".split()
+
+        opcodes = get_opcodes(original, corrected, align_words(original, corrected))
+
+        assert opcodes == [("equal", 0, 5, 0, 5), ("insert", 5, 5, 5, 6)]
+
+    def test_case_and_punctuation_fixes_stay_paired(self):
+        """Test a word fixed in case/punctuation aligns with its original"""
+        original = "power house of cell".split()
+        corrected = "powerhouse of the Cell.".split()
+
+        pairs = align_words(original, corrected)
+
+        assert (2, 1) in pairs
+        assert (3, 3) in pairs
+
+    def test_every_word_appears_once_in_order(self):
+        """Test random edits give a complete, ordered alignment"""
+        rng = random.Random(0)
+        vocabulary = ["ang", "mga", "the", "of", "klase", "na", "po", "cell"]
+        for _ in range(200):
+            original = [rng.choice(vocabulary) for _ in range(rng.randint(0, 60))]
+            corrected = list(original)
+            for _ in range(rng.randint(0, 10)):
+                position = rng.randint(0, len(corrected))
+                if rng.random() < 0.5 and corrected:
+                    del corrected[min(position, len(corrected) - 1)]
+                else:
+                    corrected.insert(position, rng.choice(vocabulary))
+
+            pairs = align_words(original, corrected)
+
+            assert [i for i, _ in pairs if i >= 0] == list(range(len(original)))
+            assert [j for _, j in pairs if j >= 0] == list(range(len(corrected)))
+
+    def test_count_changes(self):
+        """Test change statistics keep their keys and meaning"""
+        changes = count_changes("the mitochondria is the power house", "the mitochondria is the powerhouse")
+
+        # Two words replaced by one count as two changes (as with difflib)
+        assert changes == {
+            "word_changes": 2,
+            "additions": 0,
+            "deletions": 0,
+            "similarity_ratio": 8 / 11
+        }
+        assert count_changes("", "")["similarity_ratio"] == 1.0
+
+    def test_hour_long_transcript_is_fast(self):
+        """Test a lecture-length correction (20k words) aligns quickly"""
+        rng = random.Random(1)
+        vocabulary = [f"word{index}" for index in range(300)]
+        weights = [1 / (rank + 1) for rank in range(300)]
+        original = rng.choices(vocabulary, weights, k=20000)
+        corrected = list(original)
+        for _ in range(1000):
+            position = rng.randrange(len(corrected))
+            corrected[position] = corrected[position].capitalize()
+
+        start_time = time.perf_counter()
+        pairs = align_words(original, corrected)
+        elapsed = time.perf_counter() - start_time
+
+        assert all(i == j for i, j in pairs)
+        assert elapsed < 2.0
+
+    def test_length_mismatch_is_fast(self):
+        """Test a short correction of a long transcript aligns in bounded time"""
+        rng = random.Random(2)
+        vocabulary = [f"word{index}" for index in range(300)]
+        original = rng.choices(vocabulary, k=20000)
+        # No shared n-grams to anchor on: one stretch of 20000 x 200 words
+        corrected = rng.choices(vocabulary, k=200)
+
+        for first, second in ((original, corrected), (corrected, original)):
+            start_time = time.perf_counter()
+            pairs = align_words(first, second)
+            elapsed = time.perf_counter() - start_time
+
+            assert [i for i, _ in pairs if i >= 0] == list(range(len(first)))
+            assert [j for _, j in pairs if j >= 0] == list(range(len(second)))
+            assert elapsed < 3.0
+
+
+class TestAlignSegments:
+    """Test corrected segments with timestamps"""
+
+    def test_corrected_words_take_original_times(self):
+        """Test aligned words keep their times and segments keep their boundaries"""
+        segments = align_segments(
+            make_segments(), "The mitochondria is the powerhouse of the cell. Magandang umaga po"
+        )
+
+        assert [segment["text"] for segment in segments] == [
+            "The mitochondria is the", "powerhouse of the cell.", "Magandang umaga po"
+        ]
+        assert [(s["start"], s["end"]) for s in segments] == [(0.0, 3.0), (3.0, 6.0), (6.0, 8.0)]
+
+        words = segments[1]["words"]
+        assert [(w["word"], w["start"], w["end"]) for w in words] == [
+            ("powerhouse", 3.0, 4.0), ("of", 4.0, 5.0), ("the", 5.0, 5.0), ("cell.", 5.0, 6.0)
+        ]
+        # Unchanged words keep the ASR confidence
+        assert segments[0]["words"][1]["probability"] == 0.8
+
+    def test_segments_without_word_timestamps(self):
+        """Test words are spread over segments that have no word times"""
+        segments = align_segments(make_segments()[2:], "Magandang hapon")
+
+        assert [(w["word"], w["start"], w["end"]) for w in segments[0]["words"]] == [
+            ("Magandang", 6.0, 7.0), ("hapon", 7.0, 8.0)
+        ]
+
+    def test_deleted_segment_dropped(self):
+        """Test a segment whose words were all removed is dropped"""
+        segments = align_segments(make_segments(), "the mitochondria is the power house of cell")
+
+        assert len(segments) == 2
+        assert align_segments(make_segments(), "") == []
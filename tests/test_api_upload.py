@@ -0,0 +1,53 @@
+"""
+API tests for the /upload endpoint's request checks
+"""
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("fastapi")
+from fastapi.testclient import TestClient
+
+API_PATH = Path(__file__).parent.parent / "webapp" / "api.py"
+
+
+class TestUploadContentLength:
+    """Test Content-Length is validated before the body is read"""
+
+    @pytest.fixture
+    def client(self, tmp_path, monkeypatch):
+        # The API keeps its data/ directories relative to the working directory
+        monkeypatch.chdir(tmp_path)
+        spec = importlib.util.spec_from_file_location("api", API_PATH)
+        api = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(api)
+        return TestClient(api.app)
+
+    @pytest.mark.parametrize("content_length", ["abc", "-1", "1.5"])
+    def test_malformed_content_length_rejected(self, client, content_length):
+        """Test a non-integer or negative Content-Length is a 400, not a 500"""
+        response = client.post(
+            "/upload",
+            content=b"--boundary--\r\n",
+            headers={
+                "Content-Type": "multipart/form-data; boundary=boundary",
+                "Content-Length": content_length
+            }
+        )
+
+        assert response.status_code == 400
+        assert "Content-Length" in response.json()["detail"]
+
+    def test_oversized_content_length_rejected(self, client):
+        """Test a declared size over the limit is a 413"""
+        response = client.post(
+            "/upload",
+            content=b"--boundary--\r\n",
+            headers={
+                "Content-Type": "multipart/form-data; boundary=boundary",
+                "Content-Length": str(10 ** 15)
+            }
+        )
+
+        assert response.status_code == 413
@@ -0,0 +1,144 @@
+"""
+Unit tests for the transcription cache
+"""
+import os
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add src to path
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+from asr.cache import TranscriptionCache
+from asr.transcript import Transcript
+from asr.whisper_asr import WhisperASR
+
+
+class TestTranscriptionCache:
+    """Test content-addressed transcription cache"""
+
+    def setup_method(self):
+        """Setup for each test"""
+        self.options = {"language": "tl", "beam_size": 5, "temperature": 0.0}
+
+    def write_audio(self, path: Path, content: bytes) -> str:
+        path.write_bytes(content)
+        return str(path)
+
+    def test_key_is_content_addressed(self, tmp_path):
+        """Test identical audio under different names shares a key"""
+        cache = TranscriptionCache(tmp_path / "cache")
+        first = self.write_audio(tmp_path / "a.wav", b"RIFF lecture")
+        second = self.write_audio(tmp_path / "b.wav", b"RIFF lecture")
+        other = self.write_audio(tmp_path / "c.wav", b"RIFF another")
+
+        key = cache.make_key(first, "base", self.options)
+        assert cache.make_key(second, "base", self.options) == key
+        assert cache.make_key(other, "base", self.options) != key
+
+    def test_key_covers_model_and_options(self, tmp_path):
+        """Test model size and decoding options change the key"""
+        cache = TranscriptionCache(tmp_path / "cache")
+        audio = self.write_audio(tmp_path / "a.wav", b"RIFF lecture")
+
+        key = cache.make_key(audio, "base", self.options)
+        assert cache.make_key(audio, "small", self.options) != key
+        assert cache.make_key(audio, "base", {**self.options, "beam_size": 1}) != key
+        assert cache.make_key(audio, "base", {**self.options, "initial_prompt": "Lecture"}) != key
+
+    def test_get_put_roundtrip(self, tmp_path):
+        """Test stored results are returned on hit"""
+        cache = TranscriptionCache(tmp_path / "cache")
+        result = {"text": "magandang umaga po", "segments": [], "duration": 1.5}
+
+        assert cache.get("missing") is None
+        cache.put("abc", result)
+        assert cache.get("abc") == result
+
+    def test_put_transcript_segments(self, tmp_path):
+        """Test a Transcript's segment views are stored as the plain result"""
+        cache = TranscriptionCache(tmp_path / "cache")
+        result = {
+            "text": "ito ay",
+            "segments": [{
+                "start": 0.0, "end": 1.0, "text": "ito ay", "language": "tl",
+                "words": [{"word": "ito", "start": 0.0, "end": 0.5, "probability": 0.9}]
+            }],
+            "language": "tl"
+        }
+        transcript = Transcript.from_result(result)
+
+        cache.put("key", dict(transcript.info, segments=transcript))
+
+        assert cache.get("key") == result
+
+    def test_lru_eviction(self, tmp_path):
+        """Test least recently used entries are evicted over the size bound"""
+        cache = TranscriptionCache(tmp_path / "cache", max_bytes=250)
+        payload = {"text": "x" * 80}
+
+        cache.put("old", payload)
+        cache.put("recent", payload)
+        past = time.time() - 100
+        os.utime(cache.cache_dir / "old.json", (past, past))
+        os.utime(cache.cache_dir / "recent.json", (past + 1, past + 1))
+
+        # Touch "old" so "recent" becomes the least recently used entry
+        assert cache.get("old") == payload
+        cache.put("new", payload)
+
+        assert cache.get("recent") is None
+        assert cache.get("old") == payload
+        assert cache.get("new") == payload
+
+
+class TestBatchCacheHits:
+    """Test batch transcription answers cached files without decoding them"""
+
+    def test_cached_file_not_decoded(self, tmp_path):
+        """Test the prefetch stage skips decoding audio transcribe() has cached"""
+        # Silent audio is never decoded by a model, so none needs loading
+        asr = WhisperASR.__new__(WhisperASR)
+        asr.device, asr.model_size, asr.model_id = "cpu", "base", "base"
+        asr.parallel_workers, asr.pcm_store = 1, None
+        asr.cache = TranscriptionCache(tmp_path / "cache")
+        audio_path = tmp_path / "a.wav"
+        audio_path.write_bytes(b"RIFF lecture")
+        silence = np.zeros(16000, dtype=np.float32)
+        cached = asr.transcribe(str(audio_path), language="tl", vad=True, audio=silence)
+
+        decoded = []
+        asr._load_audio = lambda path: decoded.append(path) or silence
+        results = {}
+        asr._transcribe_prefetched(
+            [str(audio_path)], results.__setitem__, 1, language="tl", vad=True
+        )
+
+        assert decoded == []
+        assert results == {0: cached}
+
+    def test_hits_shared_across_routes(self, tmp_path):
+        """Test a windowed (WebSocket) result is served to full and batched runs"""
+        asr = WhisperASR.__new__(WhisperASR)
+        asr.device, asr.model_size, asr.model_id = "cpu", "base", "base"
+        asr.parallel_workers, asr.pcm_store = 1, None
+        asr.cache = TranscriptionCache(tmp_path / "cache")
+        audio_path = tmp_path / "a.wav"
+        audio_path.write_bytes(b"RIFF lecture")
+        silence = np.zeros(16000, dtype=np.float32)
+        streamed = []
+        cached = asr.transcribe(
+            str(audio_path), language="tl", vad=True, audio=silence, segment_callback=streamed.append
+        )
+
+        # A miss would have to decode the audio
+        def no_decode(path):
+            raise AssertionError(f"decoded {path}")
+        asr._load_audio = no_decode
+        results = {}
+        asr._transcribe_batched([str(audio_path)], 2, results.__setitem__, 1, language="tl", vad=True)
+
+        assert asr.transcribe(str(audio_path), language="tl", vad=True) == cached
+        assert results == {0: cached}
@@ -0,0 +1,182 @@
+"""
+Unit tests for the ASR model registry
+"""
+import sys
+import threading
+from pathlib import Path
+
+# Add src to path
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+from asr.registry import ModelRegistry
+
+
+class TestModelRegistry:
+    """Test multi-model registry (fake loader, no Whisper needed)"""
+
+    def setup_method(self):
+        """Setup for each test"""
+        self.loads = []
+
+        def loader(model_size, device):
+            self.loads.append((model_size, device))
+            return {"model_size": model_size, "device": device}
+
+        # tiny (1024 MB) + base (1536 MB) fit, small (3072 MB) does not
+        self.registry = ModelRegistry(loader, memory_budget_mb=3000)
+
+    def test_models_keyed_by_size_and_device(self):
+        """Test each (model_size, device) loads once and is reused"""
+        with self.registry.acquire("tiny") as model:
+            assert model["model_size"] == "tiny"
+        with self.registry.acquire("tiny") as model:
+            pass
+        with self.registry.acquire("base", "cpu") as model:
+            assert model["device"] == "cpu"
+
+        assert self.loads == [("tiny", None), ("base", "cpu")]
+
+    def test_lru_eviction_of_idle_models(self):
+        """Test the least recently used idle model is evicted for a new one"""
+        with self.registry.acquire("tiny"):
+            pass
+        with self.registry.acquire("base"):
+            pass
+        with self.registry.acquire("small"):
+            pass
+
+        assert not self.registry.is_loaded("tiny")
+        assert not self.registry.is_loaded("base")
+        assert self.registry.is_loaded("small")
+
+    def test_evicted_model_can_still_serve(self):
+        """Test a model evicted after loading still counts as able to serve"""
+        assert not self.registry.can_serve("tiny")
+        self.registry.prewarm([("tiny", None)])
+        with self.registry.acquire("base"):
+            pass
+        with self.registry.acquire("small"):
+            pass
+
+        assert not self.registry.is_loaded("tiny")
+        assert self.registry.can_serve("tiny")
+
+    def test_model_copies_charged_to_budget(self):
+        """Test models holding several copies (parallel workers) are estimated at that size"""
+        registry = ModelRegistry(lambda size, device: {"model_size": size}, memory_budget_mb=3000, copies=2)
+        with registry.acquire("tiny"):
+            pass
+        with registry.acquire("tiny", "cpu"):
+            pass
+
+        # 2 x 1024 MB each: the second load evicts the first
+        assert not registry.is_loaded("tiny")
+        assert registry.status()[0]["memory_mb"] == 2048
+
+    def test_concurrent_loads_reserve_memory(self):
+        """Test models loading at the same time each count against the budget"""
+        both_loading = threading.Barrier(2, timeout=5)
+
+        def loader(model_size, device):
+            if device is not None:
+                both_loading.wait()
+            return {"model_size": model_size, "device": device}
+
+        registry = ModelRegistry(loader, memory_budget_mb=3000)
+        with registry.acquire("base"):
+            pass
+
+        def load(device):
+            with registry.acquire("tiny", device):
+                pass
+
+        threads = [threading.Thread(target=load, args=(device,)) for device in ("cpu", "cuda")]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # 1536 + 2 x 1024 MB exceeds the budget, so the idle base model makes room
+        assert not registry.is_loaded("base")
+        assert registry.is_loaded("tiny", "cpu") and registry.is_loaded("tiny", "cuda")
+
+    def test_in_use_model_never_evicted(self):
+        """Test a model held by a request survives memory pressure"""
+        with self.registry.acquire("base") as model:
+            with self.registry.acquire("small"):
+                pass
+            assert self.registry.is_loaded("base")
+            assert model["model_size"] == "base"
+            assert not self.registry.unload("base")
+
+        assert self.registry.unload("base")
+
+    def test_prewarm_and_status(self):
+        """Test pre-warming loads models and status reports them idle"""
+        self.registry.prewarm([("tiny", None), ("base", "cpu")])
+
+        status = {(s["model_size"], s["device"]): s for s in self.registry.status()}
+        assert set(status) == {("tiny", "auto"), ("base", "cpu")}
+        assert all(s["in_use"] == 0 for s in status.values())
+
+    def test_evicted_models_are_closed(self):
+        """Test models exposing close() release their resources, outside the registry lock"""
+        closed = []
+
+        class ClosableModel:
+            def __init__(self, model_size):
+                self.model_size = model_size
+
+            def close(self):
+                # status() must not wait on a slow shutdown
+                closed.append((self.model_size, registry._lock.locked()))
+
+        registry = ModelRegistry(lambda size, device: ClosableModel(size), memory_budget_mb=3000)
+        with registry.acquire("base"):
+            pass
+        with registry.acquire("small"):
+            pass
+        assert registry.unload("small")
+
+        assert closed == [("base", False), ("small", False)]
+
+    def test_warmup_runs_before_model_is_served(self):
+        """Test warm-up runs once per load and measured memory replaces the estimate"""
+        warmed = []
+
+        class WarmableModel:
+            def __init__(self, model_size):
+                self.model_size = model_size
+
+            def warmup(self):
+                warmed.append(self.model_size)
+
+            def memory_mb(self):
+                return 150.0
+
+        registry = ModelRegistry(lambda size, device: WarmableModel(size), warmup=True)
+        registry.prewarm([("base", None)])
+        with registry.acquire("base") as model:
+            assert warmed == ["base"]
+
+        [status] = registry.status()
+        assert status["state"] == "ready"
+        assert status["memory_mb"] == 150.0
+        assert "warmup_time" in status
+
+    def test_failed_load_reported_in_status(self):
+        """Test a model that fails to load is reported as failed and can be retried"""
+        def loader(model_size, device):
+            raise RuntimeError("checkpoint missing")
+
+        registry = ModelRegistry(loader)
+        registry.prewarm([("large", "cuda")])
+
+        assert registry.state("large", "cuda") == "failed"
+        [status] = registry.status()
+        assert status["error"] == "checkpoint missing"
+
+        registry.loader = lambda size, device: {"model_size": size}
+        with registry.acquire("large", "cuda"):
+            assert registry.state("large", "cuda") == "ready"
+        assert [s["state"] for s in registry.status()] == ["ready"]
@@ -0,0 +1,78 @@
+"""
+Unit tests for batched decoding helpers
+"""
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add src to path
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+from asr.batching import is_silent, needs_fallback, segments_from_tokens
+
+# Fake vocabulary: ids below TS are text, TS + n is the timestamp n * 20 ms
+TS = 1000
+WORDS = {1: " hello", 2: " world", 3: " magandang", 4: " umaga"}
+
+
+def decode(tokens):
+    return "".join(WORDS[token] for token in tokens)
+
+
+class TestSegmentsFromTokens:
+    """Test splitting decoded window tokens into timed segments"""
+
+    def test_timestamp_pairs_become_segments(self):
+        """Test <|t0|> text <|t1|><|t1|> text <|t2|> yields two segments"""
+        tokens = [TS, 1, 2, TS + 120, TS + 120, 3, 4, TS + 250]
+        segments = segments_from_tokens(tokens, TS, 30.0, decode)
+
+        assert [(s["start"], s["end"]) for s in segments] == [(0.0, 2.4), (2.4, 5.0)]
+        assert [s["text"] for s in segments] == [" hello world", " magandang umaga"]
+        assert segments[1]["tokens"] == [3, 4]
+
+    def test_unterminated_segment_runs_to_window_end(self):
+        """Test text after the last timestamp ends at the window end"""
+        tokens = [TS, 1, TS + 100, TS + 100, 2]
+        segments = segments_from_tokens(tokens, TS, 12.5, decode)
+
+        assert segments[-1]["start"] == 2.0
+        assert segments[-1]["end"] == 12.5
+
+    def test_no_timestamps_is_one_segment(self):
+        """Test a window decoded without timestamps covers the whole window"""
+        segments = segments_from_tokens([1, 2], TS, 8.0, decode)
+
+        assert len(segments) == 1
+        assert (segments[0]["start"], segments[0]["end"]) == (0.0, 8.0)
+
+    def test_times_clipped_to_short_window(self):
+        """Test timestamps past a short (padded) window are clipped to it"""
+        segments = segments_from_tokens([TS, 1, TS + 1400], TS, 10.0, decode)
+
+        assert segments[0]["end"] == 10.0
+
+
+class TestFallbackRules:
+    """Test temperature fallback and silence detection"""
+
+    def result(self, compression_ratio=1.5, avg_logprob=-0.3, no_speech_prob=0.1):
+        return SimpleNamespace(
+            compression_ratio=compression_ratio,
+            avg_logprob=avg_logprob,
+            no_speech_prob=no_speech_prob
+        )
+
+    def test_repetitive_or_unsure_output_retried(self):
+        """Test repetitive or low-confidence windows are re-decoded"""
+        assert not needs_fallback(self.result())
+        assert needs_fallback(self.result(compression_ratio=3.0))
+        assert needs_fallback(self.result(avg_logprob=-1.5))
+
+    def test_silence_not_retried_and_dropped(self):
+        """Test likely silence is neither retried nor kept"""
+        silent = self.result(avg_logprob=-1.5, no_speech_prob=0.9)
+
+        assert not needs_fallback(silent)
+        assert is_silent(silent)
+        assert not is_silent(self.result(no_speech_prob=0.9))
@@ -0,0 +1,230 @@
+"""
+Unit tests for the transcript catalog
+"""
+import sys
+import json
+import shutil
+import tempfile
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+import utils.catalog as catalog_module
+from utils.catalog import TranscriptCatalog
+
+
+class TestTranscriptCatalog:
+    """Test indexed listing, filtering and syncing with files on disk"""
+
+    def setup_method(self):
+        """Setup for each test"""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.transcripts_dir = self.temp_dir / "transcripts"
+        self.corrections_dir = self.temp_dir / "corrections"
+        self.transcripts_dir.mkdir()
+        self.corrections_dir.mkdir()
+        self.catalog = TranscriptCatalog(self.temp_dir / "catalog.db")
+
+    def teardown_method(self):
+        """Cleanup after each test"""
+        shutil.rmtree(self.temp_dir)
+
+    def write_transcript(self, transcript_id, language="en", day="2025-01-01", duration=60.0):
+        data = {
+            "id": transcript_id,
+            "audio_file": f"{transcript_id}.mp3",
+            "text": "hello",
+            "language": language,
+            "duration": duration,
+            "segments": [{"start": 0, "end": 1, "text": "hello", "words": []}],
+            "model": "base",
+            "timestamp": f"{day}T10:00:00"
+        }
+        path = self.transcripts_dir / f"{transcript_id}_transcript.json"
+        path.write_text(json.dumps(data), encoding="utf-8")
+        return data, path
+
+    def write_correction(self, transcript_id, annotator="ana", day="2025-02-01"):
+        data = {
+            "id": transcript_id,
+            "transcript_id": transcript_id,
+            "timestamp": f"{day}T09:00:00",
+            "original": "helo",
+            "corrected": "hello",
+            "metadata": {"annotator": annotator},
+            "changes": {"word_changes": 1}
+        }
+        path = self.corrections_dir / f"{transcript_id}_corrected.json"
+        path.write_text(json.dumps(data), encoding="utf-8")
+        return data, path
+
+    def test_list_sorted_and_paginated(self):
+        """Test newest-first listing with total count and offset paging"""
+        for index in range(5):
+            self.catalog.add_transcript(*self.write_transcript(f"t{index}", day=f"2025-01-0{index + 1}"))
+
+        page, total = self.catalog.list_transcripts(limit=2, offset=1)
+
+        assert total == 5
+        assert [row["id"] for row in page] == ["t3", "t2"]
+        assert set(page[0]) == {"id", "audio_file", "language", "duration", "timestamp", "has_correction"}
+
+    def test_filters(self):
+        """Test language, date range, has_correction and annotator filters"""
+        self.catalog.add_transcript(*self.write_transcript("a", "en", "2025-01-05"))
+        self.catalog.add_transcript(*self.write_transcript("b", "tl", "2025-01-10"))
+        self.catalog.add_transcript(*self.write_transcript("c", "tl", "2025-01-20"))
+        self.catalog.add_correction(*self.write_correction("b", annotator="ana"))
+        self.catalog.add_correction(*self.write_correction("c", annotator="ben"))
+
+        def ids(**filters):
+            return [row["id"] for row in self.catalog.list_transcripts(**filters)[0]]
+
+        assert ids(language="tl") == ["c", "b"]
+        assert ids(date_from="2025-01-05", date_to="2025-01-10") == ["b", "a"]
+        assert ids(has_correction=False) == ["a"]
+        assert ids(annotator="ben") == ["c"]
+
+        corrections, total = self.catalog.list_corrections(annotator="ana")
+        assert total == 1
+        assert corrections[0]["transcript_id"] == "b"
+        assert corrections[0]["changes"] == 1
+
+    def test_invalid_sort_rejected(self):
+        """Test sorting is limited to indexed columns"""
+        with pytest.raises(ValueError):
+            self.catalog.list_transcripts(sort="text; DROP TABLE transcripts")
+
+    def test_sync_indexes_changed_files_only(self):
+        """Test sync picks up new files, skips unchanged ones and drops deleted ones"""
+        self.write_transcript("a")
+        self.write_transcript("b")
+        self.write_correction("a")
+
+        first = self.catalog.sync(self.transcripts_dir, self.corrections_dir)
+        assert first["transcripts_indexed"] == 2
+        assert first["corrections_indexed"] == 1
+
+        (self.transcripts_dir / "b_transcript.json").unlink()
+        second = self.catalog.sync(self.transcripts_dir, self.corrections_dir)
+        assert second["transcripts_indexed"] == 0
+        assert second["transcripts_removed"] == 1
+
+        rows, total = self.catalog.list_transcripts()
+        assert total == 1
+        assert rows[0]["has_correction"] is True
+
+    def test_sync_reads_binary_transcripts(self):
+        """Test binary (.ptx) transcripts are indexed like JSON ones"""
+        from utils.transcript_format import write_transcript
+
+        data, path = self.write_transcript("a")
+        path.unlink()
+        write_transcript(self.transcripts_dir / "a_transcript.ptx", data)
+
+        counts = self.catalog.sync(self.transcripts_dir, self.corrections_dir)
+
+        assert counts["transcripts_indexed"] == 1
+        assert self.catalog.search("hello")[0][0]["transcript_id"] == "a"
+
+    def test_full_rebuild(self):
+        """Test a full sync re-reads every file"""
+        self.write_transcript("a")
+        self.catalog.sync(self.transcripts_dir, self.corrections_dir)
+
+        counts = self.catalog.sync(self.transcripts_dir, self.corrections_dir, full=True)
+
+        assert counts["transcripts_indexed"] == 1
+        assert self.catalog.list_transcripts()[1] == 1
+
+    def test_search_returns_segment_times(self):
+        """Test hits carry the matching segment's start/end and a highlighted snippet"""
+        data, path = self.write_transcript("lecture")
+        data["segments"] = [
+            {"start": 0.0, "end": 4.0, "text": "Magandang umaga sa inyong lahat", "words": []},
+            {"start": 4.0, "end": 9.5, "text": "Today we discuss photosynthesis", "words": []}
+        ]
+        self.catalog.add_transcript(data, path)
+
+        hits, has_more = self.catalog.search("photosynthesis")
+
+        assert not has_more
+        assert len(hits) == 1
+        assert (hits[0]["start"], hits[0]["end"]) == (4.0, 9.5)
+        assert hits[0]["transcript_id"] == "lecture"
+        assert "<mark>photosynthesis</mark>" in hits[0]["snippet"]
+
+    def test_search_phrases_prefixes_and_code_switching(self):
+        """Test phrase and prefix queries across Tagalog/English text"""
+        data, path = self.write_transcript("lecture")
+        data["segments"] = [
+            {"start": 0.0, "end": 3.0, "text": "Kailangan nating mag-aral ng calculus", "words": []},
+            {"start": 3.0, "end": 6.0, "text": "Ang calculus ay mahalaga pó", "words": []}
+        ]
+        self.catalog.add_transcript(data, path)
+
+        def starts(query):
+            return [hit["start"] for hit in self.catalog.search(query)[0]]
+
+        assert starts('"ng calculus"') == [0.0]
+        assert starts("mag-aral") == [0.0]
+        assert starts("mahala*") == [3.0]
+        assert starts("po calculus") == [3.0]
+        assert starts("calculus ang") == [3.0]
+
+    def test_search_corrections_and_reindexing(self):
+        """Test corrected text is searchable and re-saving replaces old text"""
+        data, path = self.write_transcript("lecture")
+        data["segments"] = [
+            {"start": 0.0, "end": 5.0, "text": "the mitochondria is the", "words": []},
+            {"start": 5.0, "end": 10.0, "text": "power house of the cell", "words": []}
+        ]
+        self.catalog.add_transcript(data, path)
+        self.catalog.add_correction(*self.write_correction("lecture"))
+        correction, correction_path = self.write_correction("lecture")
+        correction["corrected"] = "The mitochondria is the powerhouse of the cell."
+        self.catalog.add_correction(correction, correction_path)
+
+        hits, _ = self.catalog.search("powerhouse", source="correction")
+        assert len(hits) == 1
+        assert (hits[0]["start"], hits[0]["end"]) == (0.0, 10.0)
+        assert self.catalog.search("hello", source="correction")[0] == []
+
+    def test_search_uses_aligned_correction_segments(self):
+        """Test corrections saved with aligned segments are indexed at their times"""
+        data, path = self.write_transcript("lecture")
+        self.catalog.add_transcript(data, path)
+        correction, correction_path = self.write_correction("lecture")
+        correction["segments"] = [
+            {"start": 0.0, "end": 2.0, "text": "Good morning class", "words": []},
+            {"start": 12.5, "end": 15.0, "text": "today we study photosynthesis", "words": []}
+        ]
+        self.catalog.add_correction(correction, correction_path)
+
+        hits, _ = self.catalog.search("photosynthesis", source="correction")
+
+        assert [(hit["start"], hit["end"]) for hit in hits] == [(12.5, 15.0)]
+
+    def test_relevance_floor_respects_filters(self, monkeypatch):
+        """Test filtered relevance search still finds matches older than newer unfiltered ones"""
+        monkeypatch.setattr(catalog_module, "RELEVANCE_CANDIDATES", 3)
+        for transcript_id in ("older", "newer"):
+            data, path = self.write_transcript(transcript_id)
+            data["segments"] = [
+                {"start": float(index), "end": index + 1.0, "text": f"photosynthesis part {index}", "words": []}
+                for index in range(4)
+            ]
+            self.catalog.add_transcript(data, path)
+
+        hits, _ = self.catalog.search("photosynthesis", transcript_id="older")
+
+        assert len(hits) == 3
+        assert {hit["transcript_id"] for hit in hits} == {"older"}
+
+    def test_search_rejects_empty_query(self):
+        """Test a query without words is rejected instead of reaching FTS5"""
+        with pytest.raises(ValueError):
+            self.catalog.search('"" * -')
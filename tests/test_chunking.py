@@ -0,0 +1,68 @@
+"""
+Unit tests for audio chunking and chunk stitching
+"""
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add src to path
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+from asr.chunking import SAMPLE_RATE, pad_windows, split_windows, trim_segments
+
+
+def word(text, start, end):
+    return {"word": text, "start": start, "end": end, "probability": 1.0}
+
+
+class TestSplitWindows:
+    """Test cutting audio at quiet points"""
+
+    def test_cuts_in_pauses_and_covers_audio(self):
+        """Test windows are bounded, contiguous and cut at silence"""
+        audio = np.full(75 * SAMPLE_RATE, 0.5, dtype=np.float32)
+        # Pauses at 27-28 s and 55-56 s
+        audio[27 * SAMPLE_RATE:28 * SAMPLE_RATE] = 0.0
+        audio[55 * SAMPLE_RATE:56 * SAMPLE_RATE] = 0.0
+
+        windows = split_windows(audio, target_seconds=30.0)
+
+        assert windows[0][0] == 0 and windows[-1][1] == len(audio)
+        assert all(end == next_start for (_, end), (next_start, _) in zip(windows, windows[1:]))
+        assert all(end - start <= 30 * SAMPLE_RATE for start, end in windows)
+        assert 27 * SAMPLE_RATE <= windows[0][1] < 28 * SAMPLE_RATE
+
+    def test_short_audio_is_one_window(self):
+        """Test audio shorter than a window is not cut"""
+        audio = np.zeros(10 * SAMPLE_RATE, dtype=np.float32)
+        assert split_windows(audio) == [(0, len(audio))]
+
+    def test_pad_windows_clips_to_audio(self):
+        """Test overlap padding stays inside the audio"""
+        padded = pad_windows([(0, 10 * SAMPLE_RATE), (10 * SAMPLE_RATE, 20 * SAMPLE_RATE)], 1.0, 20 * SAMPLE_RATE)
+        assert padded == [(0, 11 * SAMPLE_RATE), (9 * SAMPLE_RATE, 20 * SAMPLE_RATE)]
+
+
+class TestTrimSegments:
+    """Test overlap de-duplication when stitching chunks"""
+
+    def test_boundary_words_kept_once(self):
+        """Test a word heard by two overlapping chunks is kept by one"""
+        first = [{"start": 8.0, "end": 10.6, "text": "magandang umaga class",
+                  "words": [word("magandang", 8.0, 8.6), word("umaga", 8.7, 9.9), word("class", 10.1, 10.6)]}]
+        second = [{"start": 9.2, "end": 11.5, "text": "umaga class today",
+                   "words": [word("umaga", 9.2, 9.9), word("class", 10.1, 10.6), word("today", 10.8, 11.5)]}]
+
+        stitched = trim_segments(first, float("-inf"), 10.0) + trim_segments(second, 10.0, float("inf"))
+
+        words = [w["word"] for seg in stitched for w in seg["words"]]
+        assert words == ["magandang", "umaga", "class", "today"]
+        assert stitched[1]["text"] == "class today"
+        assert stitched[1]["start"] == 10.1
+
+    def test_segments_without_words_use_midpoint(self):
+        """Test segments lacking word timestamps are owned by their midpoint"""
+        segments = [{"start": 9.0, "end": 10.5, "text": "a", "words": []},
+                    {"start": 9.8, "end": 12.0, "text": "b", "words": []}]
+        assert [s["text"] for s in trim_segments(segments, 10.0, 20.0)] == ["b"]
@@ -9,7 +9,7 @@ from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent / "src"))
 
 from correction.rules import CorrectionRules
-from correction.error_corrector import ErrorCorrector
+from correction.error_corrector import ErrorCorrector, plan_micro_batches
 from correction.models import CorrectionConfig, CorrectionLevel, ErrorType
 
 
@@ -87,6 +87,47 @@ class TestCorrectionRules:
         suggestions = self.rules.get_suggestions('poo')
         assert 'po' in suggestions or len(suggestions) > 0
 
+    def test_word_splits_single_pass(self):
+        """Test word splits and their change descriptions"""
+        corrected, changes = self.rules._split_concatenated_words("Commustaka, anoba")
+        assert corrected == "kumusta ka, ano ba"
+        assert changes == ["Split: 'commustaka' -> 'kumusta ka'", "Split: 'anoba' -> 'ano ba'"]
+
+    def test_common_errors_word_boundaries(self):
+        """Test common errors only match whole words"""
+        corrected, changes = self.rules.apply_rules("ungol pra sa gus2", 'both')
+        assert 'ungol' in corrected.lower()
+        assert 'para sa gusto' in corrected
+        assert "'gus2' -> 'gusto'" in changes
+
+    def test_phrase_matcher_longest_match(self):
+        """Test phrase matcher prefers the longest phrase"""
+        from correction.rules import PhraseMatcher
+
+        matcher = PhraseMatcher({'pra': 'para', 'pra sa': 'para sa', 'sa': 'SA'})
+        text, matched = matcher.replace("PRA sa, pra saan")
+        assert text == "para sa, para saan"
+        assert matched == [('pra', 'para'), ('pra sa', 'para sa')]
+
+    def test_rule_plans_filter_by_language(self):
+        """Test precompiled rule plans only hold rules for their language"""
+        en_rules = [r for step in self.rules.rule_plans['en'] for r in step.rules]
+        tl_rules = [r for step in self.rules.rule_plans['tl'] for r in step.rules]
+
+        assert all(r.language in ('en', 'both') for r in en_rules)
+        assert all(r.language in ('tl', 'both') for r in tl_rules)
+        assert len([r for step in self.rules.rule_plans['both'] for r in step.rules]) == len(self.rules.rules)
+
+    def test_literal_rules_merged(self):
+        """Test literal phonetic rules run as one step with per-rule descriptions"""
+        literal_steps = [s for s in self.rules.rule_plans['en'] if s.literal]
+        assert len(literal_steps) == 1
+        assert len(literal_steps[0].rules) >= 6
+
+        corrected, changes = self.rules.apply_rules("dat pormula is Bery good", 'en')
+        assert corrected == "That formula is very good"
+        assert changes == ['P -> F confusion', 'B -> V confusion', 'D -> TH correction']
+
 
 class TestErrorCorrector:
     """Test error corrector (rules + ML)"""
@@ -193,6 +234,43 @@ class TestErrorCorrector:
         assert len(results) == len(texts)
         assert all(hasattr(r, 'corrected_text') for r in results)
 
+    def test_batch_matches_single_correction(self):
+        """Test batch correction gives the same output as correcting one by one"""
+        texts = ["dis is a example", "salamat ho sa inyo", "kung saan  ba   yan?"]
+        config = CorrectionConfig(language_hint='both')
+
+        batch = self.corrector.correct_batch(texts, config)
+        single = [self.corrector.correct(text, config) for text in texts]
+
+        assert [r.corrected_text for r in batch] == [r.corrected_text for r in single]
+
+    def test_plan_micro_batches(self):
+        """Test length-sorted micro-batch planning under a token budget"""
+        batches = plan_micro_batches([10, 200, 12, 11, 190], max_batch_tokens=400)
+
+        assert batches == [[0, 3, 2], [4, 1]]
+        # An oversized item still gets its own batch
+        assert plan_micro_batches([1000], max_batch_tokens=400) == [[0]]
+
+    def test_transcript_correction(self):
+        """Test segment-by-segment transcript correction"""
+        segments = [
+            {"start": 0.0, "end": 2.5, "text": "dis is a example", "language": "en"},
+            {"start": 2.5, "end": 4.0, "text": "salamat ho", "language": "tl"},
+        ]
+
+        stream = self.corrector.correct_transcript(iter(segments))
+        assert not isinstance(stream, list)
+
+        results = list(stream)
+        assert len(results) == 2
+        assert results[0].language == 'en'
+        assert results[0].corrected_text == "This is an example"
+        assert (results[1].start, results[1].end) == (2.5, 4.0)
+        assert results[1].language == 'tl'
+        assert 'po' in results[1].corrected_text
+        assert results[1].to_dict()['start'] == 2.5
+
 
 class TestCorrectionModels:
     """Test correction data models"""
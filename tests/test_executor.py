@@ -0,0 +1,84 @@
+"""
+Unit tests for the bounded executor
+"""
+import sys
+import time
+import asyncio
+import threading
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+from utils.executor import BoundedExecutor, QueueFullError
+
+
+class TestBoundedExecutor:
+    """Test concurrency limit and backpressure"""
+
+    def test_runs_off_event_loop(self):
+        """Test blocking calls run in worker threads and return results"""
+        executor = BoundedExecutor("test", max_workers=2, max_queued=2)
+
+        async def main():
+            loop_thread = threading.get_ident()
+            result, worker_thread = await executor.run(
+                lambda x: (x * 2, threading.get_ident()), 21
+            )
+            return result, worker_thread != loop_thread
+
+        assert asyncio.run(main()) == (42, True)
+        executor.shutdown()
+
+    def test_queue_full_raises(self):
+        """Test submissions beyond workers + queue fail fast"""
+        executor = BoundedExecutor("test", max_workers=1, max_queued=1)
+        release = threading.Event()
+
+        async def main():
+            first = asyncio.ensure_future(executor.run(release.wait))
+            second = asyncio.ensure_future(executor.run(release.wait))
+            await asyncio.sleep(0.05)
+
+            status = executor.status()
+            assert (status["running"], status["queued"]) == (1, 1)
+            with pytest.raises(QueueFullError):
+                await executor.run(time.sleep, 0)
+
+            release.set()
+            await asyncio.gather(first, second)
+            assert executor.queue_position() == 0
+
+        asyncio.run(main())
+        executor.shutdown()
+
+    def test_blocking_callers_share_the_limit(self):
+        """Test call() from other threads waits for a worker and is counted in status"""
+        executor = BoundedExecutor("test", max_workers=1, max_queued=0)
+        release = threading.Event()
+        results = []
+        callers = [
+            threading.Thread(target=lambda: results.append(executor.call(release.wait)))
+            for _ in range(2)
+        ]
+        for caller in callers:
+            caller.start()
+        time.sleep(0.05)
+
+        status = executor.status()
+        assert (status["running"], status["queued"]) == (1, 1)
+
+        async def submit():
+            await executor.run(time.sleep, 0)
+
+        with pytest.raises(QueueFullError):
+            asyncio.run(submit())
+
+        release.set()
+        for caller in callers:
+            caller.join()
+        assert results == [True, True]
+        assert executor.queue_position() == 0
+        executor.shutdown()
@@ -0,0 +1,68 @@
+"""
+Unit tests for HTTP range helpers
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+from utils.http_range import (
+    RangeNotSatisfiable, etag_matches, file_validators, iter_file_range, parse_range_header
+)
+
+
+class TestRangeParsing:
+    """Test Range header parsing"""
+
+    def test_range_forms(self):
+        """Test explicit, open-ended and suffix ranges"""
+        assert parse_range_header("bytes=0-99", 1000) == (0, 99)
+        assert parse_range_header("bytes=500-", 1000) == (500, 999)
+        assert parse_range_header("bytes=-100", 1000) == (900, 999)
+        assert parse_range_header("bytes=900-5000", 1000) == (900, 999)
+
+    def test_ignored_headers(self):
+        """Test missing, malformed and multi-range headers mean the whole file"""
+        assert parse_range_header(None, 1000) is None
+        assert parse_range_header("bytes=abc-", 1000) is None
+        assert parse_range_header("bytes=0-1,5-9", 1000) is None
+        assert parse_range_header("items=0-1", 1000) is None
+        assert parse_range_header("bytes=-", 1000) is None
+
+    def test_signed_positions_ignored(self):
+        """Test signs and other non-digits int() accepts do not parse as positions"""
+        assert parse_range_header("bytes=--5", 100) is None
+        assert parse_range_header("bytes=+5-9", 100) is None
+        assert parse_range_header("bytes=0--9", 100) is None
+        assert parse_range_header("bytes=1_0-", 100) is None
+
+    def test_unsatisfiable(self):
+        """Test ranges past the end are rejected"""
+        with pytest.raises(RangeNotSatisfiable):
+            parse_range_header("bytes=1000-", 1000)
+
+
+class TestRangeReads:
+    """Test ranged reads and validators"""
+
+    def test_iter_file_range(self, tmp_path):
+        """Test only the requested bytes are read"""
+        path = tmp_path / "lecture.wav"
+        path.write_bytes(bytes(range(256)) * 10)
+
+        data = b"".join(iter_file_range(str(path), 250, 261, chunk_size=4))
+        assert data == (bytes(range(256)) * 10)[250:262]
+
+    def test_etag_changes_with_file(self, tmp_path):
+        """Test ETag matching and invalidation on modification"""
+        path = tmp_path / "lecture.wav"
+        path.write_bytes(b"v1")
+        etag, _ = file_validators(path.stat())
+        assert etag_matches(etag, etag)
+        assert etag_matches(f'W/{etag}, "other"', etag)
+
+        path.write_bytes(b"v2 longer")
+        assert not etag_matches(etag, file_validators(path.stat())[0])
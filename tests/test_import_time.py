@@ -0,0 +1,63 @@
+"""
+Import-time benchmark for the API server
+
+The Electron app waits for the backend to bind its port, so importing the
+API must not pull in torch, Whisper or transformers (they load on first
+inference via utils.lazy). Run with -s to see the measured times.
+"""
+import json
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+
+# Wall-clock budget for importing webapp/api.py in a fresh interpreter
+IMPORT_BUDGET_SECONDS = 1.0
+
+HEAVY_MODULES = ["torch", "whisper", "transformers", "librosa"]
+
+
+def run_import(code: str, cwd: Path) -> dict:
+    """Run import code in a fresh interpreter and return its JSON report"""
+    script = textwrap.dedent(f"""
+        import json, sys, time
+        sys.path.insert(0, {str(ROOT / "src")!r})
+        start = time.perf_counter()
+        {code}
+        elapsed = time.perf_counter() - start
+        print(json.dumps({{
+            "seconds": elapsed,
+            "heavy": [name for name in {HEAVY_MODULES!r} if name in sys.modules]
+        }}))
+    """)
+    output = subprocess.run(
+        [sys.executable, "-c", script], cwd=cwd, capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+class TestImportTime:
+    """Keep backend startup fast"""
+
+    def test_src_modules_defer_heavy_imports(self, tmp_path):
+        """Test ASR and correction modules import without torch/whisper/transformers"""
+        report = run_import(
+            "import asr.whisper_asr, asr.registry, correction, utils.jobs, utils.uploads",
+            tmp_path
+        )
+        print(f"\nsrc modules: {report['seconds']:.3f}s")
+        assert report["heavy"] == []
+
+    def test_api_import_within_budget(self, tmp_path):
+        """Test the API module imports quickly and without heavy dependencies"""
+        report = run_import(
+            "import importlib.util\n"
+            f"        spec = importlib.util.spec_from_file_location('api', {str(ROOT / 'webapp' / 'api.py')!r})\n"
+            "        spec.loader.exec_module(importlib.util.module_from_spec(spec))",
+            tmp_path
+        )
+        print(f"\nwebapp/api.py: {report['seconds']:.3f}s")
+        assert report["heavy"] == []
+        assert report["seconds"] < IMPORT_BUDGET_SECONDS
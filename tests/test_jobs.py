@@ -0,0 +1,85 @@
+"""
+Unit tests for the persistent job queue
+"""
+import sys
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+from utils.jobs import JobQueue
+
+
+class TestJobQueue:
+    """Test job submission, progress and persistence"""
+
+    def setup_method(self):
+        """Setup for each test"""
+        self.seen = []
+
+    def make_queue(self, tmp_path) -> JobQueue:
+        queue = JobQueue(tmp_path / "jobs.db")
+
+        def transcribe(payload, progress):
+            progress(0, 60.0)
+            progress(30.0)
+            self.seen.append(payload["audio_filename"])
+            return {"transcript_id": payload["audio_filename"]}
+
+        def broken(payload, progress):
+            raise RuntimeError("decoder crashed")
+
+        queue.register("transcribe", transcribe)
+        queue.register("broken", broken)
+        return queue
+
+    def test_submit_returns_immediately_with_position(self, tmp_path):
+        """Test submitted jobs wait in order until a worker runs them"""
+        queue = self.make_queue(tmp_path)
+        first = queue.submit("transcribe", {"audio_filename": "a.wav"})
+        second = queue.submit("transcribe", {"audio_filename": "b.wav"})
+
+        assert queue.get(first)["state"] == "queued"
+        assert queue.get(second)["position"] == 2
+        assert self.seen == []
+
+    def test_run_reports_result_and_progress(self, tmp_path):
+        """Test a finished job carries its result and 100% progress"""
+        queue = self.make_queue(tmp_path)
+        job_id = queue.submit("transcribe", {"audio_filename": "a.wav"})
+
+        assert queue.run_next()
+        job = queue.get(job_id)
+        assert job["state"] == "done"
+        assert job["result"] == {"transcript_id": "a.wav"}
+        assert job["total"] == 60.0
+        assert job["percent"] == 100.0
+        assert not queue.run_next()
+
+    def test_failed_job_records_error(self, tmp_path):
+        """Test handler exceptions mark the job failed"""
+        queue = self.make_queue(tmp_path)
+        job_id = queue.submit("broken", {})
+
+        queue.run_next()
+        job = queue.get(job_id)
+        assert job["state"] == "failed"
+        assert "decoder crashed" in job["error"]
+
+    def test_jobs_survive_restart(self, tmp_path):
+        """Test queued and interrupted jobs are picked up by a new queue"""
+        queue = self.make_queue(tmp_path)
+        job_id = queue.submit("transcribe", {"audio_filename": "a.wav"})
+        queue._claim()  # Simulate a crash while running
+        assert queue.get(job_id)["state"] == "running"
+
+        restarted = self.make_queue(tmp_path)
+        restarted.start()
+        deadline = time.time() + 5
+        while restarted.get(job_id)["state"] != "done" and time.time() < deadline:
+            time.sleep(0.02)
+        restarted.stop(timeout=5)
+
+        assert restarted.get(job_id)["state"] == "done"
+        assert self.seen == ["a.wav"]
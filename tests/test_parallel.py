@@ -0,0 +1,91 @@
+"""
+Unit tests for parallel chunked transcription recovering from dead workers
+"""
+import os
+import sys
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add src to path
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+import asr.whisper_asr as whisper_asr_module
+from asr.audio import SAMPLE_RATE
+from asr.parallel import ParallelTranscriber
+from asr.whisper_asr import WhisperASR
+
+
+def fake_chunk(audio, crash):
+    """Worker stand-in: dies like an OOM-killed process, or 'transcribes' the chunk"""
+    if crash:
+        os._exit(1)
+    middle = len(audio) / SAMPLE_RATE / 2
+    return {"language": "en", "segments": [{"start": middle, "end": middle + 1.0, "text": "chunk"}]}
+
+
+class FlakyTranscriber(ParallelTranscriber):
+    """Pool of plain processes (no model); the first `crashing` pools lose a worker"""
+
+    started = 0
+    crashing = 0
+
+    def __init__(self, model_size, workers=None, quantize=None, quantized_dir=None):
+        FlakyTranscriber.started += 1
+        self.model_size = model_size
+        self.workers = workers
+        self.crash = FlakyTranscriber.started <= FlakyTranscriber.crashing
+        self._pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("fork"))
+
+    def submit(self, audio, decode_options):
+        return self._pool.submit(fake_chunk, audio, self.crash)
+
+
+class TestBrokenPool:
+    """Test a worker dying does not leave WhisperASR with a dead pool"""
+
+    def setup_method(self):
+        """Setup for each test"""
+        FlakyTranscriber.started = 0
+        self.asr = WhisperASR.__new__(WhisperASR)
+        self.asr.device, self.asr.model_size = "cpu", "base"
+        self.asr.quantize, self.asr.quantized_dir, self.asr._parallel = None, None, None
+        # Three 60 s chunks
+        self.audio = np.zeros(150 * SAMPLE_RATE, dtype=np.float32)
+
+    def teardown_method(self):
+        self.asr.close()
+
+    def transcribe(self):
+        info = {}
+        segments = list(self.asr._transcribe_parallel(self.audio, {"language": None}, 2, info, None, None))
+        return dict(info, segments=segments)
+
+    def test_restarts_pool_when_worker_dies(self, monkeypatch):
+        """Test the pool is restarted once and every chunk is still transcribed"""
+        monkeypatch.setattr(whisper_asr_module, "ParallelTranscriber", FlakyTranscriber)
+        FlakyTranscriber.crashing = 1
+
+        result = self.transcribe()
+
+        assert FlakyTranscriber.started == 2
+        assert len(result["segments"]) == 3
+        assert result["language"] == "en"
+
+    def test_next_call_works_after_pool_breaks_twice(self, monkeypatch):
+        """Test a second failure is raised, and the following call gets a fresh pool"""
+        monkeypatch.setattr(whisper_asr_module, "ParallelTranscriber", FlakyTranscriber)
+        FlakyTranscriber.crashing = 2
+
+        with pytest.raises(BrokenProcessPool):
+            self.transcribe()
+        assert self.asr._parallel is None
+
+        result = self.transcribe()
+
+        assert FlakyTranscriber.started == 3
+        assert len(result["segments"]) == 3
@@ -0,0 +1,89 @@
+"""
+Unit tests for the memory-mapped PCM audio store
+"""
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add src to path
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+import asr.pcm_store as pcm_store_module
+from asr.pcm_store import PCMStore
+
+
+class TestPCMStore:
+    """Test ingest and memmap access (decoder replaced by a fixed signal)"""
+
+    def setup_method(self):
+        """Setup for each test"""
+        self.signal = np.linspace(-1.0, 1.0, 16000 * 3, dtype=np.float32)
+        self.decodes = 0
+
+    def fake_load_audio(self, audio_path):
+        self.decodes += 1
+        return self.signal
+
+    def test_ingest_once_then_memmap(self, tmp_path, monkeypatch):
+        """Test the file is decoded once and later opened as a memmap"""
+        monkeypatch.setattr(pcm_store_module, "load_audio", self.fake_load_audio)
+        audio_path = tmp_path / "lecture.m4a"
+        audio_path.write_bytes(b"compressed")
+        store = PCMStore(tmp_path / "pcm")
+
+        first = store.load(str(audio_path))
+        second = store.load(str(audio_path))
+
+        assert self.decodes == 1
+        assert isinstance(second, np.memmap)
+        assert np.array_equal(first, self.signal)
+        assert store.duration(str(audio_path)) == 3.0
+
+    def test_stale_copy_is_ignored(self, tmp_path, monkeypatch):
+        """Test a PCM copy of an earlier version of the source is not used"""
+        monkeypatch.setattr(pcm_store_module, "load_audio", self.fake_load_audio)
+        audio_path = tmp_path / "lecture.wav"
+        audio_path.write_bytes(b"v1")
+        store = PCMStore(tmp_path / "pcm")
+        store.ingest(str(audio_path))
+
+        pcm_mtime = store.path_for(str(audio_path)).stat().st_mtime_ns
+        os.utime(audio_path, ns=(pcm_mtime + 10**9, pcm_mtime + 10**9))
+
+        assert store.open(str(audio_path)) is None
+        assert store.duration(str(audio_path)) is None
+
+    def test_same_name_in_different_directories(self, tmp_path, monkeypatch):
+        """Test files sharing a basename get their own copies"""
+        monkeypatch.setattr(pcm_store_module, "load_audio", lambda audio_path: np.full(
+            16000, 0.1 if "first" in audio_path else 0.2, dtype=np.float32
+        ))
+        store = PCMStore(tmp_path / "pcm")
+        paths = []
+        for folder in ("first", "second"):
+            (tmp_path / folder).mkdir()
+            paths.append(tmp_path / folder / "lecture.wav")
+            paths[-1].write_bytes(b"audio")
+
+        first, second = (store.load(str(path)) for path in paths)
+
+        assert store.path_for(str(paths[0])) != store.path_for(str(paths[1]))
+        assert np.allclose(first, 0.1) and np.allclose(second, 0.2)
+
+    def test_rewritten_source_with_same_mtime_is_ignored(self, tmp_path, monkeypatch):
+        """Test a source whose size changed is re-ingested even if its mtime did not"""
+        monkeypatch.setattr(pcm_store_module, "load_audio", self.fake_load_audio)
+        audio_path = tmp_path / "lecture.wav"
+        audio_path.write_bytes(b"v1")
+        store = PCMStore(tmp_path / "pcm")
+        store.ingest(str(audio_path))
+
+        mtime = audio_path.stat().st_mtime_ns
+        audio_path.write_bytes(b"version 2")
+        os.utime(audio_path, ns=(mtime, mtime))
+
+        assert store.open(str(audio_path)) is None
+        store.load(str(audio_path))
+        assert self.decodes == 2
@@ -0,0 +1,84 @@
+"""
+Unit tests for the prefetch/writer pipeline stages
+"""
+import sys
+import time
+import threading
+from pathlib import Path
+
+# Add src to path
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+from utils.pipeline import BackgroundWriter, prefetch
+
+
+class TestPrefetch:
+    """Test bounded, ordered prefetching"""
+
+    def test_results_in_input_order(self):
+        """Test results come back in order even when later items finish first"""
+        def work(x):
+            time.sleep(0.02 * (5 - x))
+            return x * 10
+
+        results = [(item, result) for item, result, error in prefetch(work, range(5), workers=3)]
+
+        assert results == [(0, 0), (1, 10), (2, 20), (3, 30), (4, 40)]
+
+    def test_errors_reported_per_item(self):
+        """Test one failing item does not stop the others"""
+        def work(x):
+            if x == 1:
+                raise ValueError("bad file")
+            return x
+
+        entries = list(prefetch(work, range(3)))
+
+        assert [result for _, result, _ in entries] == [0, None, 2]
+        assert str(entries[1][2]) == "bad file"
+
+    def test_stays_bounded_ahead_of_consumer(self):
+        """Test at most workers + ahead items are started before being consumed"""
+        started = []
+
+        def work(x):
+            started.append(x)
+            return x
+
+        decoded = prefetch(work, range(100), workers=2, ahead=2)
+        next(decoded)
+        time.sleep(0.05)
+
+        assert len(started) <= 5
+        decoded.close()
+
+
+class TestBackgroundWriter:
+    """Test the writer stage"""
+
+    def test_writes_in_order_on_writer_thread(self):
+        """Test items are written in submission order off the calling thread"""
+        written = []
+        caller = threading.get_ident()
+
+        with BackgroundWriter(lambda item: written.append((item, threading.get_ident()))) as writer:
+            for item in range(5):
+                writer.submit(item)
+
+        assert [item for item, _ in written] == list(range(5))
+        assert all(thread != caller for _, thread in written)
+
+    def test_write_errors_do_not_stop_writer(self):
+        """Test a failed write is logged and later items are still written"""
+        written = []
+
+        def write(item):
+            if item == 0:
+                raise OSError("disk full")
+            written.append(item)
+
+        with BackgroundWriter(write) as writer:
+            writer.submit(0)
+            writer.submit(1)
+
+        assert written == [1]
@@ -0,0 +1,130 @@
+"""
+Unit tests for int8 quantization and the quantized checkpoint cache
+"""
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+torch = pytest.importorskip("torch")
+
+# Add src to path
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+import asr.quantization as quantization_module
+from asr.quantization import load_quantized_model, quantize_int8
+
+
+@dataclass
+class TinyDims:
+    n_state: int = 16
+
+
+class CastLinear(torch.nn.Linear):
+    """Like whisper.model.Linear: a Linear subclass that only casts in forward()"""
+
+    def forward(self, x):
+        return super().forward(x.to(self.weight.dtype))
+
+
+class TinyWhisper(torch.nn.Module):
+    """Stand-in for whisper.model.Whisper: Linear layers plus a layer norm"""
+
+    def __init__(self, dims):
+        super().__init__()
+        self.dims = dims
+        self.encoder = CastLinear(dims.n_state, dims.n_state)
+        self.decoder = torch.nn.Sequential(
+            torch.nn.Linear(dims.n_state, dims.n_state), torch.nn.LayerNorm(dims.n_state)
+        )
+        self.alignment_heads = None
+
+    def set_alignment_heads(self, heads):
+        self.alignment_heads = heads
+
+    def forward(self, x):
+        return self.decoder(self.encoder(x))
+
+
+def tiny_model():
+    torch.manual_seed(0)
+    return TinyWhisper(TinyDims())
+
+
+class TestQuantizeInt8:
+    """Test dynamic quantization of Linear layers"""
+
+    def test_linear_layers_quantized(self):
+        """Test Linear layers (including subclasses) become int8 and other layers stay fp32"""
+        model = quantize_int8(tiny_model())
+
+        quantized_linear = torch.ao.nn.quantized.dynamic.Linear
+        assert isinstance(model.encoder, quantized_linear)
+        assert isinstance(model.decoder[0], quantized_linear)
+        assert type(model.decoder[1]) is torch.nn.LayerNorm
+
+    def test_output_close_to_fp32(self):
+        """Test int8 outputs stay close to the fp32 model's"""
+        reference = tiny_model().eval()
+        x = torch.randn(4, 16)
+        with torch.no_grad():
+            expected = reference(x)
+            actual = quantize_int8(tiny_model()).eval()(x)
+
+        assert torch.allclose(actual, expected, atol=0.05)
+
+
+class TestLoadQuantizedModel:
+    """Test the on-disk cache (Whisper replaced by a tiny stub model)"""
+
+    def setup_method(self):
+        """Setup for each test"""
+        self.loads = []
+
+    def stub_whisper(self, monkeypatch):
+        def load_model(model_size, device):
+            self.loads.append((model_size, device))
+            return tiny_model()
+
+        monkeypatch.setattr(quantization_module, "whisper", SimpleNamespace(
+            load_model=load_model,
+            model=SimpleNamespace(Whisper=TinyWhisper, ModelDimensions=TinyDims),
+            _ALIGNMENT_HEADS={"tiny": b"heads"}
+        ))
+
+    def test_cached_state_dict_round_trip(self, tmp_path, monkeypatch):
+        """Test the second load skips the fp32 checkpoint and gives the same model"""
+        self.stub_whisper(monkeypatch)
+        x = torch.randn(4, 16)
+
+        first = load_quantized_model("tiny", str(tmp_path))
+        second = load_quantized_model("tiny", str(tmp_path))
+
+        assert self.loads == [("tiny", "cpu")]
+        assert len(list(tmp_path.glob("tiny-int8-*.pt"))) == 1
+        assert isinstance(second.encoder, torch.ao.nn.quantized.dynamic.Linear)
+        assert not second.training
+        with torch.no_grad():
+            assert torch.equal(first(x), second(x))
+
+    def test_alignment_heads_restored(self, tmp_path, monkeypatch):
+        """Test a model built from the cache gets its alignment heads back"""
+        self.stub_whisper(monkeypatch)
+        load_quantized_model("tiny", str(tmp_path))
+
+        model = load_quantized_model("tiny", str(tmp_path))
+
+        assert model.alignment_heads == b"heads"
+
+    def test_unreadable_cache_is_rebuilt(self, tmp_path, monkeypatch):
+        """Test a corrupt checkpoint is ignored and replaced"""
+        self.stub_whisper(monkeypatch)
+        cache_path = tmp_path / f"tiny-int8-torch{torch.__version__}.pt"
+        cache_path.write_bytes(b"not a checkpoint")
+
+        load_quantized_model("tiny", str(tmp_path))
+        load_quantized_model("tiny", str(tmp_path))
+
+        assert self.loads == [("tiny", "cpu")]
@@ -0,0 +1,114 @@
+"""
+Unit tests for the array-backed Transcript
+"""
+import sys
+import json
+import shutil
+import tempfile
+from pathlib import Path
+
+# Add src to path
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+from asr.transcript import Segment, Transcript
+from utils.transcript_format import read_transcript, write_transcript
+
+
+def make_result(segment_count=4):
+    segments = []
+    for index in range(segment_count):
+        start = index * 3.0
+        segments.append({
+            "start": start,
+            "end": start + 2.5,
+            "text": f"ang klase number {index}",
+            "language": "tl" if index % 2 else "en",
+            "words": [
+                {"word": "ang", "start": start, "end": start + 0.5, "probability": 0.5},
+                {"word": "klase", "start": start + 0.5, "end": start + 1.25, "probability": 0.875},
+                {"word": "number", "start": start + 1.25, "end": start + 2.0, "probability": 0.75},
+                {"word": str(index), "start": start + 2.0, "end": start + 2.5, "probability": 1.0}
+            ]
+        })
+    return {
+        "text": " ".join(segment["text"] for segment in segments),
+        "segments": segments,
+        "language": "tl",
+        "duration": segment_count * 3.0,
+        "model": "base"
+    }
+
+
+class TestTranscript:
+    """Test segment views, dict compatibility and saving"""
+
+    def test_to_dict_round_trip(self):
+        """Test to_dict() rebuilds the transcribe() result"""
+        result = make_result()
+        result["segments"][2]["speaker"] = "teacher"
+
+        transcript = Transcript.from_result(result)
+
+        assert transcript.to_dict() == result
+        assert json.loads(json.dumps(transcript.to_dict())) == result
+
+    def test_absent_keys_stay_absent(self):
+        """Test segments without language, words or word probabilities keep those keys absent"""
+        result = make_result(2)
+        del result["segments"][0]["language"]
+        del result["segments"][0]["words"][0]["probability"]
+        del result["segments"][1]["words"]
+
+        transcript = Transcript.from_result(result)
+
+        assert transcript.to_dict() == result
+        assert "language" not in transcript[0]
+        assert transcript[1].get("words") is None
+
+    def test_segment_views(self):
+        """Test segments read like dicts and expose word columns without copying"""
+        transcript = Transcript.from_result(make_result())
+
+        segment = transcript[1]
+        assert isinstance(segment, Segment)
+        assert (segment["start"], segment["end"], segment["language"]) == (3.0, 5.5, "tl")
+        assert segment.get("text") == "ang klase number 1"
+        assert segment.word_texts == ["ang", "klase", "number", "1"]
+        assert segment.word_starts.tolist() == [3.0, 3.5, 4.25, 5.0]
+        assert segment.word_starts.base is not None
+        assert dict(segment) == make_result()["segments"][1]
+        assert transcript[-1]["text"] == "ang klase number 3"
+        assert [s.start for s in transcript[1:3]] == [3.0, 6.0]
+
+    def test_words_are_interned(self):
+        """Test repeated word texts are stored once"""
+        transcript = Transcript.from_result(make_result(10))
+
+        assert transcript.word_count == 40
+        assert len(transcript.vocabulary) == 13
+        assert transcript[0].word_texts[0] is transcript[5].word_texts[0]
+
+    def test_time_range(self):
+        """Test segments(start, end) returns only overlapping segments"""
+        transcript = Transcript.from_result(make_result(10))
+
+        assert [segment.start for segment in transcript.segments(4.0, 9.5)] == [3.0, 6.0, 9.0]
+
+    def test_saved_as_binary_without_conversion(self):
+        """Test a Transcript is written with its own columns and reads back equal"""
+        temp_dir = Path(tempfile.mkdtemp())
+        try:
+            result = make_result()
+            transcript = Transcript.from_result(result)
+            path = write_transcript(temp_dir / "a_transcript.ptx", dict(transcript.info, segments=transcript))
+
+            assert read_transcript(path) == result
+        finally:
+            shutil.rmtree(temp_dir)
+
+    def test_empty(self):
+        """Test a result without segments"""
+        transcript = Transcript.from_result({"text": "", "segments": [], "duration": 1.0})
+
+        assert len(transcript) == 0
+        assert transcript.to_dict() == {"text": "", "segments": [], "duration": 1.0}
@@ -0,0 +1,139 @@
+"""
+Unit tests for the binary transcript format
+"""
+import sys
+import json
+import shutil
+import tempfile
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+from utils.transcript_format import TranscriptFile, convert, read_transcript, write_transcript
+
+
+def make_transcript(segment_count=3):
+    segments = []
+    for index in range(segment_count):
+        start = index * 5.0
+        segments.append({
+            "start": start,
+            "end": start + 4.5,
+            "text": f" Segment {index} ng klase",
+            "language": "tl" if index % 2 else "en",
+            "words": [
+                {"word": " Segment", "start": start, "end": start + 1.25, "probability": 0.9},
+                {"word": f" {index}", "start": start + 1.25, "end": start + 2.5, "probability": 0.75},
+                {"word": " ng", "start": start + 2.5, "end": start + 3.0, "probability": 0.5},
+                {"word": " klase", "start": start + 3.0, "end": start + 4.5, "probability": 0.875}
+            ]
+        })
+    return {
+        "id": "lecture",
+        "audio_file": "lecture.mp3",
+        "text": "".join(segment["text"] for segment in segments),
+        "language": "tl",
+        "duration": segment_count * 5.0,
+        "segments": segments,
+        "model": "base",
+        "timestamp": "2025-01-01T10:00:00"
+    }
+
+
+class TestTranscriptFormat:
+    """Test writing, partial reading and conversion of binary transcripts"""
+
+    def setup_method(self):
+        """Setup for each test"""
+        self.temp_dir = Path(tempfile.mkdtemp())
+
+    def teardown_method(self):
+        """Cleanup after each test"""
+        shutil.rmtree(self.temp_dir)
+
+    def test_round_trip(self):
+        """Test the binary file reads back as the original JSON document"""
+        data = make_transcript()
+        data["segments"][1]["avg_logprob"] = -0.25
+        path = write_transcript(self.temp_dir / "lecture_transcript.ptx", data)
+
+        with TranscriptFile(path) as transcript:
+            assert transcript.to_dict() == data
+            assert transcript.word_count == 12
+            # Repeated words are stored once
+            assert len(transcript.vocabulary()) == 6
+
+    def test_round_trip_keeps_absent_keys_absent(self):
+        """Test segments and words lacking optional keys read back without them"""
+        data = make_transcript()
+        del data["segments"][0]["language"]
+        del data["segments"][0]["words"][1]["probability"]
+        del data["segments"][1]["words"]
+        data["segments"][2]["language"] = None
+        data["segments"][2]["words"] = None
+        data["segments"].append({"start": 15.0, "end": 16.0})
+        path = write_transcript(self.temp_dir / "lecture_transcript.ptx", data)
+
+        assert read_transcript(path) == data
+
+    def test_header_without_columns(self):
+        """Test the header is available without mapping any column"""
+        path = write_transcript(self.temp_dir / "lecture_transcript.ptx", make_transcript())
+
+        transcript = TranscriptFile(path)
+
+        assert transcript.header()["text"].startswith(" Segment 0")
+        assert "segments" not in transcript.header()
+        assert transcript._mmap is None
+
+    def test_time_range(self):
+        """Test only segments overlapping the range are returned"""
+        path = write_transcript(self.temp_dir / "lecture_transcript.ptx", make_transcript(10))
+
+        with TranscriptFile(path) as transcript:
+            assert [s["start"] for s in transcript.segments(12.0, 21.0)] == [10.0, 15.0, 20.0]
+            assert [s["start"] for s in transcript.segments(end=4.0)] == [0.0]
+            assert transcript.segments(100.0) == []
+
+    def test_read_transcript_either_format(self):
+        """Test the same time range and header come back from JSON and binary files"""
+        data = make_transcript(6)
+        json_path = self.temp_dir / "lecture_transcript.json"
+        json_path.write_text(json.dumps(data), encoding="utf-8")
+        binary_path = write_transcript(self.temp_dir / "copy_transcript.ptx", data)
+
+        assert read_transcript(json_path, 7.0, 16.0) == read_transcript(binary_path, 7.0, 16.0)
+        assert read_transcript(binary_path, segments=False) == read_transcript(json_path, segments=False)
+
+    def test_convert_replaces_file(self):
+        """Test conversion both ways keeps one file per transcript"""
+        data = make_transcript()
+        json_path = self.temp_dir / "lecture_transcript.json"
+        json_path.write_text(json.dumps(data), encoding="utf-8")
+
+        binary_path = convert(json_path, to_binary=True)
+        assert binary_path.name == "lecture_transcript.ptx"
+        assert not json_path.exists()
+
+        back = convert(binary_path, to_binary=False)
+        assert back == json_path
+        assert json.loads(json_path.read_text(encoding="utf-8")) == data
+
+    def test_empty_transcript(self):
+        """Test a transcript without segments (e.g. silence)"""
+        data = make_transcript(0)
+        path = write_transcript(self.temp_dir / "silence_transcript.ptx", data)
+
+        with TranscriptFile(path) as transcript:
+            assert transcript.to_dict() == data
+
+    def test_rejects_other_files(self):
+        """Test a JSON file is not mistaken for a binary transcript"""
+        path = self.temp_dir / "lecture_transcript.json"
+        path.write_text(json.dumps(make_transcript()), encoding="utf-8")
+
+        with pytest.raises(ValueError):
+            TranscriptFile(path)
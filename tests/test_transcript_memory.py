@@ -0,0 +1,173 @@
+"""
+Memory benchmark for the array-backed Transcript
+
+A three-hour lecture with word timestamps is tens of thousands of word
+dicts when held as transcribe() returns it. The compact Transcript must
+hold the same result in a fraction of that, and transcribing with
+compact=True must never hold the dicts at all. Run with -s to see the
+measured sizes.
+"""
+import gc
+import sys
+import json
+import random
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+
+# Add src to path
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+import asr.whisper_asr as whisper_asr_module
+from asr.audio import SAMPLE_RATE
+from asr.transcript import Transcript
+from asr.whisper_asr import WhisperASR
+
+# Synthetic lecture: ~150 words per minute in ~4 s segments
+LECTURE_HOURS = 3
+WORDS_PER_SEGMENT = 10
+SEGMENT_SECONDS = 4.0
+
+# Compact size allowed, as a fraction of the dict representation
+MAX_SIZE_RATIO = 0.2
+
+# Peak memory of transcribe(compact=True) allowed, as a fraction of compact=False
+MAX_PEAK_RATIO = 0.3
+
+# Window length of the fake model's transcribe() calls (whole segments each)
+WINDOW_SECONDS = 32
+
+VOCABULARY = (
+    "ang mga ng sa na at ay ito para hindi natin kailangan tayo klase "
+    "the and of to a in is that for we this function variable loop equation "
+    "derivative integral problem example answer okay so ngayon po"
+).split()
+
+
+def lecture_json() -> str:
+    """The lecture as saved JSON (parsed fresh for each measurement)"""
+    rng = random.Random(0)
+    segments = []
+    for index in range(int(LECTURE_HOURS * 3600 / SEGMENT_SECONDS)):
+        start = index * SEGMENT_SECONDS
+        step = SEGMENT_SECONDS / WORDS_PER_SEGMENT
+        words = [
+            {
+                "word": rng.choice(VOCABULARY),
+                "start": round(start + i * step, 2),
+                "end": round(start + (i + 1) * step, 2),
+                "probability": round(rng.random(), 4)
+            }
+            for i in range(WORDS_PER_SEGMENT)
+        ]
+        segments.append({
+            "start": start,
+            "end": start + SEGMENT_SECONDS,
+            "text": " ".join(word["word"] for word in words),
+            "language": rng.choice(["en", "tl"]),
+            "words": words
+        })
+    return json.dumps({"text": "", "segments": segments, "language": "tl", "model": "base"})
+
+
+def retained_bytes(build) -> int:
+    """Bytes still allocated by build() after it returns (result kept alive)"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return after - before
+
+
+def test_transcript_memory_reduction():
+    """Test the compact Transcript holds a lecture in a fraction of the dicts' memory"""
+    document = lecture_json()
+
+    dict_bytes = retained_bytes(lambda: json.loads(document))
+    compact_bytes = retained_bytes(lambda: Transcript.from_result(json.loads(document)))
+
+    words = LECTURE_HOURS * 3600 / SEGMENT_SECONDS * WORDS_PER_SEGMENT
+    print(
+        f"\n{words:.0f} words: dicts {dict_bytes / 1e6:.1f} MB, "
+        f"Transcript {compact_bytes / 1e6:.2f} MB ({compact_bytes / dict_bytes:.1%})"
+    )
+    assert compact_bytes < dict_bytes * MAX_SIZE_RATIO
+
+
+class FakeWhisper:
+    """Stands in for a Whisper model: word-timestamped segments for any window"""
+
+    def __init__(self):
+        self.rng = random.Random(0)
+
+    def transcribe(self, audio, initial_prompt=None, **options):
+        segments = []
+        step = SEGMENT_SECONDS / WORDS_PER_SEGMENT
+        for index in range(int(len(audio) / SAMPLE_RATE / SEGMENT_SECONDS)):
+            start = index * SEGMENT_SECONDS
+            words = [
+                {
+                    "word": " " + self.rng.choice(VOCABULARY),
+                    "start": start + i * step,
+                    "end": start + (i + 1) * step,
+                    "probability": self.rng.random()
+                }
+                for i in range(WORDS_PER_SEGMENT)
+            ]
+            segments.append({
+                "start": start,
+                "end": start + SEGMENT_SECONDS,
+                "text": "".join(word["word"] for word in words),
+                "words": words
+            })
+        return {"text": "".join(seg["text"] for seg in segments), "segments": segments, "language": "tl"}
+
+
+def peak_bytes(build) -> int:
+    """Most memory allocated at once while build() runs (result kept alive)"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del result
+    return peak - before
+
+
+def test_compact_transcribe_peak_memory(tmp_path, monkeypatch):
+    """Test transcribe(compact=True) never holds the lecture as dicts"""
+    samples = int(LECTURE_HOURS * 3600 * SAMPLE_RATE)
+    window = WINDOW_SECONDS * SAMPLE_RATE
+    monkeypatch.setattr(whisper_asr_module, "split_windows", lambda audio, seconds: [
+        (start, min(start + window, samples)) for start in range(0, samples, window)
+    ])
+    audio_path = tmp_path / "lecture.wav"
+    audio_path.write_bytes(b"RIFF")
+    # Hours of zero-stride silence: the samples themselves take no memory
+    audio = np.broadcast_to(np.zeros(1, dtype=np.float32), (samples,))
+
+    def transcribe(compact):
+        asr = WhisperASR.__new__(WhisperASR)
+        asr.device, asr.model_size, asr.cache, asr.parallel_workers = "cpu", "base", None, 1
+        asr.model = FakeWhisper()
+        # A progress callback selects window-by-window decoding
+        return asr.transcribe(
+            str(audio_path), language="tl", audio=audio, compact=compact,
+            progress_callback=lambda processed, total: None
+        )
+
+    dict_peak = peak_bytes(lambda: transcribe(False))
+    compact_peak = peak_bytes(lambda: transcribe(True))
+
+    print(
+        f"\nPeak while transcribing: dicts {dict_peak / 1e6:.1f} MB, "
+        f"compact {compact_peak / 1e6:.2f} MB ({compact_peak / dict_peak:.1%})"
+    )
+    assert len(transcribe(True)) == LECTURE_HOURS * 3600 / SEGMENT_SECONDS
+    assert compact_peak < dict_peak * MAX_PEAK_RATIO
@@ -0,0 +1,78 @@
+"""
+Unit tests for streaming/resumable uploads
+"""
+import sys
+import hashlib
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+from utils.uploads import UploadStore, UploadTooLargeError, UploadOffsetError
+
+
+class TestUploadStore:
+    """Test chunked upload sessions"""
+
+    def setup_method(self):
+        """Setup for each test"""
+        self.content = b"lecture audio " * 1000
+
+    def make_store(self, tmp_path, max_bytes=1024 * 1024):
+        return UploadStore(tmp_path / "raw_audio", tmp_path / "uploads", max_bytes)
+
+    def test_chunked_upload_and_hash(self, tmp_path):
+        """Test chunks are assembled in order and hashed on the fly"""
+        store = self.make_store(tmp_path)
+        upload_id = store.create("lecture.m4a", len(self.content))["upload_id"]
+
+        offset = 0
+        for start in range(0, len(self.content), 4096):
+            offset = store.append(upload_id, offset, self.content[start:start + 4096])
+        completed = store.complete(upload_id)
+
+        assert completed["sha256"] == hashlib.sha256(self.content).hexdigest()
+        assert not completed["duplicate"]
+        assert (tmp_path / "raw_audio" / completed["filename"]).read_bytes() == self.content
+
+    def test_resume_after_restart(self, tmp_path):
+        """Test a new store instance resumes from the bytes on disk"""
+        upload_id = self.make_store(tmp_path).create("lecture.m4a", len(self.content))["upload_id"]
+        self.make_store(tmp_path).append(upload_id, 0, self.content[:5000])
+
+        store = self.make_store(tmp_path)
+        assert store.status(upload_id)["offset"] == 5000
+        with pytest.raises(UploadOffsetError) as error:
+            store.append(upload_id, 0, self.content[:5000])
+        assert error.value.expected == 5000
+
+        store.append(upload_id, 5000, self.content[5000:])
+        completed = store.complete(upload_id)
+        assert completed["sha256"] == hashlib.sha256(self.content).hexdigest()
+
+    def test_size_limit(self, tmp_path):
+        """Test oversized uploads are rejected up front and mid-stream"""
+        store = self.make_store(tmp_path, max_bytes=1000)
+        with pytest.raises(UploadTooLargeError):
+            store.create("lecture.m4a", 2000)
+
+        upload_id = store.create("lecture.m4a")["upload_id"]
+        store.append(upload_id, 0, b"x" * 800)
+        with pytest.raises(UploadTooLargeError):
+            store.append(upload_id, 800, b"x" * 800)
+
+    def test_identical_uploads_deduplicated(self, tmp_path):
+        """Test a second upload of the same content reuses the first file"""
+        store = self.make_store(tmp_path)
+        results = []
+        for name in ("a.m4a", "b.m4a"):
+            upload_id = store.create(name)["upload_id"]
+            store.append(upload_id, 0, self.content)
+            results.append(store.complete(upload_id))
+
+        assert results[1]["duplicate"]
+        assert results[1]["filename"] == results[0]["filename"]
+        assert len(list((tmp_path / "raw_audio").iterdir())) == 1
+        assert list((tmp_path / "uploads").glob("*.part")) == []
@@ -0,0 +1,115 @@
+"""
+Unit tests for the voice activity detection pre-pass
+"""
+import sys
+import tempfile
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+
+# Add src to path
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+from asr.audio import SAMPLE_RATE
+from asr.vad import SpeechTimeline, compact_speech, detect_speech
+from asr.whisper_asr import WhisperASR
+
+
+def voiced(seconds, f0=150.0):
+    """Harmonic tone standing in for voiced speech"""
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    return sum(0.2 / k * np.sin(2 * np.pi * f0 * k * t) for k in range(1, 6)).astype(np.float32)
+
+
+def quiet_noise(seconds, level=0.001):
+    return (np.random.default_rng(0).standard_normal(int(seconds * SAMPLE_RATE)) * level).astype(np.float32)
+
+
+class TestDetectSpeech:
+    """Test speech region detection"""
+
+    def test_finds_speech_between_silence(self):
+        """Test speech regions are found and silence is skipped"""
+        audio = np.concatenate([quiet_noise(10), voiced(5), quiet_noise(20), voiced(3), quiet_noise(5)])
+
+        regions = detect_speech(audio)
+
+        assert len(regions) == 2
+        starts = [start / SAMPLE_RATE for start, _ in regions]
+        assert abs(starts[0] - 10) < 0.5 and abs(starts[1] - 35) < 0.5
+        speech_seconds = sum(end - start for start, end in regions) / SAMPLE_RATE
+        assert 8 < speech_seconds < 10
+
+    def test_short_pauses_are_bridged(self):
+        """Test a pause shorter than min_silence_seconds does not split speech"""
+        audio = np.concatenate([quiet_noise(5), voiced(2), quiet_noise(0.4), voiced(2), quiet_noise(5)])
+        assert len(detect_speech(audio)) == 1
+
+    def test_silence_only(self):
+        """Test a silent recording yields no regions"""
+        assert detect_speech(np.zeros(10 * SAMPLE_RATE, dtype=np.float32)) == []
+
+    def test_quiet_speech_kept(self):
+        """Test a soft-spoken stretch well below full scale is still speech"""
+        audio = np.concatenate([quiet_noise(5), voiced(3) * 0.03, quiet_noise(5)])
+        assert len(detect_speech(audio)) == 1
+
+
+class TestSilentTranscription:
+    """Test transcribing a recording with no detected speech"""
+
+    def test_auto_language_reports_unknown(self):
+        """Test silence with language=None gives empty text and language 'unknown'"""
+        # Nothing is decoded, so no model needs loading
+        asr = WhisperASR.__new__(WhisperASR)
+        asr.device, asr.model_size, asr.cache, asr.parallel_workers = "cpu", "base", None, 1
+
+        with tempfile.NamedTemporaryFile(suffix=".wav") as audio_file:
+            result = asr.transcribe(
+                audio_file.name, language=None, vad=True,
+                audio=np.zeros(10 * SAMPLE_RATE, dtype=np.float32)
+            )
+
+        assert result["text"] == ""
+        assert result["segments"] == []
+        assert result["language"] == "unknown"
+        assert result["duration"] == 10.0
+
+    def test_batched_auto_language_reports_unknown(self, tmp_path):
+        """Test batched transcription of silence also reports language 'unknown'"""
+        asr = WhisperASR.__new__(WhisperASR)
+        asr.device, asr.model_size, asr.cache, asr.parallel_workers = "cpu", "base", None, 1
+        # Only the mel size is read: silence leaves no windows to decode
+        asr.model = SimpleNamespace(dims=SimpleNamespace(n_mels=80))
+        asr._load_audio = lambda path: np.zeros(10 * SAMPLE_RATE, dtype=np.float32)
+        audio_path = tmp_path / "silence.wav"
+        audio_path.write_bytes(b"RIFF")
+
+        results = {}
+        asr._transcribe_batched([str(audio_path)], 2, results.__setitem__, 1, language=None, vad=True)
+
+        assert results[0]["segments"] == []
+        assert results[0]["language"] == "unknown"
+
+
+class TestSpeechTimeline:
+    """Test mapping compacted times back to the recording"""
+
+    def test_maps_segments_to_original_times(self):
+        """Test segment and word times land on the original timeline"""
+        regions = [(10 * SAMPLE_RATE, 20 * SAMPLE_RATE), (50 * SAMPLE_RATE, 55 * SAMPLE_RATE)]
+        audio = np.zeros(60 * SAMPLE_RATE, dtype=np.float32)
+        speech, timeline = compact_speech(audio, regions)
+
+        assert len(speech) == 15 * SAMPLE_RATE
+        segment = timeline.map_segment({
+            "start": 9.0, "end": 12.0, "text": "x",
+            "words": [{"word": "x", "start": 9.0, "end": 10.0}]
+        })
+        assert (segment["start"], segment["end"]) == (19.0, 52.0)
+        assert segment["words"][0]["end"] == 20.0
+
+    def test_empty_timeline_is_identity(self):
+        """Test times pass through when no regions were kept"""
+        assert SpeechTimeline([]).to_original(3.0) == 3.0
@@ -6,21 +6,37 @@ import os
 import sys
 import json
 import asyncio
+import mimetypes
+import threading
 from pathlib import Path
 from typing import Optional, List, Dict
 from datetime import datetime
 
-from fastapi import FastAPI, File, UploadFile, HTTPException, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, BackgroundTasks, Query, Request, HTTPException, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, FileResponse
+from fastapi.responses import JSONResponse, FileResponse, Response, StreamingResponse
 from pydantic import BaseModel
+from starlette.datastructures import UploadFile
 import uvicorn
 
 # Add src to path for imports
 sys.path.append(str(Path(__file__).parent.parent / "src"))
 
-from asr.whisper_asr import WhisperASR
+from asr.whisper_asr import WhisperASR, TranscriptionCancelled
+from asr.registry import ModelRegistry, READY, WARMING
+from asr.pcm_store import PCMStore
+from asr.transcript import Transcript
+from asr.audio import render_preview
+from utils.executor import BoundedExecutor, QueueFullError
+from utils.jobs import JobQueue, DONE, FAILED
+from utils.http_range import (
+    RangeNotSatisfiable, etag_matches, file_validators, iter_file_range, parse_range_header
+)
+from utils.uploads import UploadStore, UploadTooLargeError, UploadOffsetError
+from utils.catalog import MAX_PAGE_SIZE, TranscriptCatalog
+from utils.transcript_format import BINARY_SUFFIX, read_transcript, write_transcript
 from correction.error_corrector import ErrorCorrector
+from correction.alignment import align_segments, count_changes
 from correction.models import CorrectionConfig, CorrectionLevel
 
 # Initialize FastAPI app
@@ -39,17 +55,80 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Global ASR model instance (lazy loaded)
-asr_model: Optional[WhisperASR] = None
-
 # Global error corrector instance (lazy loaded)
 error_corrector: Optional[ErrorCorrector] = None
+error_corrector_lock = threading.Lock()
+
+# Correction model readiness, reported by /ready
+correction_status: Dict = {"state": None}
 
 # Data directories
 DATA_DIR = Path("data")
 AUDIO_DIR = DATA_DIR / "raw_audio"
 TRANSCRIPTS_DIR = DATA_DIR / "transcripts"
 CORRECTIONS_DIR = DATA_DIR / "corrections"
+ASR_CACHE_DIR = DATA_DIR / "cache" / "asr"
+PCM_DIR = DATA_DIR / "pcm"
+UPLOAD_DIR = DATA_DIR / "uploads"
+PREVIEW_DIR = AUDIO_DIR / "previews"
+
+# Largest accepted upload, and the chunk size uploads are streamed to disk in
+MAX_UPLOAD_BYTES = int(os.environ.get("PULOX_MAX_UPLOAD_MB", "1024")) * 1024 * 1024
+UPLOAD_CHUNK_BYTES = 1024 * 1024
+
+# Allowance for multipart boundaries and part headers around an /upload file
+MULTIPART_OVERHEAD_BYTES = 64 * 1024
+
+# Accepted audio formats
+ALLOWED_AUDIO_EXTENSIONS = {'.wav', '.mp3', '.m4a', '.flac', '.ogg', '.webm'}
+
+# Size bound for cached transcription results (LRU eviction beyond it)
+ASR_CACHE_MAX_BYTES = int(os.environ.get("PULOX_ASR_CACHE_MAX_MB", "2048")) * 1024 * 1024
+
+# Memory allowed for loaded ASR models (idle models are evicted beyond it)
+ASR_MEMORY_BUDGET_MB = int(os.environ.get("PULOX_ASR_MEMORY_BUDGET_MB", "4096"))
+
+# Models to load at startup, e.g. "tiny,small:cuda" (model_size[:device])
+ASR_PREWARM = os.environ.get("PULOX_ASR_PREWARM", "")
+
+# Run a dummy inference on each newly loaded ASR model before serving it
+ASR_WARMUP = os.environ.get("PULOX_ASR_WARMUP", "1") == "1"
+
+# Correction model to load at startup: "rules", "ml" or "" (load on first use)
+CORRECTION_PREWARM = os.environ.get("PULOX_CORRECTION_PREWARM", "")
+
+# Worker processes for chunked parallel transcription on CPU (1 = sequential)
+ASR_PARALLEL_WORKERS = int(os.environ.get("PULOX_ASR_PARALLEL_WORKERS", "1"))
+
+# Quantize CPU models ("int8") for faster inference and lower memory ("" = fp32)
+ASR_QUANTIZE = os.environ.get("PULOX_ASR_QUANTIZE", "") or None
+ASR_QUANTIZED_DIR = DATA_DIR / "cache" / "quantized"
+
+# Skip silence before decoding (voice activity detection pre-pass; opt-in)
+ASR_VAD = os.environ.get("PULOX_ASR_VAD", "0") == "1"
+
+# Concurrency limits for blocking work (beyond running + queued -> 429)
+MAX_CONCURRENT_TRANSCRIPTIONS = int(os.environ.get("PULOX_MAX_CONCURRENT_TRANSCRIPTIONS", "1"))
+MAX_QUEUED_TRANSCRIPTIONS = int(os.environ.get("PULOX_MAX_QUEUED_TRANSCRIPTIONS", "4"))
+MAX_CONCURRENT_CORRECTIONS = int(os.environ.get("PULOX_MAX_CONCURRENT_CORRECTIONS", "2"))
+MAX_QUEUED_CORRECTIONS = int(os.environ.get("PULOX_MAX_QUEUED_CORRECTIONS", "16"))
+
+# Segments corrected per correction worker call when streaming /correct/transcript
+CORRECTION_STREAM_SEGMENTS = 16
+
+# Storage format of saved transcripts: "json" or "binary" (columnar, memory-mapped;
+# /transcripts/{id} returns the same JSON either way)
+TRANSCRIPT_FORMAT = os.environ.get("PULOX_TRANSCRIPT_FORMAT", "json")
+
+# Index of transcript/correction headers behind /transcripts and /corrections
+CATALOG_DB_PATH = DATA_DIR / "catalog.db"
+
+# Background job journal and worker threads
+JOBS_DB_PATH = DATA_DIR / "jobs.db"
+JOB_WORKERS = int(os.environ.get("PULOX_JOB_WORKERS", "1"))
+
+# Seconds between job progress updates on /ws/transcribe
+JOB_WATCH_INTERVAL = 1.0
 
 # Ensure directories exist
 for dir_path in [AUDIO_DIR, TRANSCRIPTS_DIR, CORRECTIONS_DIR]:
@@ -67,6 +146,12 @@ class TranscriptionRequest(BaseModel):
     model_size: str = "base"
 
 
+class UploadSessionRequest(BaseModel):
+    """Request model for starting a resumable upload"""
+    filename: str
+    size: int  # Total bytes the client will send
+
+
 class TranscriptionResponse(BaseModel):
     """Response model for transcription"""
     id: str
@@ -112,6 +197,13 @@ class AutoCorrectionRequest(BaseModel):
     use_ml: bool = False  # Enable ML-based correction (requires model download)
 
 
+class TranscriptCorrectionRequest(BaseModel):
+    """Request model for segment-level transcript correction"""
+    transcript_id: str
+    level: str = "standard"  # 'light', 'standard', or 'aggressive'
+    use_ml: bool = False  # Enable ML-based correction (requires model download)
+
+
 class AutoCorrectionResponse(BaseModel):
     """Response model for automatic correction"""
     original_text: str
@@ -128,52 +220,368 @@ class AutoCorrectionResponse(BaseModel):
 # Helper Functions
 # ============================================================================
 
-def get_asr_model(model_size: str = "base") -> WhisperASR:
-    """Get or initialize ASR model (lazy loading)"""
-    global asr_model
-    if asr_model is None:
-        asr_model = WhisperASR(model_size=model_size)
-    return asr_model
+def load_asr_model(model_size: str, device: Optional[str] = None) -> WhisperASR:
+    """Load a Whisper model backed by the shared transcription cache"""
+    return WhisperASR(
+        model_size=model_size,
+        device=device,
+        cache_dir=str(ASR_CACHE_DIR),
+        cache_max_bytes=ASR_CACHE_MAX_BYTES,
+        pcm_dir=str(PCM_DIR),
+        quantize=ASR_QUANTIZE,
+        quantized_dir=str(ASR_QUANTIZED_DIR),
+        parallel_workers=ASR_PARALLEL_WORKERS
+    )
+
+
+# Decoded copies of uploads, shared with the ASR models through PCM_DIR
+pcm_store = PCMStore(PCM_DIR)
+
+
+def ingest_audio(audio_path: Path):
+    """Decode an upload into the PCM store (blocking, runs after the response)"""
+    try:
+        pcm_store.ingest(str(audio_path))
+    except Exception as e:
+        # Transcription falls back to decoding (and ingesting) on demand
+        print(f"PCM ingest failed for {audio_path.name}: {e}")
+
+
+# ASR models keyed by (model_size, device), loaded on first use; with
+# parallel CPU transcription each worker process holds another model copy
+asr_registry = ModelRegistry(
+    load_asr_model,
+    memory_budget_mb=ASR_MEMORY_BUDGET_MB,
+    warmup=ASR_WARMUP,
+    copies=1 + ASR_PARALLEL_WORKERS if ASR_PARALLEL_WORKERS > 1 else 1
+)
+
+
+# Dedicated workers so inference never blocks the event loop
+inference_executor = BoundedExecutor(
+    "inference",
+    max_workers=MAX_CONCURRENT_TRANSCRIPTIONS,
+    max_queued=MAX_QUEUED_TRANSCRIPTIONS
+)
+correction_executor = BoundedExecutor(
+    "correction",
+    max_workers=MAX_CONCURRENT_CORRECTIONS,
+    max_queued=MAX_QUEUED_CORRECTIONS
+)
+
+
+def transcribe_file(
+    audio_path: Path,
+    language: Optional[str],
+    model_size: str,
+    progress_callback=None,
+    segment_callback=None,
+    compact: bool = False
+):
+    """Transcribe a file, holding the model for the whole call (blocking)"""
+    with asr_registry.acquire(model_size) as asr:
+        return asr.transcribe(
+            str(audio_path),
+            language=language,
+            progress_callback=progress_callback,
+            segment_callback=segment_callback,
+            vad=ASR_VAD,
+            compact=compact
+        )
+
+
+def save_transcript(audio_filename: str, model_size: str, result) -> Dict:
+    """
+    Build and save the transcript document for a transcription (blocking)
+
+    result is a transcribe() dict or a compact Transcript; a Transcript's
+    segments stay in arrays in the returned document.
+    """
+    # Generate transcript ID
+    transcript_id = Path(audio_filename).stem
+
+    # Convert segments to serializable format
+    if isinstance(result, Transcript):
+        # Segments stay in their arrays
+        segments, result = result, result.info
+    else:
+        segments = []
+        for seg in result.get("segments", []):
+            if hasattr(seg, '__dict__'):
+                # Handle object-based segments
+                segments.append({
+                    "start": seg.start,
+                    "end": seg.end,
+                    "text": seg.text,
+                    "language": getattr(seg, 'language', None),
+                    "words": getattr(seg, 'words', [])
+                })
+            else:
+                # Segments are already dicts (with word-level data)
+                segments.append(seg)
+
+    transcript_data = {
+        "id": transcript_id,
+        "audio_file": audio_filename,
+        "text": result["text"],
+        "language": result.get("language") or "unknown",
+        "duration": result.get("duration", 0),
+        "segments": segments,
+        "model": model_size,
+        "timestamp": datetime.now().isoformat()
+    }
+
+    json_path = TRANSCRIPTS_DIR / f"{transcript_id}_transcript.json"
+    binary_path = TRANSCRIPTS_DIR / f"{transcript_id}_transcript{BINARY_SUFFIX}"
+    if TRANSCRIPT_FORMAT == "binary":
+        transcript_path, stale_path = write_transcript(binary_path, transcript_data), json_path
+    else:
+        transcript_path, stale_path = json_path, binary_path
+        if isinstance(segments, Transcript):
+            write_json(transcript_path, dict(transcript_data, segments=[segment.to_dict() for segment in segments]))
+        else:
+            write_json(transcript_path, transcript_data)
+    # Keep one file per transcript so a re-transcription in the other format wins
+    stale_path.unlink(missing_ok=True)
+    catalog.add_transcript(transcript_data, transcript_path)
+
+    return transcript_data
+
+
+def run_transcription_job(payload: Dict, progress) -> Dict:
+    """Job handler: transcribe and save, reporting processed audio seconds"""
+    audio_path = AUDIO_DIR / payload["audio_filename"]
+    if not audio_path.exists():
+        raise FileNotFoundError(f"Audio file not found: {payload['audio_filename']}")
+
+    model_size = payload.get("model_size", "base")
+    # Binary files are written straight from a Transcript's arrays; for JSON
+    # the dicts would only be rebuilt (with rounding), so keep them as is
+    compact = TRANSCRIPT_FORMAT == "binary"
+    # Shares the inference limit with interactive transcriptions
+    result = inference_executor.call(
+        transcribe_file, audio_path, payload.get("language"), model_size, progress, compact=compact
+    )
+    transcript_data = save_transcript(payload["audio_filename"], model_size, result)
+
+    return {"transcript_id": transcript_data["id"], "duration": transcript_data["duration"]}
+
+
+# Header index of saved transcripts and corrections
+catalog = TranscriptCatalog(CATALOG_DB_PATH)
+
+
+def sync_catalog():
+    """Index transcripts/corrections written while the server was down (blocking)"""
+    try:
+        catalog.sync(TRANSCRIPTS_DIR, CORRECTIONS_DIR)
+    except Exception as e:
+        print(f"Catalog sync failed: {e}")
+
 
+# Background jobs persisted in SQLite (survive restarts)
+job_queue = JobQueue(JOBS_DB_PATH, workers=JOB_WORKERS)
+job_queue.register("transcribe", run_transcription_job)
 
-def get_error_corrector(use_ml: bool = False) -> ErrorCorrector:
-    """Get or initialize error corrector (lazy loading)"""
+
+# Uploads streamed to disk, resumable and de-duplicated by content hash
+upload_store = UploadStore(AUDIO_DIR, UPLOAD_DIR, MAX_UPLOAD_BYTES)
+
+
+def validate_audio_extension(filename: str):
+    """Reject files that are not a supported audio format"""
+    if Path(filename).suffix.lower() not in ALLOWED_AUDIO_EXTENSIONS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid file type. Allowed: {', '.join(ALLOWED_AUDIO_EXTENSIONS)}"
+        )
+
+
+def upload_error(error: Exception) -> HTTPException:
+    """HTTP error for a rejected upload chunk"""
+    if isinstance(error, UploadTooLargeError):
+        return HTTPException(status_code=413, detail=str(error))
+    if isinstance(error, UploadOffsetError):
+        return HTTPException(
+            status_code=409,
+            detail=str(error),
+            headers={"Upload-Offset": str(error.expected)}
+        )
+    return HTTPException(status_code=404, detail="Upload session not found")
+
+
+def finish_upload(upload_id: str, background_tasks: BackgroundTasks) -> Dict:
+    """Complete an upload session and schedule PCM ingest for new audio (blocking)"""
+    completed = upload_store.complete(upload_id)
+    if not completed["duplicate"]:
+        background_tasks.add_task(ingest_audio, AUDIO_DIR / completed["filename"])
+    return completed
+
+
+def find_transcript(transcript_id: str) -> Optional[Path]:
+    """Saved file of a transcript, in whichever format it was written"""
+    for suffix in (".json", BINARY_SUFFIX):
+        path = TRANSCRIPTS_DIR / f"{transcript_id}_transcript{suffix}"
+        if path.exists():
+            return path
+    return None
+
+
+def write_json(path: Path, data: Dict):
+    """Write a JSON document (blocking)"""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+def busy_error(error: QueueFullError) -> HTTPException:
+    """429 response for a full work queue"""
+    return HTTPException(
+        status_code=429,
+        detail={"message": f"Server busy: {error}", "pending": error.pending},
+        headers={"Retry-After": "30"}
+    )
+
+
+def parse_model_specs(value: str) -> List[tuple]:
+    """Parse "tiny,small:cuda" into [('tiny', None), ('small', 'cuda')]"""
+    specs = []
+    for item in value.split(","):
+        item = item.strip()
+        if item:
+            model_size, _, device = item.partition(":")
+            specs.append((model_size, device or None))
+    return specs
+
+
+def get_error_corrector(use_ml: bool = False, warmup: bool = False) -> ErrorCorrector:
+    """
+    Get or initialize error corrector (lazy loading)
+
+    With warmup, a newly loaded corrector runs one dummy correction before
+    it is reported ready (state 'warming' meanwhile).
+    """
     global error_corrector
-    if error_corrector is None:
-        error_corrector = ErrorCorrector(use_ml=use_ml)
+    with error_corrector_lock:
+        if error_corrector is None:
+            correction_status.update(state="loading", use_ml=use_ml)
+            start_time = datetime.now()
+            try:
+                corrector = ErrorCorrector(use_ml=use_ml)
+            except Exception as e:
+                correction_status.update(state="failed", error=str(e))
+                raise
+            correction_status.update(
+                method="ml" if corrector.use_ml else "rules",
+                device=corrector.device,
+                load_time=round((datetime.now() - start_time).total_seconds(), 3),
+                memory_mb=round(corrector.memory_mb(), 1)
+            )
+            if warmup:
+                correction_status["state"] = WARMING
+                try:
+                    correction_status["warmup_time"] = corrector.warmup()
+                except Exception as e:
+                    # A failed warm-up only means the first request pays the setup cost
+                    print(f"Correction warm-up failed: {e}")
+            error_corrector = corrector
+            correction_status["state"] = READY
     return error_corrector
 
 
+def prewarm_correction(use_ml: bool):
+    """Load the error corrector and run one dummy correction (blocking)"""
+    try:
+        get_error_corrector(use_ml, warmup=True)
+    except Exception as e:
+        print(f"Correction pre-warm failed: {e}")
+
+
+def parse_correction_level(level: str) -> CorrectionLevel:
+    """Map a request level string to CorrectionLevel (default: standard)"""
+    level_map = {
+        'light': CorrectionLevel.LIGHT,
+        'standard': CorrectionLevel.STANDARD,
+        'aggressive': CorrectionLevel.AGGRESSIVE
+    }
+    return level_map.get(level, CorrectionLevel.STANDARD)
+
+
 def calculate_changes(original: str, corrected: str) -> Dict:
-    """Calculate statistics about changes made"""
-    import difflib
-
-    orig_words = original.split()
-    corr_words = corrected.split()
-
-    matcher = difflib.SequenceMatcher(None, orig_words, corr_words)
-    changes = {
-        'word_changes': 0,
-        'additions': 0,
-        'deletions': 0,
-        'similarity_ratio': matcher.ratio()
+    """Calculate statistics about changes made (word alignment, see correction.alignment)"""
+    return count_changes(original, corrected)
+
+
+def save_correction_file(request: CorrectionRequest) -> Dict:
+    """
+    Build and save a correction document (blocking)
+
+    The corrected text is aligned onto the transcript's word timestamps,
+    so the document carries corrected segments with start/end times.
+    """
+    correction_id = request.transcript_id
+
+    # Corrected segments with timestamps (none if the transcript is gone)
+    segments = []
+    transcript_path = find_transcript(request.transcript_id)
+    if transcript_path is not None:
+        transcript_segments = read_transcript(transcript_path).get("segments", [])
+        segments = align_segments(transcript_segments, request.corrected_text)
+
+    correction_data = {
+        "id": correction_id,
+        "transcript_id": request.transcript_id,
+        "timestamp": datetime.now().isoformat(),
+        "original": request.original_text,
+        "corrected": request.corrected_text,
+        "metadata": request.metadata,
+        "changes": calculate_changes(request.original_text, request.corrected_text),
+        "segments": segments
     }
 
-    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
-        if tag == 'replace':
-            changes['word_changes'] += max(i2 - i1, j2 - j1)
-        elif tag == 'delete':
-            changes['deletions'] += i2 - i1
-        elif tag == 'insert':
-            changes['additions'] += j2 - j1
+    correction_path = CORRECTIONS_DIR / f"{correction_id}_corrected.json"
+    write_json(correction_path, correction_data)
+    catalog.add_correction(correction_data, correction_path)
 
-    return changes
+    return correction_data
 
 
 # ============================================================================
 # API Endpoints
 # ============================================================================
 
+@app.on_event("startup")
+async def prewarm_models():
+    """
+    Load configured models in the background (PULOX_ASR_PREWARM,
+    PULOX_CORRECTION_PREWARM); /ready reports when they can serve
+    """
+    specs = parse_model_specs(ASR_PREWARM)
+    if specs:
+        threading.Thread(target=asr_registry.prewarm, args=(specs,), daemon=True).start()
+    if CORRECTION_PREWARM:
+        threading.Thread(
+            target=prewarm_correction, args=(CORRECTION_PREWARM == "ml",), daemon=True
+        ).start()
+
+
+@app.on_event("startup")
+async def start_catalog_sync():
+    """Pick up files added or changed outside the API (e.g. by the annotation tool)"""
+    threading.Thread(target=sync_catalog, daemon=True).start()
+
+
+@app.on_event("startup")
+async def start_job_workers():
+    """Resume interrupted jobs and start draining the job queue"""
+    job_queue.start()
+
+
+@app.on_event("shutdown")
+async def stop_job_workers():
+    """Let job workers finish their current job"""
+    await asyncio.to_thread(job_queue.stop, 5)
+
+
 @app.get("/")
 async def root():
     """Root endpoint - API info"""
@@ -183,9 +591,14 @@ async def root():
         "status": "running",
         "endpoints": {
             "health": "/health",
+            "ready": "/ready",
             "upload": "/upload",
+            "uploads": "/uploads",
             "transcribe": "/transcribe",
+            "search": "/search",
             "correct": "/correct",
+            "correct_transcript": "/correct/transcript",
+            "jobs": "/jobs",
             "annotations": "/annotations",
             "corrections": "/corrections"
         }
@@ -198,47 +611,173 @@ async def health_check():
     return {
         "status": "healthy",
         "timestamp": datetime.now().isoformat(),
-        "asr_model_loaded": asr_model is not None
+        "asr_model_loaded": any(s["state"] == READY for s in asr_registry.status()),
+        "asr_models": asr_registry.status(),
+        "queues": {
+            "inference": inference_executor.status(),
+            "correction": correction_executor.status()
+        }
     }
 
 
+@app.get("/ready")
+async def readiness_check():
+    """
+    Readiness endpoint: 200 once every pre-warmed model is loaded and
+    warmed up, 503 before that (or if one failed). A pre-warmed model
+    later evicted to make room for another stays ready (it reloads on
+    demand). Reports each model's state, load and warm-up time, and
+    memory footprint.
+    """
+    pending = [
+        f"{model_size}:{device or 'auto'}"
+        for model_size, device in parse_model_specs(ASR_PREWARM)
+        if not asr_registry.can_serve(model_size, device)
+    ]
+    if CORRECTION_PREWARM and correction_status["state"] != READY:
+        pending.append(f"correction:{CORRECTION_PREWARM}")
+
+    return JSONResponse(
+        status_code=503 if pending else 200,
+        content={
+            "ready": not pending,
+            "pending": pending,
+            "timestamp": datetime.now().isoformat(),
+            "asr_models": asr_registry.status(),
+            "correction": correction_status
+        }
+    )
+
+
 @app.post("/upload")
-async def upload_audio(file: UploadFile = File(...)):
+async def upload_audio(request: Request, background_tasks: BackgroundTasks):
     """
-    Upload audio file for transcription
+    Upload audio file for transcription (multipart form field "file")
 
     Accepts: .wav, .mp3, .m4a, .flac, .ogg
+    The request's Content-Length is checked before any of the body is
+    read, since multipart parsing spools the whole file first. The file
+    is then streamed to disk in chunks (never held in memory whole),
+    identical content already uploaded is reused, and new audio is decoded
+    once into the PCM store after the response is sent. For large files
+    on unreliable networks use the resumable /uploads endpoints instead.
     """
-    # Validate file type
-    allowed_extensions = {'.wav', '.mp3', '.m4a', '.flac', '.ogg', '.webm'}
-    file_ext = Path(file.filename).suffix.lower()
-
-    if file_ext not in allowed_extensions:
+    content_length = request.headers.get("content-length")
+    if content_length is None:
         raise HTTPException(
-            status_code=400,
-            detail=f"Invalid file type. Allowed: {', '.join(allowed_extensions)}"
+            status_code=411,
+            detail="Content-Length required (use /uploads to stream audio of unknown size)"
         )
+    try:
+        declared_bytes = int(content_length)
+    except ValueError:
+        declared_bytes = -1
+    if declared_bytes < 0:
+        raise HTTPException(status_code=400, detail=f"Invalid Content-Length: {content_length!r}")
+    if declared_bytes > MAX_UPLOAD_BYTES + MULTIPART_OVERHEAD_BYTES:
+        raise upload_error(UploadTooLargeError(MAX_UPLOAD_BYTES))
+
+    async with request.form() as form:
+        file = form.get("file")
+        if not isinstance(file, UploadFile):
+            raise HTTPException(status_code=400, detail="Missing 'file' form field")
+        validate_audio_extension(file.filename)
+
+        session = upload_store.create(file.filename)
+        upload_id = session["upload_id"]
+        offset = 0
 
-    # Generate unique filename
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"{timestamp}_{file.filename}"
-    file_path = AUDIO_DIR / filename
+        try:
+            while chunk := await file.read(UPLOAD_CHUNK_BYTES):
+                offset = await asyncio.to_thread(upload_store.append, upload_id, offset, chunk)
+            completed = await asyncio.to_thread(finish_upload, upload_id, background_tasks)
+        except (KeyError, UploadTooLargeError, UploadOffsetError) as e:
+            upload_store.abort(upload_id)
+            raise upload_error(e)
+        except Exception as e:
+            upload_store.abort(upload_id)
+            raise HTTPException(status_code=500, detail=f"Failed to save file: {str(e)}")
+
+    return {
+        "status": "success",
+        "filename": completed["filename"],
+        "path": str(AUDIO_DIR / completed["filename"]),
+        "size": completed["size"],
+        "sha256": completed["sha256"],
+        "duplicate": completed["duplicate"],
+        "timestamp": datetime.now().isoformat()
+    }
+
+
+@app.post("/uploads")
+async def create_upload(request: UploadSessionRequest):
+    """
+    Start a resumable upload
 
-    # Save file
+    Send the file with PUT /uploads/{upload_id}?offset=N (raw bytes, any
+    number of requests), then POST /uploads/{upload_id}/complete. After
+    a dropped connection, GET /uploads/{upload_id} returns the offset to
+    resume from.
+    """
+    validate_audio_extension(request.filename)
     try:
-        with open(file_path, "wb") as f:
-            content = await file.read()
-            f.write(content)
-
-        return {
-            "status": "success",
-            "filename": filename,
-            "path": str(file_path),
-            "size": len(content),
-            "timestamp": datetime.now().isoformat()
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to save file: {str(e)}")
+        return upload_store.create(request.filename, request.size)
+    except UploadTooLargeError as e:
+        raise upload_error(e)
+
+
+@app.get("/uploads/{upload_id}")
+async def get_upload(upload_id: str):
+    """Resumable upload status (offset = bytes received so far)"""
+    try:
+        return await asyncio.to_thread(upload_store.status, upload_id)
+    except KeyError as e:
+        raise upload_error(e)
+
+
+@app.put("/uploads/{upload_id}")
+async def append_upload(upload_id: str, offset: int, request: Request):
+    """
+    Append the request body to a resumable upload at offset
+
+    Returns 409 with the expected offset (also in the Upload-Offset
+    header) if offset does not match the bytes already received.
+    """
+    try:
+        async for chunk in request.stream():
+            if chunk:
+                offset = await asyncio.to_thread(upload_store.append, upload_id, offset, chunk)
+    except (KeyError, UploadTooLargeError, UploadOffsetError) as e:
+        raise upload_error(e)
+
+    return {"upload_id": upload_id, "offset": offset}
+
+
+@app.post("/uploads/{upload_id}/complete")
+async def complete_upload(upload_id: str, background_tasks: BackgroundTasks):
+    """Finish a resumable upload (same response as /upload)"""
+    try:
+        completed = await asyncio.to_thread(finish_upload, upload_id, background_tasks)
+    except (KeyError, UploadOffsetError) as e:
+        raise upload_error(e)
+
+    return {
+        "status": "success",
+        "filename": completed["filename"],
+        "path": str(AUDIO_DIR / completed["filename"]),
+        "size": completed["size"],
+        "sha256": completed["sha256"],
+        "duplicate": completed["duplicate"],
+        "timestamp": datetime.now().isoformat()
+    }
+
+
+@app.delete("/uploads/{upload_id}")
+async def abort_upload(upload_id: str):
+    """Discard a resumable upload"""
+    if not await asyncio.to_thread(upload_store.abort, upload_id):
+        raise upload_error(KeyError(upload_id))
+    return {"status": "deleted", "upload_id": upload_id}
 
 
 @app.post("/transcribe", response_model=TranscriptionResponse)
@@ -256,94 +795,149 @@ async def transcribe_audio(request: TranscriptionRequest):
         raise HTTPException(status_code=404, detail="Audio file not found")
 
     try:
-        # Get ASR model
-        asr = get_asr_model(request.model_size)
-
-        # Transcribe
-        result = asr.transcribe(
-            str(audio_path),
-            language=request.language
+        # Transcribe on the inference worker (keeps the event loop free)
+        result = await inference_executor.run(
+            transcribe_file,
+            audio_path,
+            request.language,
+            request.model_size
         )
 
-        # Generate transcript ID
-        transcript_id = Path(request.audio_filename).stem
-
-        # Convert segments to serializable format
-        segments = []
-        for seg in result.get("segments", []):
-            if hasattr(seg, '__dict__'):
-                # Handle object-based segments
-                segments.append({
-                    "start": seg.start,
-                    "end": seg.end,
-                    "text": seg.text,
-                    "language": getattr(seg, 'language', None),
-                    "words": getattr(seg, 'words', [])
-                })
-            else:
-                # Segments are already dicts (with word-level data)
-                segments.append(seg)
-
         # Save transcript
-        transcript_data = {
-            "id": transcript_id,
-            "audio_file": request.audio_filename,
-            "text": result["text"],
-            "language": result.get("language", "unknown"),
-            "duration": result.get("duration", 0),
-            "segments": segments,
-            "model": request.model_size,
-            "timestamp": datetime.now().isoformat()
-        }
-
-        transcript_path = TRANSCRIPTS_DIR / f"{transcript_id}_transcript.json"
-        with open(transcript_path, 'w', encoding='utf-8') as f:
-            json.dump(transcript_data, f, ensure_ascii=False, indent=2)
+        transcript_data = await asyncio.to_thread(
+            save_transcript, request.audio_filename, request.model_size, result
+        )
 
         return TranscriptionResponse(**transcript_data)
 
+    except QueueFullError as e:
+        raise busy_error(e)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Transcription failed: {str(e)}")
 
 
+@app.post("/jobs/transcribe")
+async def submit_transcription_job(request: TranscriptionRequest):
+    """
+    Queue a transcription and return its job immediately
+
+    Poll **GET /jobs/{job_id}** (or send {"action": "watch", "job_id": ...}
+    on /ws/transcribe) for state, percent complete and ETA. The result
+    holds the transcript_id once the job is done.
+    """
+    audio_path = AUDIO_DIR / request.audio_filename
+
+    if not audio_path.exists():
+        raise HTTPException(status_code=404, detail="Audio file not found")
+
+    job_id = await asyncio.to_thread(job_queue.submit, "transcribe", {
+        "audio_filename": request.audio_filename,
+        "language": request.language,
+        "model_size": request.model_size
+    })
+    return await asyncio.to_thread(job_queue.get, job_id)
+
+
+@app.get("/jobs")
+async def list_jobs(limit: int = 50, state: Optional[str] = None):
+    """List recent background jobs (optionally filtered by state)"""
+    jobs = await asyncio.to_thread(job_queue.list, limit, state)
+    return {"jobs": jobs, "total": len(jobs)}
+
+
+@app.get("/jobs/{job_id}")
+async def get_job(job_id: str):
+    """Get job state, percent complete and ETA"""
+    job = await asyncio.to_thread(job_queue.get, job_id)
+
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    return job
+
+
 @app.get("/transcripts")
-async def list_transcripts():
-    """List all available transcripts"""
-    transcripts = []
+async def list_transcripts(
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    offset: int = Query(0, ge=0),
+    sort: str = "timestamp",
+    order: str = "desc",
+    language: Optional[str] = None,
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+    has_correction: Optional[bool] = None,
+    annotator: Optional[str] = None
+):
+    """
+    List transcripts (newest first), one page at a time
 
-    for file_path in TRANSCRIPTS_DIR.glob("*_transcript.json"):
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                transcripts.append({
-                    "id": data.get("id"),
-                    "audio_file": data.get("audio_file"),
-                    "language": data.get("language"),
-                    "duration": data.get("duration"),
-                    "timestamp": data.get("timestamp"),
-                    "has_correction": (CORRECTIONS_DIR / f"{data.get('id')}_corrected.json").exists()
-                })
-        except Exception as e:
-            print(f"Error reading {file_path}: {e}")
-            continue
+    - **limit** / **offset**: Page size (max 1000) and start
+    - **sort**: timestamp, duration, audio_file or language; **order**: asc or desc
+    - **language**, **has_correction**, **annotator**: Filters
+    - **date_from** / **date_to**: ISO date or date-time range of creation
+    """
+    try:
+        transcripts, total = await asyncio.to_thread(
+            catalog.list_transcripts, limit, offset, sort, order,
+            language, date_from, date_to, has_correction, annotator
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return {"transcripts": transcripts, "total": total, "limit": limit, "offset": offset}
+
+
+@app.get("/search")
+async def search_transcripts(
+    q: str,
+    limit: int = Query(20, ge=1, le=MAX_PAGE_SIZE),
+    offset: int = Query(0, ge=0),
+    source: Optional[str] = None,
+    language: Optional[str] = None,
+    transcript_id: Optional[str] = None,
+    order: str = "relevance"
+):
+    """
+    Full-text search over transcript segments and corrections
 
-    # Sort by timestamp (newest first)
-    transcripts.sort(key=lambda x: x.get("timestamp", ""), reverse=True)
+    Each hit carries the segment's **start**/**end** (seconds) so the UI
+    can jump to that point in the audio.
 
-    return {"transcripts": transcripts, "total": len(transcripts)}
+    - **q**: Words (all must match), "quoted phrases" and prefix* terms
+    - **source**: 'transcript' or 'correction'
+    - **language** / **transcript_id**: Filters
+    - **order**: 'relevance' or 'recent'
+    """
+    try:
+        hits, has_more = await asyncio.to_thread(
+            catalog.search, q, limit, offset, source, language, transcript_id, order
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return {"query": q, "hits": hits, "has_more": has_more, "limit": limit, "offset": offset}
 
 
 @app.get("/transcripts/{transcript_id}")
-async def get_transcript(transcript_id: str):
-    """Get specific transcript by ID"""
-    transcript_path = TRANSCRIPTS_DIR / f"{transcript_id}_transcript.json"
+async def get_transcript(
+    transcript_id: str,
+    start: Optional[float] = None,
+    end: Optional[float] = None,
+    segments: bool = True
+):
+    """
+    Get specific transcript by ID
 
-    if not transcript_path.exists():
+    - **start** / **end**: Only segments overlapping this range (seconds)
+    - **segments**: false to return only the header (id, text, language, ...)
+    """
+    transcript_path = find_transcript(transcript_id)
+
+    if transcript_path is None:
         raise HTTPException(status_code=404, detail="Transcript not found")
 
     try:
-        with open(transcript_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return await asyncio.to_thread(read_transcript, transcript_path, start, end, segments)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to load transcript: {str(e)}")
 
@@ -357,33 +951,17 @@ async def save_correction(request: CorrectionRequest):
     - **original_text**: Original ASR text
     - **corrected_text**: Corrected text
     - **metadata**: Annotation metadata
-    """
-    correction_id = request.transcript_id
 
-    # Calculate changes
-    changes = calculate_changes(request.original_text, request.corrected_text)
-
-    # Create correction data
-    correction_data = {
-        "id": correction_id,
-        "transcript_id": request.transcript_id,
-        "timestamp": datetime.now().isoformat(),
-        "original": request.original_text,
-        "corrected": request.corrected_text,
-        "metadata": request.metadata,
-        "changes": changes
-    }
-
-    # Save correction
-    correction_path = CORRECTIONS_DIR / f"{correction_id}_corrected.json"
-    with open(correction_path, 'w', encoding='utf-8') as f:
-        json.dump(correction_data, f, ensure_ascii=False, indent=2)
+    The saved correction also holds the corrected text aligned onto the
+    transcript's word timestamps ("segments").
+    """
+    correction_data = await asyncio.to_thread(save_correction_file, request)
 
     return CorrectionResponse(
-        id=correction_id,
+        id=correction_data["id"],
         transcript_id=request.transcript_id,
         corrected_text=request.corrected_text,
-        changes=changes,
+        changes=correction_data["changes"],
         timestamp=correction_data["timestamp"]
     )
 
@@ -404,28 +982,33 @@ async def get_correction(transcript_id: str):
 
 
 @app.get("/corrections")
-async def list_corrections():
-    """List all corrections"""
-    corrections = []
-
-    for file_path in CORRECTIONS_DIR.glob("*_corrected.json"):
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                corrections.append({
-                    "id": data.get("id"),
-                    "transcript_id": data.get("transcript_id"),
-                    "timestamp": data.get("timestamp"),
-                    "annotator": data.get("metadata", {}).get("annotator"),
-                    "changes": data.get("changes", {}).get("word_changes", 0)
-                })
-        except Exception as e:
-            print(f"Error reading {file_path}: {e}")
-            continue
+async def list_corrections(
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    offset: int = Query(0, ge=0),
+    sort: str = "timestamp",
+    order: str = "desc",
+    annotator: Optional[str] = None,
+    transcript_id: Optional[str] = None,
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None
+):
+    """
+    List corrections (newest first), one page at a time
 
-    corrections.sort(key=lambda x: x.get("timestamp", ""), reverse=True)
+    - **limit** / **offset**: Page size (max 1000) and start
+    - **sort**: timestamp, changes or annotator; **order**: asc or desc
+    - **annotator**, **transcript_id**: Filters
+    - **date_from** / **date_to**: ISO date or date-time range of saving
+    """
+    try:
+        corrections, total = await asyncio.to_thread(
+            catalog.list_corrections, limit, offset, sort, order,
+            annotator, transcript_id, date_from, date_to
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
-    return {"corrections": corrections, "total": len(corrections)}
+    return {"corrections": corrections, "total": total, "limit": limit, "offset": offset}
 
 
 @app.post("/correct", response_model=AutoCorrectionResponse)
@@ -439,16 +1022,11 @@ async def auto_correct_text(request: AutoCorrectionRequest):
     - **use_ml**: Enable ML-based correction (requires MT5 model download)
     """
     try:
-        # Get error corrector
-        corrector = get_error_corrector(use_ml=request.use_ml)
+        # Get error corrector (may load the ML model, so off the event loop)
+        corrector = await asyncio.to_thread(get_error_corrector, request.use_ml)
 
         # Parse correction level
-        level_map = {
-            'light': CorrectionLevel.LIGHT,
-            'standard': CorrectionLevel.STANDARD,
-            'aggressive': CorrectionLevel.AGGRESSIVE
-        }
-        level = level_map.get(request.level, CorrectionLevel.STANDARD)
+        level = parse_correction_level(request.level)
 
         # Create config
         config = CorrectionConfig(
@@ -458,8 +1036,8 @@ async def auto_correct_text(request: AutoCorrectionRequest):
             language_hint=request.language
         )
 
-        # Perform correction
-        result = corrector.correct(request.text, config)
+        # Perform correction on a correction worker
+        result = await correction_executor.run(corrector.correct, request.text, config)
 
         # Convert to response format
         return AutoCorrectionResponse(
@@ -482,19 +1060,137 @@ async def auto_correct_text(request: AutoCorrectionRequest):
             summary=result.get_changes_summary()
         )
 
+    except QueueFullError as e:
+        raise busy_error(e)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Correction failed: {str(e)}")
+
+
+@app.post("/correct/transcript")
+async def auto_correct_transcript(request: TranscriptCorrectionRequest):
+    """
+    Correct a saved transcript segment by segment
+
+    Streams one JSON object per line (NDJSON) as each segment is corrected,
+    including the segment's start/end timestamps, so the UI can render
+    corrections progressively.
+
+    - **transcript_id**: ID of transcript to correct
+    - **level**: Correction level ('light', 'standard', 'aggressive')
+    - **use_ml**: Enable ML-based correction (requires MT5 model download)
+    """
+    transcript_path = find_transcript(request.transcript_id)
+
+    if transcript_path is None:
+        raise HTTPException(status_code=404, detail="Transcript not found")
+
+    try:
+        segments = (await asyncio.to_thread(read_transcript, transcript_path)).get("segments", [])
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to load transcript: {str(e)}")
+
+    corrector = await asyncio.to_thread(get_error_corrector, request.use_ml)
+    config = CorrectionConfig(
+        level=parse_correction_level(request.level),
+        use_rules=True,
+        use_ml=request.use_ml
+    )
+
+    def correct_batch(batch: List[Dict]) -> List[Dict]:
+        return [result.to_dict() for result in corrector.correct_transcript(batch, config)]
+
+    batches = [
+        segments[start:start + CORRECTION_STREAM_SEGMENTS]
+        for start in range(0, len(segments), CORRECTION_STREAM_SEGMENTS)
+    ]
+
+    # Batches run on the correction workers; the first runs before the
+    # response starts, so a full queue is still answered with 429
+    try:
+        first_results = await correction_executor.run(correct_batch, batches[0]) if batches else []
+    except QueueFullError as e:
+        raise busy_error(e)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Correction failed: {str(e)}")
 
+    async def stream_results():
+        index = 0
+        for batch_index, batch in enumerate(batches):
+            if batch_index == 0:
+                results = first_results
+            else:
+                # Once streaming, later batches wait for a worker instead of failing
+                results = await asyncio.to_thread(correction_executor.call, correct_batch, batch)
+            for line in results:
+                line["segment_index"] = index
+                index += 1
+                yield json.dumps(line, ensure_ascii=False) + "\n"
+
+    return StreamingResponse(stream_results(), media_type="application/x-ndjson")
+
 
 @app.get("/audio/{filename}")
-async def get_audio_file(filename: str):
-    """Serve audio file for playback"""
+async def get_audio_file(filename: str, request: Request, preview: bool = False):
+    """
+    Serve audio file for playback
+
+    Supports Range requests (206 Partial Content) so the player can seek
+    without downloading the whole file, and ETag/Last-Modified validators
+    so unchanged files are not re-sent (304). With ?preview=true a small
+    mono MP3 rendition is served instead, encoded on first request and
+    cached under raw_audio/previews.
+    """
     audio_path = AUDIO_DIR / filename
 
-    if not audio_path.exists():
+    if not audio_path.is_file():
         raise HTTPException(status_code=404, detail="Audio file not found")
 
-    return FileResponse(audio_path)
+    if preview:
+        try:
+            audio_path = Path(await asyncio.to_thread(
+                render_preview, str(audio_path), str(PREVIEW_DIR / f"{filename}.mp3")
+            ))
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Preview rendering failed: {str(e)}")
+
+    stat = audio_path.stat()
+    etag, last_modified = file_validators(stat)
+    headers = {
+        "Accept-Ranges": "bytes",
+        "ETag": etag,
+        "Last-Modified": last_modified,
+        "Cache-Control": "no-cache"
+    }
+
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+
+    # A stale If-Range means the client's partial copy is outdated: send everything
+    range_header = request.headers.get("range")
+    if_range = request.headers.get("if-range")
+    if if_range and if_range != etag and if_range != last_modified:
+        range_header = None
+
+    try:
+        byte_range = parse_range_header(range_header, stat.st_size)
+    except RangeNotSatisfiable:
+        return Response(status_code=416, headers={**headers, "Content-Range": f"bytes */{stat.st_size}"})
+
+    if byte_range is None:
+        return FileResponse(audio_path, headers=headers)
+
+    start, end = byte_range
+    media_type = mimetypes.guess_type(audio_path.name)[0] or "application/octet-stream"
+    return StreamingResponse(
+        iter_file_range(str(audio_path), start, end),
+        status_code=206,
+        media_type=media_type,
+        headers={
+            **headers,
+            "Content-Range": f"bytes {start}-{end}/{stat.st_size}",
+            "Content-Length": str(end - start + 1)
+        }
+    )
 
 
 @app.websocket("/ws/transcribe")
@@ -504,6 +1200,11 @@ async def websocket_transcribe(websocket: WebSocket):
 
     Accepts JSON messages with format:
     {"action": "transcribe", "filename": "audio.wav", "language": "tl"}
+    {"action": "cancel"}  (stops the running transcription)
+    {"action": "watch", "job_id": "..."}  (progress of a background job)
+
+    While transcribing, each decoded segment is sent as
+    {"status": "segment", "segment": {...}} along with "progress" updates.
     """
     await websocket.accept()
 
@@ -512,7 +1213,39 @@ async def websocket_transcribe(websocket: WebSocket):
             # Receive transcription request
             data = await websocket.receive_json()
 
-            if data.get("action") == "transcribe":
+            if data.get("action") == "watch":
+                # Stream a background job's progress until it finishes
+                job_id = data.get("job_id")
+                last_sent = None
+
+                while True:
+                    job = await asyncio.to_thread(job_queue.get, job_id)
+                    if job is None:
+                        await websocket.send_json({
+                            "status": "error",
+                            "message": "Job not found"
+                        })
+                        break
+
+                    update = {
+                        "status": "job",
+                        "job_id": job_id,
+                        "state": job["state"],
+                        "position": job["position"],
+                        "percent": job["percent"],
+                        "eta_seconds": job["eta_seconds"],
+                        "result": job["result"],
+                        "error": job["error"]
+                    }
+                    if update != last_sent:
+                        await websocket.send_json(update)
+                        last_sent = update
+
+                    if job["state"] in (DONE, FAILED):
+                        break
+                    await asyncio.sleep(JOB_WATCH_INTERVAL)
+
+            elif data.get("action") == "transcribe":
                 filename = data.get("filename")
                 language = data.get("language")
                 model_size = data.get("model_size", "base")
@@ -527,20 +1260,88 @@ async def websocket_transcribe(websocket: WebSocket):
                     continue
 
                 # Send progress updates
-                await websocket.send_json({
-                    "status": "loading",
-                    "message": "Loading ASR model..."
-                })
-
-                asr = get_asr_model(model_size)
+                position = inference_executor.queue_position()
+                if position:
+                    await websocket.send_json({
+                        "status": "queued",
+                        "message": f"Waiting for a free worker (position {position})...",
+                        "position": position
+                    })
 
                 await websocket.send_json({
                     "status": "transcribing",
-                    "message": "Transcribing audio..."
+                    "message": "Loading ASR model and transcribing audio..."
                 })
 
-                # Transcribe (in future, can add progress callbacks)
-                result = asr.transcribe(str(audio_path), language=language)
+                # Worker-thread callbacks hand updates to the event loop
+                loop = asyncio.get_running_loop()
+                updates: asyncio.Queue = asyncio.Queue()
+                cancel_event = threading.Event()
+
+                def on_segment(segment: Dict):
+                    if cancel_event.is_set():
+                        raise TranscriptionCancelled()
+                    loop.call_soon_threadsafe(
+                        updates.put_nowait, {"status": "segment", "segment": segment}
+                    )
+
+                def on_progress(processed: float, total: float):
+                    if cancel_event.is_set():
+                        raise TranscriptionCancelled()
+                    loop.call_soon_threadsafe(updates.put_nowait, {
+                        "status": "progress",
+                        "processed": round(processed, 2),
+                        "total": round(total, 2),
+                        "percent": round(processed / total * 100, 1) if total else None
+                    })
+
+                # Transcribe on the inference worker, forwarding segments as they
+                # are decoded and listening for a cancel request meanwhile
+                transcription = asyncio.ensure_future(inference_executor.run(
+                    transcribe_file, audio_path, language, model_size, on_progress, on_segment
+                ))
+                receive = asyncio.ensure_future(websocket.receive_json())
+
+                try:
+                    while not transcription.done():
+                        next_update = asyncio.ensure_future(updates.get())
+                        done, _ = await asyncio.wait(
+                            {transcription, next_update, receive},
+                            return_when=asyncio.FIRST_COMPLETED
+                        )
+
+                        if next_update in done:
+                            await websocket.send_json(next_update.result())
+                        else:
+                            next_update.cancel()
+
+                        if receive in done:
+                            if receive.result().get("action") == "cancel":
+                                cancel_event.set()
+                            receive = asyncio.ensure_future(websocket.receive_json())
+                finally:
+                    # Stop the worker on disconnect too
+                    cancel_event.set()
+                    receive.cancel()
+
+                while not updates.empty():
+                    await websocket.send_json(updates.get_nowait())
+
+                try:
+                    result = transcription.result()
+                except QueueFullError as e:
+                    await websocket.send_json({
+                        "status": "busy",
+                        "message": f"Server busy: {e}",
+                        "pending": e.pending
+                    })
+                    continue
+                except TranscriptionCancelled:
+                    await websocket.send_json({
+                        "status": "cancelled",
+                        "message": "Transcription cancelled"
+                    })
+                    continue
 
                 # Send completion
                 await websocket.send_json({
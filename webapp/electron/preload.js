@@ -64,9 +64,10 @@ contextBridge.exposeInMainWorld('puloxApi', {
     return response.json();
   },
 
-  // Get transcripts list
-  getTranscripts: async function() {
-    const response = await fetch(`${apiBaseUrl}/transcripts`);
+  // Get one page of the transcripts list (newest first)
+  getTranscripts: async function(offset = 0, limit = 100) {
+    const params = new URLSearchParams({ offset: offset, limit: limit });
+    const response = await fetch(`${apiBaseUrl}/transcripts?${params}`);
     return response.json();
   },
 
@@ -98,9 +99,10 @@ contextBridge.exposeInMainWorld('puloxApi', {
     return response.json();
   },
 
-  // Get corrections list
-  getCorrections: async function() {
-    const response = await fetch(`${apiBaseUrl}/corrections`);
+  // Get one page of the corrections list (newest first)
+  getCorrections: async function(offset = 0, limit = 100) {
+    const params = new URLSearchParams({ offset: offset, limit: limit });
+    const response = await fetch(`${apiBaseUrl}/corrections?${params}`);
     return response.json();
   },
 
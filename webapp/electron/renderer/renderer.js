@@ -346,6 +346,7 @@ async function loadTranscripts() {
       const card = createTranscriptCard(transcript);
       listContainer.appendChild(card);
     });
+    showLoadMoreTranscripts(listContainer, result.total);
 
   } catch (error) {
     console.error('Failed to load transcripts:', error);
@@ -353,6 +354,34 @@ async function loadTranscripts() {
   }
 }
 
+// Add a button fetching the next page when older transcripts remain
+function showLoadMoreTranscripts(listContainer, total) {
+  if (!(total > transcripts.length)) {
+    return;
+  }
+
+  const button = document.createElement('button');
+  button.className = 'btn btn-secondary load-more-btn';
+  button.textContent = `Load more (${transcripts.length} of ${total})`;
+  button.addEventListener('click', async () => {
+    button.disabled = true;
+    try {
+      const result = await window.puloxApi.getTranscripts(transcripts.length);
+      const page = result.transcripts || [];
+      button.remove();
+      page.forEach(transcript => {
+        transcripts.push(transcript);
+        listContainer.appendChild(createTranscriptCard(transcript));
+      });
+      showLoadMoreTranscripts(listContainer, result.total);
+    } catch (error) {
+      console.error('Failed to load more transcripts:', error);
+      button.disabled = false;
+    }
+  });
+  listContainer.appendChild(button);
+}
+
 function createTranscriptCard(transcript) {
   const card = document.createElement('div');
   card.className = 'transcript-card';